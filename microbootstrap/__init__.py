@@ -1,26 +1,69 @@
-from microbootstrap.instruments.cors_instrument import CorsConfig
-from microbootstrap.instruments.health_checks_instrument import HealthChecksConfig
-from microbootstrap.instruments.logging_instrument import LoggingConfig
-from microbootstrap.instruments.opentelemetry_instrument import (
-    FastStreamOpentelemetryConfig,
-    FastStreamTelemetryMiddlewareProtocol,
-    OpentelemetryConfig,
-)
-from microbootstrap.instruments.prometheus_instrument import (
-    FastApiPrometheusConfig,
-    FastStreamPrometheusConfig,
-    FastStreamPrometheusMiddlewareProtocol,
-    LitestarPrometheusConfig,
-)
-from microbootstrap.instruments.pyroscope_instrument import PyroscopeConfig
-from microbootstrap.instruments.sentry_instrument import SentryConfig
-from microbootstrap.instruments.swagger_instrument import SwaggerConfig
-from microbootstrap.settings import (
-    FastApiSettings,
-    FastStreamSettings,
-    InstrumentsSetupperSettings,
-    LitestarSettings,
-)
+from __future__ import annotations
+import importlib
+import typing
+
+
+if typing.TYPE_CHECKING:
+    from microbootstrap.instruments.cors_instrument import CorsConfig
+    from microbootstrap.instruments.health_checks_instrument import HealthChecksConfig
+    from microbootstrap.instruments.logging_instrument import LoggingConfig
+    from microbootstrap.instruments.opentelemetry_instrument import (
+        FastStreamOpentelemetryConfig,
+        FastStreamTelemetryMiddlewareProtocol,
+        OpentelemetryConfig,
+    )
+    from microbootstrap.instruments.prometheus_instrument import (
+        FastApiPrometheusConfig,
+        FastStreamPrometheusConfig,
+        FastStreamPrometheusMiddlewareProtocol,
+        LitestarPrometheusConfig,
+    )
+    from microbootstrap.instruments.pyroscope_instrument import PyroscopeConfig
+    from microbootstrap.instruments.sentry_instrument import SentryConfig
+    from microbootstrap.instruments.swagger_instrument import SwaggerConfig
+    from microbootstrap.settings import (
+        FastApiSettings,
+        FastStreamSettings,
+        InstrumentsSetupperSettings,
+        LitestarSettings,
+    )
+
+
+# Public names are resolved on first access, so `import microbootstrap` stays cheap
+# and instruments' dependencies are imported only by services that actually use them.
+_LAZY_IMPORTS: typing.Final = {
+    "CorsConfig": "microbootstrap.instruments.cors_instrument",
+    "FastApiPrometheusConfig": "microbootstrap.instruments.prometheus_instrument",
+    "FastApiSettings": "microbootstrap.settings",
+    "FastStreamOpentelemetryConfig": "microbootstrap.instruments.opentelemetry_instrument",
+    "FastStreamPrometheusConfig": "microbootstrap.instruments.prometheus_instrument",
+    "FastStreamPrometheusMiddlewareProtocol": "microbootstrap.instruments.prometheus_instrument",
+    "FastStreamSettings": "microbootstrap.settings",
+    "FastStreamTelemetryMiddlewareProtocol": "microbootstrap.instruments.opentelemetry_instrument",
+    "HealthChecksConfig": "microbootstrap.instruments.health_checks_instrument",
+    "InstrumentsSetupperSettings": "microbootstrap.settings",
+    "LitestarPrometheusConfig": "microbootstrap.instruments.prometheus_instrument",
+    "LitestarSettings": "microbootstrap.settings",
+    "LoggingConfig": "microbootstrap.instruments.logging_instrument",
+    "OpentelemetryConfig": "microbootstrap.instruments.opentelemetry_instrument",
+    "PyroscopeConfig": "microbootstrap.instruments.pyroscope_instrument",
+    "SentryConfig": "microbootstrap.instruments.sentry_instrument",
+    "SwaggerConfig": "microbootstrap.instruments.swagger_instrument",
+}
+
+
+def __getattr__(name: str) -> typing.Any:  # noqa: ANN401
+    module_path: typing.Final = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    imported_value: typing.Final = getattr(importlib.import_module(module_path), name)
+    globals()[name] = imported_value
+    return imported_value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
 
 __all__ = (
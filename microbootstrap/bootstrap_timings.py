@@ -0,0 +1,162 @@
+from __future__ import annotations
+import contextlib
+import contextvars
+import dataclasses
+import functools
+import time
+import typing
+
+import orjson
+from opentelemetry import context as context_api
+from opentelemetry import trace
+
+
+if typing.TYPE_CHECKING:
+    import prometheus_client
+
+
+BOOTSTRAP_PHASE: typing.Final = "bootstrap"
+BOOTSTRAP_BEFORE_PHASE: typing.Final = "bootstrap_before"
+APPLICATION_CONSTRUCTION_PHASE: typing.Final = "construction"
+BOOTSTRAP_AFTER_PHASE: typing.Final = "bootstrap_after"
+TEARDOWN_PHASE: typing.Final = "teardown"
+APPLICATION_ITEM_NAME: typing.Final = "Application"
+BOOTSTRAP_DURATION_METRIC_NAME: typing.Final = "microbootstrap_bootstrap_duration_seconds"
+BOOTSTRAP_ROOT_SPAN_NAME: typing.Final = "bootstrap"
+
+
+@functools.cache
+def get_bootstrap_duration_gauge() -> prometheus_client.Gauge:
+    """Create and register gauge once per process, it is shared by all bootstraps."""
+    import prometheus_client  # noqa: PLC0415
+
+    return prometheus_client.Gauge(
+        BOOTSTRAP_DURATION_METRIC_NAME,
+        "Duration of application bootstrap phases",
+        labelnames=("item", "phase"),
+    )
+
+
+@dataclasses.dataclass(eq=False)
+class BootstrapSpan:
+    name: str
+    start_time: int
+    parent: BootstrapSpan | None = None
+    end_time: int | None = None
+    attributes: dict[str, str] = dataclasses.field(default_factory=dict)
+
+
+CURRENT_BOOTSTRAP_STEP: typing.Final[contextvars.ContextVar[tuple[BootstrapTimings, BootstrapSpan] | None]] = (
+    contextvars.ContextVar("microbootstrap_current_bootstrap_step", default=None)
+)
+
+
+@contextlib.contextmanager
+def trace_bootstrap_step(span_name: str) -> typing.Iterator[None]:
+    """Trace a step inside of currently measured bootstrap phase, does nothing outside of bootstrap."""
+    current_step: typing.Final = CURRENT_BOOTSTRAP_STEP.get()
+    if current_step is None:
+        yield
+        return
+
+    with current_step[0].trace_step(span_name):
+        yield
+
+
+@dataclasses.dataclass
+class BootstrapTimings:
+    """Durations (in nanoseconds) of bootstrap phases for every instrument and the application itself.
+
+    Every measured phase is also buffered as a span, because tracer provider doesn't exist yet when bootstrap starts.
+    """
+
+    durations: dict[str, dict[str, int]] = dataclasses.field(default_factory=dict)
+    spans: list[BootstrapSpan] = dataclasses.field(default_factory=list)
+
+    @contextlib.contextmanager
+    def trace_step(self, span_name: str, attributes: dict[str, str] | None = None) -> typing.Iterator[None]:
+        current_step: typing.Final = CURRENT_BOOTSTRAP_STEP.get()
+        bootstrap_span: typing.Final = BootstrapSpan(
+            name=span_name,
+            start_time=time.time_ns(),
+            parent=current_step[1] if current_step and current_step[0] is self else None,
+            attributes=attributes or {},
+        )
+        context_token: typing.Final = CURRENT_BOOTSTRAP_STEP.set((self, bootstrap_span))
+        try:
+            yield
+        finally:
+            CURRENT_BOOTSTRAP_STEP.reset(context_token)
+            bootstrap_span.end_time = time.time_ns()
+            self.spans.append(bootstrap_span)
+
+    @contextlib.contextmanager
+    def measure(self, item_name: str, phase: str) -> typing.Iterator[None]:
+        start_time: typing.Final = time.perf_counter_ns()
+        try:
+            with self.trace_step(
+                f"{item_name} {phase}",
+                attributes={"microbootstrap.item": item_name, "microbootstrap.phase": phase},
+            ):
+                yield
+        finally:
+            item_durations = self.durations.setdefault(item_name, {})
+            item_durations[phase] = item_durations.get(phase, 0) + time.perf_counter_ns() - start_time
+
+    def export_trace(self) -> None:
+        """Export buffered spans as a trace, if OpenTelemetry tracer provider is installed."""
+        tracer_provider: typing.Final = trace.get_tracer_provider()
+        if isinstance(tracer_provider, trace.ProxyTracerProvider):
+            return
+
+        tracer: typing.Final = tracer_provider.get_tracer("microbootstrap")
+        exported_spans: typing.Final[dict[BootstrapSpan, trace.Span | None]] = dict.fromkeys(self.spans)
+        for bootstrap_span in sorted(self.spans, key=lambda one_span: one_span.start_time):
+            self._export_span(tracer, bootstrap_span, exported_spans)
+        self.spans.clear()
+
+    def _export_span(
+        self,
+        tracer: trace.Tracer,
+        bootstrap_span: BootstrapSpan,
+        exported_spans: dict[BootstrapSpan, trace.Span | None],
+    ) -> trace.Span:
+        # parent is exported first even if it has the same start time, e.g. with coarse clock
+        exported_span = exported_spans[bootstrap_span]
+        if exported_span is not None:
+            return exported_span
+        parent_span: typing.Final = (
+            self._export_span(tracer, bootstrap_span.parent, exported_spans)
+            if bootstrap_span.parent in exported_spans
+            else None
+        )
+        exported_span = tracer.start_span(
+            bootstrap_span.name,
+            context=trace.set_span_in_context(parent_span) if parent_span else context_api.Context(),
+            attributes=bootstrap_span.attributes,
+            start_time=bootstrap_span.start_time,
+        )
+        exported_span.end(end_time=bootstrap_span.end_time)
+        exported_spans[bootstrap_span] = exported_span
+        return exported_span
+
+    def get_total_duration(self, item_name: str) -> int:
+        return sum(self.durations.get(item_name, {}).values())
+
+    def to_json(self) -> str:
+        return orjson.dumps(
+            {
+                "unit": "ms",
+                "items": {
+                    item_name: {phase: duration / 1_000_000 for phase, duration in item_durations.items()}
+                    for item_name, item_durations in self.durations.items()
+                },
+            },
+        ).decode()
+
+    def publish_metrics(self) -> None:
+        """Expose durations as a Prometheus gauge, bootstrappers call it only if Prometheus instrument is ready."""
+        duration_gauge: typing.Final = get_bootstrap_duration_gauge()
+        for item_name, item_durations in self.durations.items():
+            for phase, duration in item_durations.items():
+                duration_gauge.labels(item=item_name, phase=phase).set(duration / 1_000_000_000)
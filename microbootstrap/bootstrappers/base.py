@@ -2,15 +2,33 @@ from __future__ import annotations
 import abc
 import typing
 
-from microbootstrap.console_writer import ConsoleWriter
-from microbootstrap.helpers import dataclass_to_dict_no_defaults, merge_dataclasses_configs, merge_dict_configs
+from microbootstrap.bootstrap_timings import (
+    APPLICATION_CONSTRUCTION_PHASE,
+    APPLICATION_ITEM_NAME,
+    BOOTSTRAP_AFTER_PHASE,
+    BOOTSTRAP_BEFORE_PHASE,
+    BOOTSTRAP_ROOT_SPAN_NAME,
+    TEARDOWN_PHASE,
+    BootstrapTimings,
+)
+from microbootstrap.console_writer import build_console_writer
+from microbootstrap.helpers import (
+    dataclass_to_dict_no_defaults,
+    merge_dataclasses_configs,
+    merge_dict_configs,
+    register_after_fork,
+)
 from microbootstrap.instruments.instrument_box import InstrumentBox
+from microbootstrap.instruments.logging_instrument import LoggingInstrument
+from microbootstrap.instruments.prometheus_instrument import PrometheusInstrument
+from microbootstrap.log_writers import publish_log_sink_metrics
 from microbootstrap.settings import SettingsT
 
 
 if typing.TYPE_CHECKING:
     import typing_extensions
 
+    from microbootstrap.console_writer import ConsoleWriterProtocol
     from microbootstrap.instruments.base import Instrument, InstrumentConfigT
 
 
@@ -25,12 +43,14 @@ DataclassT = typing.TypeVar("DataclassT", bound=DataclassInstance)
 class ApplicationBootstrapper(abc.ABC, typing.Generic[SettingsT, ApplicationT, DataclassT]):
     application_type: type[ApplicationT]
     application_config: DataclassT
-    console_writer: ConsoleWriter
+    console_writer: ConsoleWriterProtocol
     instrument_box: InstrumentBox
+    bootstrap_timings: BootstrapTimings
 
     def __init__(self, settings: SettingsT) -> None:
         self.settings = settings
-        self.console_writer = ConsoleWriter(writer_enabled=settings.service_debug)
+        self.bootstrap_timings = BootstrapTimings()
+        self.console_writer = build_console_writer(settings, self.bootstrap_timings)
 
         if not hasattr(self, "instrument_box"):
             self.instrument_box = InstrumentBox()
@@ -70,31 +90,47 @@ class ApplicationBootstrapper(abc.ABC, typing.Generic[SettingsT, ApplicationT, D
         return cls.instrument_box.extend_instruments
 
     def bootstrap(self) -> ApplicationT:
-        resulting_application_config: dict[str, typing.Any] = {}
-        for instrument in self.instrument_box.instruments:
-            if instrument.is_ready():
-                instrument.bootstrap()
+        with self.bootstrap_timings.trace_step(BOOTSTRAP_ROOT_SPAN_NAME):
+            resulting_application_config: dict[str, typing.Any] = {}
+            ready_instruments: typing.Final = self.instrument_box.bootstrap_instruments(
+                self.settings.service_bootstrap_workers,
+                self.bootstrap_timings,
+            )
+            for instrument in self.instrument_box.instruments:
+                instrument.write_status(self.console_writer)
+            for instrument in ready_instruments:
+                with self.bootstrap_timings.measure(instrument.instrument_name, BOOTSTRAP_BEFORE_PHASE):
+                    instrument_application_config = instrument.bootstrap_before()
                 resulting_application_config = merge_dict_configs(
                     resulting_application_config,
-                    instrument.bootstrap_before(),
+                    instrument_application_config,
                 )
-            instrument.write_status(self.console_writer)
-
-        resulting_application_config = merge_dict_configs(
-            resulting_application_config,
-            dataclass_to_dict_no_defaults(self.application_config),
-        )
-        application = self.application_type(
-            **merge_dict_configs(resulting_application_config, self.bootstrap_before()),
-        )
 
-        self.bootstrap_before_instruments_after_app_created(application)
-
-        for instrument in self.instrument_box.instruments:
-            if instrument.is_ready():
-                application = instrument.bootstrap_after(application)
+            resulting_application_config = merge_dict_configs(
+                resulting_application_config,
+                dataclass_to_dict_no_defaults(self.application_config),
+            )
+            with self.bootstrap_timings.measure(APPLICATION_ITEM_NAME, APPLICATION_CONSTRUCTION_PHASE):
+                application = self.application_type(
+                    **merge_dict_configs(resulting_application_config, self.bootstrap_before()),
+                )
 
-        return self.bootstrap_after(application)
+            self.bootstrap_before_instruments_after_app_created(application)
+
+            for instrument in ready_instruments:
+                with self.bootstrap_timings.measure(instrument.instrument_name, BOOTSTRAP_AFTER_PHASE):
+                    application = instrument.bootstrap_after(application)
+
+            application = self.bootstrap_after(application)
+        if any(isinstance(instrument, PrometheusInstrument) for instrument in ready_instruments):
+            self.bootstrap_timings.publish_metrics()
+            for instrument in ready_instruments:
+                if isinstance(instrument, LoggingInstrument) and instrument.log_sink:
+                    publish_log_sink_metrics(instrument.log_sink)
+        self.bootstrap_timings.export_trace()
+        self.console_writer.write_bootstrap_summary()
+        register_after_fork(self.after_fork)
+        return application
 
     def bootstrap_before(self) -> dict[str, typing.Any]:
         """Add some framework-related parameters to final bootstrap result before application creation."""
@@ -108,7 +144,13 @@ class ApplicationBootstrapper(abc.ABC, typing.Generic[SettingsT, ApplicationT, D
         """Add some framework-related parameters to final bootstrap result after application creation."""
         return application
 
+    def after_fork(self) -> None:
+        for instrument in self.instrument_box.instruments:
+            if instrument.is_ready():
+                instrument.after_fork()
+
     def teardown(self) -> None:
         for instrument in self.instrument_box.instruments:
             if instrument.is_ready():
-                instrument.teardown()
+                with self.bootstrap_timings.measure(instrument.instrument_name, TEARDOWN_PHASE):
+                    instrument.teardown()
@@ -3,9 +3,6 @@ import typing
 
 import fastapi
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi_offline_docs import enable_offline_docs
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from prometheus_fastapi_instrumentator import Instrumentator, metrics
 
 from microbootstrap.bootstrappers.base import ApplicationBootstrapper
 from microbootstrap.config.fastapi import FastApiConfig
@@ -66,6 +63,8 @@ class FastApiSwaggerInstrument(SwaggerInstrument):
 
     def bootstrap_after(self, application: ApplicationT) -> ApplicationT:
         if self.instrument_config.swagger_offline_docs:
+            from fastapi_offline_docs import enable_offline_docs  # noqa: PLC0415
+
             enable_offline_docs(application, static_files_handler=self.instrument_config.service_static_path)
         return application
 
@@ -92,6 +91,8 @@ FastApiBootstrapper.use_instrument()(PyroscopeInstrument)
 @FastApiBootstrapper.use_instrument()
 class FastApiOpentelemetryInstrument(OpentelemetryInstrument):
     def bootstrap_after(self, application: ApplicationT) -> ApplicationT:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor  # noqa: PLC0415
+
         FastAPIInstrumentor.instrument_app(
             application,
             tracer_provider=self.tracer_provider,
@@ -113,6 +114,8 @@ class FastApiLoggingInstrument(LoggingInstrument):
 @FastApiBootstrapper.use_instrument()
 class FastApiPrometheusInstrument(PrometheusInstrument[FastApiPrometheusConfig]):
     def bootstrap_after(self, application: ApplicationT) -> ApplicationT:
+        from prometheus_fastapi_instrumentator import Instrumentator, metrics  # noqa: PLC0415
+
         Instrumentator(**self.instrument_config.prometheus_instrumentator_params).add(
             metrics.default(
                 custom_labels=self.instrument_config.prometheus_custom_labels,
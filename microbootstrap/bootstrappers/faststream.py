@@ -2,10 +2,8 @@ from __future__ import annotations
 import json
 import typing
 
-import prometheus_client
 import structlog
 import typing_extensions
-from faststream._internal.logger.logger_proxy import RealLoggerObject
 from faststream.asgi import AsgiFastStream, AsgiResponse
 from faststream.asgi import get as handle_get
 from faststream.specification import AsyncAPI
@@ -82,6 +80,8 @@ class FastStreamLoggingInstrument(LoggingInstrument):
         return {"logger": faststream_app_logger}
 
     def bootstrap_after(self, application: AsgiFastStream) -> AsgiFastStream:  # type: ignore[override]
+        from faststream._internal.logger.logger_proxy import RealLoggerObject  # noqa: PLC0415
+
         for one_broker in application.brokers:
             one_broker.config.broker_config.logger.logger = RealLoggerObject(faststream_broker_logger)
         return application
@@ -93,6 +93,8 @@ class FastStreamPrometheusInstrument(PrometheusInstrument[FastStreamPrometheusCo
         return bool(self.instrument_config.prometheus_middleware_cls and super().is_ready())
 
     def bootstrap_before(self) -> dict[str, typing.Any]:
+        import prometheus_client  # noqa: PLC0415
+
         return {
             "asgi_routes": (
                 (
@@ -103,6 +105,8 @@ class FastStreamPrometheusInstrument(PrometheusInstrument[FastStreamPrometheusCo
         }
 
     def bootstrap_after(self, application: AsgiFastStream) -> AsgiFastStream:  # type: ignore[override]
+        import prometheus_client  # noqa: PLC0415
+
         if self.instrument_config.prometheus_middleware_cls and application.broker:
             application.broker.add_middleware(
                 self.instrument_config.prometheus_middleware_cls(
@@ -5,17 +5,9 @@ import litestar
 import typing_extensions
 from litestar import openapi
 from litestar.config.cors import CORSConfig as LitestarCorsConfig
-from litestar.contrib.opentelemetry.config import (
-    OpenTelemetryConfig as LitestarOpentelemetryConfig,
-)
-from litestar.contrib.prometheus import PrometheusConfig, PrometheusController
 from litestar.middleware import ASGIMiddleware
 from litestar.openapi.plugins import SwaggerRenderPlugin
 from litestar.types.asgi_types import ASGIApp, Scope
-from litestar_offline_docs import generate_static_files_config
-from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
-from opentelemetry.util.http import get_excluded_urls
-from sentry_sdk.integrations.litestar import LitestarIntegration
 
 from microbootstrap.bootstrappers.base import ApplicationBootstrapper
 from microbootstrap.config.litestar import LitestarConfig
@@ -41,6 +33,7 @@ if typing.TYPE_CHECKING:
     from litestar.contrib.opentelemetry import OpenTelemetryConfig
     from litestar.types import ASGIApp, Scope
     from litestar.types.asgi_types import Receive, Send
+    from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
 
 
 class LitestarBootstrapper(
@@ -60,6 +53,8 @@ class LitestarBootstrapper(
 @LitestarBootstrapper.use_instrument()
 class LitestarSentryInstrument(SentryInstrument):
     def bootstrap(self) -> None:
+        from sentry_sdk.integrations.litestar import LitestarIntegration  # noqa: PLC0415
+
         for sentry_integration in self.instrument_config.sentry_integrations:
             if isinstance(sentry_integration, LitestarIntegration):
                 break
@@ -97,6 +92,8 @@ class LitestarSwaggerInstrument(SwaggerInstrument):
             "openapi_config": openapi.OpenAPIConfig(**all_swagger_params),
         }
         if self.instrument_config.swagger_offline_docs:
+            from litestar_offline_docs import generate_static_files_config  # noqa: PLC0415
+
             bootstrap_result["static_files_config"] = [
                 generate_static_files_config(static_files_handler_path=self.instrument_config.service_static_path),
             ]
@@ -155,15 +152,23 @@ def build_litestar_route_details_from_scope(
 
 class LitestarOpenTelemetryInstrumentationMiddleware(ASGIMiddleware):
     def __init__(self, config: OpenTelemetryConfig) -> None:
+        from opentelemetry.util.http import get_excluded_urls  # noqa: PLC0415
+
         self.config = config
+        # reading environment and compiling excluded urls regex is too slow to be done per request
+        self.excluded_urls = get_excluded_urls(self.config.exclude_urls_env_key)
+        # Litestar builds middleware stack once per route, so there is a bounded number of next apps
+        self.open_telemetry_middlewares: dict[ASGIApp, OpenTelemetryMiddleware] = {}
 
     def create_open_telemetry_middleware(self, app: ASGIApp) -> OpenTelemetryMiddleware:
+        from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware  # noqa: PLC0415
+
         return OpenTelemetryMiddleware(
             app=app,
             client_request_hook=self.config.client_request_hook_handler,  # type: ignore[arg-type]
             client_response_hook=self.config.client_response_hook_handler,  # type: ignore[arg-type]
             default_span_details=build_litestar_route_details_from_scope,
-            excluded_urls=get_excluded_urls(self.config.exclude_urls_env_key),
+            excluded_urls=self.excluded_urls,
             meter=self.config.meter,
             meter_provider=self.config.meter_provider,
             server_request_hook=self.config.server_request_hook_handler,
@@ -171,12 +176,21 @@ class LitestarOpenTelemetryInstrumentationMiddleware(ASGIMiddleware):
         )
 
     async def handle(self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp) -> None:
-        await self.create_open_telemetry_middleware(next_app)(scope, receive, send)  # type: ignore[arg-type]
+        open_telemetry_middleware = self.open_telemetry_middlewares.get(next_app)
+        if open_telemetry_middleware is None:
+            open_telemetry_middleware = self.open_telemetry_middlewares[next_app] = (
+                self.create_open_telemetry_middleware(next_app)
+            )
+        await open_telemetry_middleware(scope, receive, send)  # type: ignore[arg-type]
 
 
 @LitestarBootstrapper.use_instrument()
 class LitestarOpentelemetryInstrument(OpentelemetryInstrument):
     def bootstrap_before(self) -> dict[str, typing.Any]:
+        from litestar.contrib.opentelemetry.config import (  # noqa: PLC0415
+            OpenTelemetryConfig as LitestarOpentelemetryConfig,
+        )
+
         return {
             "middleware": [
                 LitestarOpenTelemetryInstrumentationMiddleware(
@@ -201,6 +215,8 @@ class LitestarLoggingInstrument(LoggingInstrument):
 @LitestarBootstrapper.use_instrument()
 class LitestarPrometheusInstrument(PrometheusInstrument[LitestarPrometheusConfig]):
     def bootstrap_before(self) -> dict[str, typing.Any]:
+        from litestar.contrib.prometheus import PrometheusConfig, PrometheusController  # noqa: PLC0415
+
         class LitestarPrometheusController(PrometheusController):
             path = self.instrument_config.prometheus_metrics_path
             include_in_schema = self.instrument_config.prometheus_metrics_include_in_schema
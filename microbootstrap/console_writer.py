@@ -2,22 +2,66 @@ from __future__ import annotations
 import dataclasses
 import typing
 
-from rich.console import Console
-from rich.rule import Rule
-from rich.table import Table
+import structlog
+
+
+if typing.TYPE_CHECKING:
+    from rich.table import Table
+
+    from microbootstrap.bootstrap_timings import BootstrapTimings
+    from microbootstrap.settings import BaseServiceSettings
+
+
+LOGGER_OBJ: typing.Final = structlog.get_logger(__name__)
+
+
+@dataclasses.dataclass
+class InstrumentStatus:
+    instrument_name: str
+    is_enabled: bool
+    disable_reason: str | None = None
+
+
+class ConsoleWriterProtocol(typing.Protocol):
+    def write_instrument_status(
+        self,
+        instrument_name: str,
+        is_enabled: bool,
+        disable_reason: str | None = None,
+    ) -> None: ...
+
+    def write_bootstrap_summary(self) -> None:
+        """Write summary in bootstrapping process, right after bootstrap."""
+
+    def print_bootstrap_table(self) -> None:
+        """Print table on application startup, which happens in every worker."""
+
+
+class NoopConsoleWriter:
+    """Writer for production, that doesn't keep statuses and doesn't import anything."""
+
+    def write_instrument_status(
+        self,
+        instrument_name: str,
+        is_enabled: bool,
+        disable_reason: str | None = None,
+    ) -> None:
+        pass
+
+    def write_bootstrap_summary(self) -> None:
+        pass
+
+    def print_bootstrap_table(self) -> None:
+        pass
 
 
 @dataclasses.dataclass
 class ConsoleWriter:
-    writer_enabled: bool = True
-    rich_console: Console = dataclasses.field(init=False, default_factory=Console)
-    rich_table: Table = dataclasses.field(init=False)
+    """Writer for debug mode, that prints rich table. Rich is imported only when table is built."""
 
-    def __post_init__(self) -> None:
-        self.rich_table = Table(show_header=False, header_style="cyan")
-        self.rich_table.add_column("Item", style="cyan")
-        self.rich_table.add_column("Status")
-        self.rich_table.add_column("Reason", style="yellow")
+    writer_enabled: bool = True
+    bootstrap_timings: BootstrapTimings | None = None
+    instrument_statuses: list[InstrumentStatus] = dataclasses.field(init=False, default_factory=list)
 
     def write_instrument_status(
         self,
@@ -25,10 +69,93 @@ class ConsoleWriter:
         is_enabled: bool,
         disable_reason: str | None = None,
     ) -> None:
-        is_enabled_value: typing.Final = "[green]Enabled[/green]" if is_enabled else "[red]Disabled[/red]"
-        self.rich_table.add_row(rf"{instrument_name}", is_enabled_value, disable_reason or "")
+        self.instrument_statuses.append(InstrumentStatus(instrument_name, is_enabled, disable_reason))
+
+    def build_bootstrap_table(self) -> Table:
+        from rich.table import Table  # noqa: PLC0415
+
+        rich_table: typing.Final = Table(show_header=False, header_style="cyan")
+        rich_table.add_column("Item", style="cyan")
+        rich_table.add_column("Status")
+        rich_table.add_column("Reason", style="yellow")
+        rich_table.add_column("Duration", style="magenta", justify="right")
+        for instrument_status in self.instrument_statuses:
+            is_enabled_value = "[green]Enabled[/green]" if instrument_status.is_enabled else "[red]Disabled[/red]"
+            duration_value = (
+                f"{self.bootstrap_timings.get_total_duration(instrument_status.instrument_name) / 1_000_000:.1f} ms"
+                if self.bootstrap_timings and instrument_status.is_enabled
+                else ""
+            )
+            rich_table.add_row(
+                rf"{instrument_status.instrument_name}",
+                is_enabled_value,
+                instrument_status.disable_reason or "",
+                duration_value,
+            )
+        return rich_table
+
+    def write_bootstrap_summary(self) -> None:
+        pass
 
     def print_bootstrap_table(self) -> None:
         if self.writer_enabled:
-            self.rich_console.print(Rule("[yellow]Bootstrapping application[/yellow]", align="left"))
-            self.rich_console.print(self.rich_table)
+            from rich.console import Console  # noqa: PLC0415
+            from rich.rule import Rule  # noqa: PLC0415
+
+            rich_console: typing.Final = Console()
+            rich_console.print(Rule("[yellow]Bootstrapping application[/yellow]", align="left"))
+            rich_console.print(self.build_bootstrap_table())
+
+
+@dataclasses.dataclass
+class LogSummaryConsoleWriter:
+    """Writer, that logs one structured summary from bootstrapping process, e.g. master process in pre-fork mode."""
+
+    bootstrap_timings: BootstrapTimings | None = None
+    instrument_statuses: list[InstrumentStatus] = dataclasses.field(init=False, default_factory=list)
+    summary_written: typing.ClassVar[bool] = False
+
+    def write_instrument_status(
+        self,
+        instrument_name: str,
+        is_enabled: bool,
+        disable_reason: str | None = None,
+    ) -> None:
+        self.instrument_statuses.append(InstrumentStatus(instrument_name, is_enabled, disable_reason))
+
+    def write_bootstrap_summary(self) -> None:
+        if LogSummaryConsoleWriter.summary_written:
+            return
+
+        LogSummaryConsoleWriter.summary_written = True
+        LOGGER_OBJ.info(
+            "Application bootstrapped",
+            enabled_instruments={
+                instrument_status.instrument_name: (
+                    round(self.bootstrap_timings.get_total_duration(instrument_status.instrument_name) / 1_000_000, 1)
+                    if self.bootstrap_timings
+                    else None
+                )
+                for instrument_status in self.instrument_statuses
+                if instrument_status.is_enabled
+            },
+            disabled_instruments={
+                instrument_status.instrument_name: instrument_status.disable_reason
+                for instrument_status in self.instrument_statuses
+                if not instrument_status.is_enabled
+            },
+        )
+
+    def print_bootstrap_table(self) -> None:
+        pass
+
+
+def build_console_writer(
+    settings: BaseServiceSettings,
+    bootstrap_timings: BootstrapTimings | None = None,
+) -> ConsoleWriterProtocol:
+    if settings.service_debug:
+        return ConsoleWriter(bootstrap_timings=bootstrap_timings)
+    if settings.service_bootstrap_summary:
+        return LogSummaryConsoleWriter(bootstrap_timings=bootstrap_timings)
+    return NoopConsoleWriter()
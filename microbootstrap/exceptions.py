@@ -8,3 +8,11 @@ class ConfigMergeError(MicroBootstrapBaseError):
 
 class MissingInstrumentError(MicroBootstrapBaseError):
     """Raises when attempting to configure instrument, that is not supported yet."""
+
+
+class PreforkNotSupportedError(MicroBootstrapBaseError):
+    """Raises when pre-fork mode is requested, but workers are not started with fork."""
+
+
+class InstrumentDependencyError(MicroBootstrapBaseError):
+    """Raises when instruments' bootstrap dependencies can't be satisfied, e.g. they form a cycle."""
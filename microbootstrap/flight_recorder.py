@@ -0,0 +1,104 @@
+from __future__ import annotations
+import collections
+import datetime as dt
+import logging
+import time
+import typing
+
+import structlog
+
+from microbootstrap.log_timestamper import NANOSECONDS_IN_SECOND, CachedTimeStamper
+from microbootstrap.log_writers import LOG_METHOD_LEVELS
+
+
+if typing.TYPE_CHECKING:
+    from structlog.typing import EventDict, WrappedLogger
+
+    from microbootstrap.log_writers import BufferedLogSink
+
+
+RecordedEvent = tuple["WrappedLogger", str, "EventDict", int]
+
+
+def format_recorded_time(time_stamper: structlog.processors.TimeStamper, recorded_time: float) -> str | float:
+    if time_stamper.fmt is None:
+        return recorded_time
+    recorded_datetime: typing.Final = dt.datetime.fromtimestamp(
+        recorded_time,
+        tz=dt.timezone.utc if time_stamper.utc else None,
+    )
+    if time_stamper.fmt.lower() == "iso":
+        return recorded_datetime.isoformat().replace("+00:00", "Z")
+    return recorded_datetime.strftime(time_stamper.fmt)
+
+
+class FlightRecorder:
+    """Ring buffer, that keeps last events below logger level unrendered, and writes them only when error is logged.
+
+    Processors, that depend on logging context, e.g. tracer injection, are run as `record_processors` on recording.
+    The rest of processor chain renders events on dump, with time they were logged at.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        log_sink: BufferedLogSink,
+        record_processors: typing.Sequence[typing.Any] = (),
+    ) -> None:
+        self.log_sink = log_sink
+        self.record_processors = record_processors
+        self.processors: list[typing.Any] = []
+        self.recorded_events: collections.deque[RecordedEvent] = collections.deque(maxlen=size)
+
+    def __call__(self, logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+        log_level: typing.Final = LOG_METHOD_LEVELS.get(method_name, logging.INFO)
+        if log_level < logger.getEffectiveLevel():
+            recorded_time: typing.Final = time.time_ns()
+            for one_processor in self.record_processors:
+                event_dict = one_processor(logger, method_name, event_dict)
+            self.recorded_events.append((logger, method_name, event_dict, recorded_time))
+            raise structlog.DropEvent
+        if log_level >= logging.ERROR:
+            self.write_recorded_events()
+        return event_dict
+
+    def write_recorded_events(self) -> None:
+        """Render recorded events into log buffer, e.g. before error or from debug endpoint on demand."""
+        recorded_events: typing.Final = [*self.recorded_events]
+        self.recorded_events.clear()
+        for logger, method_name, event_dict, recorded_time in recorded_events:
+            try:
+                rendered_event = self._render_event(logger, method_name, event_dict, recorded_time)
+            except structlog.DropEvent:
+                continue
+            self.log_sink.write_line(
+                rendered_event + (b"\n" if isinstance(rendered_event, bytes) else "\n"),
+                logging.INFO,
+            )
+
+    def dump(self) -> None:
+        self.write_recorded_events()
+        self.log_sink.flush()
+
+    def _render_event(
+        self,
+        logger: WrappedLogger,
+        method_name: str,
+        event_dict: EventDict,
+        recorded_time: int,
+    ) -> typing.Any:  # noqa: ANN401
+        rendered_event: typing.Any = event_dict
+        for one_processor in self.processors:
+            if one_processor in self.record_processors:
+                continue
+            if isinstance(one_processor, CachedTimeStamper):
+                rendered_event[one_processor.key] = one_processor.format_time(recorded_time)
+                continue
+            if isinstance(one_processor, structlog.processors.TimeStamper):
+                rendered_event[one_processor.key] = format_recorded_time(
+                    one_processor,
+                    recorded_time / NANOSECONDS_IN_SECOND,
+                )
+                continue
+            rendered_event = one_processor(logger, method_name, rendered_event)
+        return rendered_event
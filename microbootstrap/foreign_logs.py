@@ -0,0 +1,100 @@
+from __future__ import annotations
+import logging
+import math
+import typing
+
+import structlog
+
+from microbootstrap.log_exceptions import DeduplicatingExceptionRenderer
+from microbootstrap.log_writers import resolve_logger_setting
+
+
+# processors, whose results are taken from stdlib record directly, e.g. its message is already formatted with args
+FOREIGN_RECORD_PROCESSORS: typing.Final[tuple[typing.Any, ...]] = (
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+)
+FOREIGN_RECORD_PROCESSOR_TYPES: typing.Final = (
+    structlog.stdlib.PositionalArgumentsFormatter,
+    structlog.processors.UnicodeDecoder,
+)
+# processors, that do nothing without exception or stack info, and are skipped for plain records
+FOREIGN_EXCEPTION_PROCESSOR_TYPES: typing.Final = (
+    structlog.processors.StackInfoRenderer,
+    structlog.processors.ExceptionRenderer,
+    DeduplicatingExceptionRenderer,
+)
+
+
+class ForeignLogFormatter(logging.Formatter):
+    """Formatter of stdlib records, a lean replacement of `ProcessorFormatter` for production logs.
+
+    Event dict is built from record directly, without copying record, and processor subset is computed once:
+    processors, that record already has results of, are dropped, and exception ones run only for records with them.
+    """
+
+    def __init__(
+        self,
+        pre_chain: typing.Sequence[typing.Any],
+        renderer: typing.Callable[..., typing.Any],
+        logger: logging.Logger | None = None,
+    ) -> None:
+        super().__init__()
+        self.renderer = renderer
+        self.logger = logger
+        self.exception_processors: typing.Final = [
+            one_processor
+            for one_processor in pre_chain
+            if one_processor not in FOREIGN_RECORD_PROCESSORS
+            and not isinstance(one_processor, FOREIGN_RECORD_PROCESSOR_TYPES)
+        ]
+        self.processors: typing.Final = [
+            one_processor
+            for one_processor in self.exception_processors
+            if not isinstance(one_processor, FOREIGN_EXCEPTION_PROCESSOR_TYPES)
+        ]
+
+    def format(self, record: logging.LogRecord) -> str:
+        method_name: typing.Final = record.levelname.lower()
+        event_dict: typing.Any = {"event": record.getMessage(), "level": method_name, "logger": record.name}
+        processors = self.processors
+        if record.exc_info or record.stack_info:
+            processors = self.exception_processors
+            if record.exc_info:
+                event_dict["exc_info"] = record.exc_info
+            if record.stack_info:
+                event_dict["stack_info"] = record.stack_info
+        for one_processor in processors:
+            event_dict = one_processor(self.logger, method_name, event_dict)
+        return typing.cast("str", self.renderer(self.logger, method_name, event_dict))
+
+
+class ForeignLogFilter(logging.Filter):
+    """Handler filter, that drops records of `dropped_loggers` and records below `logger_levels` before formatting.
+
+    Both apply to children too, even if library set level of child logger by itself, e.g. SQLAlchemy with `echo`.
+    Minimal level is resolved once per logger name.
+    """
+
+    def __init__(
+        self,
+        logger_levels: typing.Mapping[str, int] | None = None,
+        dropped_loggers: typing.Iterable[str] = (),
+    ) -> None:
+        super().__init__()
+        self.logger_levels: typing.Final[dict[str, float]] = {
+            **(logger_levels or {}),
+            **dict.fromkeys(dropped_loggers, math.inf),
+        }
+        self.logger_min_levels: dict[str, float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        try:
+            min_level = self.logger_min_levels[record.name]
+        except KeyError:
+            min_level = self.logger_min_levels[record.name] = resolve_logger_setting(
+                record.name,
+                logging.NOTSET,
+                self.logger_levels,
+            )
+        return record.levelno >= min_level
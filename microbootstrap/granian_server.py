@@ -1,11 +1,16 @@
 from __future__ import annotations
 import logging
+import multiprocessing
+import pkgutil
 import typing
 
 import granian
 from granian.constants import Interfaces
 from granian.log import LogLevels
 
+from microbootstrap import exceptions
+from microbootstrap.helpers import enable_after_fork_methods
+
 
 if typing.TYPE_CHECKING:
     from granian.server.common import AbstractServer as GranianServer
@@ -23,19 +28,60 @@ GRANIAN_LOG_LEVELS_MAP = {
 }
 
 
+class PreforkGranianServer(granian.Granian):  # type: ignore[misc,valid-type]
+    """Granian server, that serves application loaded once in master process, instead of loading it in every worker.
+
+    Workers are forked from master process, so they share its memory copy-on-write.
+    Instruments reinitialize what doesn't survive fork in their `after_fork` hooks.
+    """
+
+    def __init__(self, preloaded_application: typing.Any, **granian_options: typing.Any) -> None:  # noqa: ANN401
+        super().__init__(**granian_options)
+        self.preloaded_application = preloaded_application
+
+    def load_preloaded_application(self) -> typing.Any:  # noqa: ANN401
+        return self.preloaded_application
+
+    def serve(
+        self,
+        spawn_target: typing.Callable[..., None] | None = None,
+        target_loader: typing.Callable[..., typing.Callable[..., typing.Any]] | None = None,
+        wrap_loader: bool = True,
+    ) -> None:
+        if target_loader is None:
+            target_loader, wrap_loader = self.load_preloaded_application, False
+        enable_after_fork_methods()
+        super().serve(spawn_target, target_loader, wrap_loader)
+
+
 # TODO: create bootstrappers for application servers. granian/uvicorn  # noqa: TD002
 def create_granian_server(
     target: str,
     settings: ServerConfig,
     **granian_options: typing.Any,  # noqa: ANN401
 ) -> GranianServer[typing.Any]:
-    return granian.Granian(
-        target=target,
-        address=settings.server_host,
-        port=settings.server_port,
-        interface=Interfaces.ASGI,
-        workers=settings.server_workers_count,
-        log_level=GRANIAN_LOG_LEVELS_MAP[getattr(settings, "logging_log_level", logging.INFO)],
-        reload=settings.server_reload,
+    server_options: typing.Final = {
+        "target": target,
+        "address": settings.server_host,
+        "port": settings.server_port,
+        "interface": Interfaces.ASGI,
+        "workers": settings.server_workers_count,
+        "log_level": GRANIAN_LOG_LEVELS_MAP[getattr(settings, "logging_log_level", logging.INFO)],
+        "reload": settings.server_reload,
         **granian_options,
+    }
+    if not settings.server_prefork:
+        return granian.Granian(**server_options)
+
+    if multiprocessing.get_start_method() != "fork":
+        raise exceptions.PreforkNotSupportedError(
+            "Pre-fork mode requires fork start method, "
+            f"call multiprocessing.set_start_method('fork') instead of {multiprocessing.get_start_method()!r}",
+        )
+    # preloaded application can't be reloaded on changes
+    server_options["reload"] = False
+    preloaded_application: typing.Final = pkgutil.resolve_name(target)
+    return PreforkGranianServer(
+        preloaded_application=preloaded_application() if server_options.get("factory") else preloaded_application,
+        **server_options,
     )
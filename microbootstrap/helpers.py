@@ -1,6 +1,9 @@
 import dataclasses
+import functools
+import os
 import re
 import typing
+import weakref
 from dataclasses import _MISSING_TYPE
 
 from microbootstrap import exceptions
@@ -14,6 +17,7 @@ if typing.TYPE_CHECKING:
 
 PydanticConfigT = typing.TypeVar("PydanticConfigT", bound="BaseModel")
 VALID_PATH_PATTERN: typing.Final = r"^(/[a-zA-Z0-9_-]+)+/?$"
+AFTER_FORK_METHODS: typing.Final[list[weakref.WeakMethod[typing.Callable[[], None]]]] = []
 
 
 def dataclass_to_dict_no_defaults(dataclass_to_convert: "_DataclassT") -> dict[str, typing.Any]:
@@ -93,6 +97,35 @@ def merge_dict_configs(
     return config_dict
 
 
+def call_after_fork_methods() -> None:
+    for weak_method in [*AFTER_FORK_METHODS]:
+        if alive_method := weak_method():
+            alive_method()
+
+
+@functools.cache
+def enable_after_fork_methods() -> None:
+    """Install process-wide fork hook, that calls registered methods, e.g. in workers of pre-fork server.
+
+    Bootstrap alone keeps forks untouched, so only processes, that opt in, reinitialize instruments in children.
+    Fork hooks can't be unregistered, so the hook is installed once per process.
+    """
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=call_after_fork_methods)
+
+
+def register_after_fork(bound_method: typing.Callable[[], None]) -> None:
+    """Call bound method in child processes after fork, while its object is alive, once fork hook is enabled.
+
+    Methods of collected objects are dropped, and the same method is registered once.
+    """
+    weak_method: typing.Final = weakref.WeakMethod(bound_method)
+    alive_methods: typing.Final = [one_method for one_method in AFTER_FORK_METHODS if one_method() is not None]
+    if weak_method not in alive_methods:
+        alive_methods.append(weak_method)
+    AFTER_FORK_METHODS[:] = alive_methods
+
+
 def is_valid_path(maybe_path: str) -> bool:
     return bool(re.fullmatch(VALID_PATH_PATTERN, maybe_path))
 
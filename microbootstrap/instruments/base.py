@@ -9,7 +9,7 @@ from microbootstrap.helpers import merge_pydantic_configs
 
 
 if typing.TYPE_CHECKING:
-    from microbootstrap.console_writer import ConsoleWriter
+    from microbootstrap.console_writer import ConsoleWriterProtocol
 
 
 InstrumentConfigT = typing.TypeVar("InstrumentConfigT", bound="BaseInstrumentConfig")
@@ -25,6 +25,7 @@ class Instrument(abc.ABC, typing.Generic[InstrumentConfigT]):
     instrument_config: InstrumentConfigT
     instrument_name: typing.ClassVar[str]
     ready_condition: typing.ClassVar[str]
+    bootstrap_dependencies: typing.ClassVar[tuple[type[Instrument[typing.Any]], ...]] = ()
 
     def configure_instrument(
         self,
@@ -32,7 +33,7 @@ class Instrument(abc.ABC, typing.Generic[InstrumentConfigT]):
     ) -> None:
         self.instrument_config = merge_pydantic_configs(self.instrument_config, incoming_config)
 
-    def write_status(self, console_writer: ConsoleWriter) -> None:
+    def write_status(self, console_writer: ConsoleWriterProtocol) -> None:
         console_writer.write_instrument_status(
             self.instrument_name,
             is_enabled=self.is_ready(),
@@ -53,6 +54,9 @@ class Instrument(abc.ABC, typing.Generic[InstrumentConfigT]):
     def teardown(self) -> None:
         return None
 
+    def after_fork(self) -> None:
+        """Reinitialize threads and connections, that don't survive fork of bootstrapped process into workers."""
+
     def bootstrap_before(self) -> dict[str, typing.Any]:
         """Add some framework-related parameters to final bootstrap result before application creation."""
         return {}
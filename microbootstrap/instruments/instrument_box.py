@@ -1,9 +1,63 @@
+import concurrent.futures
+import contextvars
 import dataclasses
+import functools
 import typing
 
 from microbootstrap import exceptions
-from microbootstrap.instruments.base import Instrument, InstrumentConfigT
-from microbootstrap.settings import SettingsT
+from microbootstrap.bootstrap_timings import BOOTSTRAP_PHASE, BootstrapTimings
+from microbootstrap.instruments.base import BaseInstrumentConfig, Instrument, InstrumentConfigT
+from microbootstrap.settings import BaseServiceSettings, SettingsT
+
+
+CONTAINER_TYPES: typing.Final = (list, dict, set)
+
+
+@dataclasses.dataclass(frozen=True)
+class ConfigFieldsProjection:
+    field_names: tuple[str, ...]
+    container_field_names: tuple[str, ...]
+
+
+def _may_hold_container(annotation: typing.Any) -> bool:  # noqa: ANN401
+    if annotation in CONTAINER_TYPES or typing.get_origin(annotation) in CONTAINER_TYPES:
+        return True
+    return any(_may_hold_container(one_argument) for one_argument in typing.get_args(annotation))
+
+
+@functools.cache
+def project_config_fields(
+    settings_type: type[BaseServiceSettings],
+    config_type: type[BaseInstrumentConfig],
+) -> ConfigFieldsProjection:
+    """Config fields, that can be taken from settings of given type, computed once per types pair."""
+    field_names: typing.Final = tuple(
+        field_name for field_name in config_type.model_fields if field_name in settings_type.model_fields
+    )
+    return ConfigFieldsProjection(
+        field_names=field_names,
+        container_field_names=tuple(
+            field_name
+            for field_name in field_names
+            if _may_hold_container(config_type.model_fields[field_name].annotation)
+        ),
+    )
+
+
+def build_instrument_config(settings: BaseServiceSettings, config_type: type[InstrumentConfigT]) -> InstrumentConfigT:
+    projection: typing.Final = project_config_fields(type(settings), config_type)
+    settings_values: typing.Final = settings.__dict__
+    projected_fields: typing.Final = {field_name: settings_values[field_name] for field_name in projection.field_names}
+    # instruments may extend their containers, e.g. sentry integrations, so they must not be shared with settings
+    for field_name in projection.container_field_names:
+        if isinstance(field_value := projected_fields[field_name], CONTAINER_TYPES):
+            projected_fields[field_name] = field_value.copy()
+
+    if not isinstance(settings, config_type):
+        return config_type(**(settings.model_extra or {}), **projected_fields)
+
+    # settings inheriting from config have already passed the same validation, so it is skipped
+    return config_type.model_construct(_fields_set=set(projected_fields), **projected_fields)
 
 
 @dataclasses.dataclass
@@ -12,9 +66,8 @@ class InstrumentBox:
     __initialized_instruments__: list[Instrument[typing.Any]] = dataclasses.field(default_factory=list)
 
     def initialize(self, settings: SettingsT) -> None:
-        settings_dump = settings.model_dump()
         self.__initialized_instruments__ = [
-            instrument_type(instrument_type.get_config_type()(**settings_dump))
+            instrument_type(build_instrument_config(settings, instrument_type.get_config_type()))
             for instrument_type in self.__instruments__
         ]
 
@@ -45,6 +98,70 @@ class InstrumentBox:
         self.__instruments__.append(instrument_class)
         return instrument_class
 
+    def bootstrap_instruments(
+        self,
+        max_workers: int = 1,
+        bootstrap_timings: BootstrapTimings | None = None,
+    ) -> list[Instrument[typing.Any]]:
+        """Bootstrap ready instruments and return them in registration order.
+
+        With `max_workers` > 1 independent instruments are bootstrapped concurrently on a thread pool,
+        every instrument waits only for ready instruments listed in its `bootstrap_dependencies`.
+        """
+        ready_instruments: typing.Final = [instrument for instrument in self.instruments if instrument.is_ready()]
+        timings: typing.Final = bootstrap_timings or BootstrapTimings()
+
+        def bootstrap_instrument(instrument: Instrument[typing.Any]) -> None:
+            with timings.measure(instrument.instrument_name, BOOTSTRAP_PHASE):
+                instrument.bootstrap()
+
+        if max_workers <= 1:
+            for instrument in ready_instruments:
+                bootstrap_instrument(instrument)
+            return ready_instruments
+
+        waiting_instruments: typing.Final = {
+            instrument_index: {
+                dependency_index
+                for dependency_index, dependency in enumerate(ready_instruments)
+                if dependency is not instrument and isinstance(dependency, instrument.bootstrap_dependencies)
+            }
+            for instrument_index, instrument in enumerate(ready_instruments)
+        }
+        bootstrapped_indexes: typing.Final[set[int]] = set()
+        running_futures: typing.Final[dict[concurrent.futures.Future[None], int]] = {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="microbootstrap",
+        ) as executor:
+            while len(bootstrapped_indexes) < len(ready_instruments):
+                for instrument_index, dependency_indexes in list(waiting_instruments.items()):
+                    if dependency_indexes <= bootstrapped_indexes:
+                        waiting_instruments.pop(instrument_index)
+                        # worker threads need caller's context to nest bootstrap spans
+                        instrument_future = executor.submit(
+                            contextvars.copy_context().run,
+                            bootstrap_instrument,
+                            ready_instruments[instrument_index],
+                        )
+                        running_futures[instrument_future] = instrument_index
+
+                if not running_futures:
+                    blocked_names = (ready_instruments[one_index].instrument_name for one_index in waiting_instruments)
+                    raise exceptions.InstrumentDependencyError(
+                        f"Cyclic bootstrap dependencies between instruments: {', '.join(blocked_names)}",
+                    )
+
+                done_futures, _ = concurrent.futures.wait(
+                    running_futures,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for done_future in done_futures:
+                    done_future.result()
+                    bootstrapped_indexes.add(running_futures.pop(done_future))
+
+        return ready_instruments
+
     @property
     def instruments(self) -> list[Instrument[typing.Any]]:
         return self.__initialized_instruments__
@@ -1,7 +1,12 @@
 from __future__ import annotations
+import contextvars
+import dataclasses
+import functools
+import http
 import logging
-import logging.handlers
+import math
 import sys
+import threading
 import time
 import typing
 import urllib.parse
@@ -12,7 +17,27 @@ import structlog
 import typing_extensions
 from opentelemetry import trace
 
+from microbootstrap.flight_recorder import FlightRecorder
+from microbootstrap.foreign_logs import ForeignLogFilter, ForeignLogFormatter
 from microbootstrap.instruments.base import BaseInstrumentConfig, Instrument
+from microbootstrap.log_exceptions import (
+    EXCEPTION_FINGERPRINT_KEY,
+    BoundedExceptionDictTransformer,
+    DeduplicatingExceptionRenderer,
+    resolve_exc_info,
+)
+from microbootstrap.log_rate_limiter import LogRateLimiter
+from microbootstrap.log_shipping import SOCKET_FRAMING_NEWLINE, SocketFraming, SocketLogWriter, parse_socket_address
+from microbootstrap.log_timestamper import TIMESTAMP_SECONDS, CachedTimeStamper, TimestampPrecision
+from microbootstrap.log_writers import (
+    LOG_METHOD_LEVELS,
+    LOG_OVERFLOW_BLOCK,
+    BackgroundLogWriter,
+    BufferedBytesLoggerFactory,
+    BufferedLogSink,
+    LogOverflowPolicy,
+    resolve_logger_setting,
+)
 
 
 if typing.TYPE_CHECKING:
@@ -20,41 +45,225 @@ if typing.TYPE_CHECKING:
     import litestar
     from structlog.typing import EventDict, WrappedLogger
 
+    from microbootstrap.log_writers import TextLogStream
+
 
 ScopeType = typing.MutableMapping[str, typing.Any]
 
-access_logger: typing.Final = structlog.get_logger("api.access")
+ACCESS_LOGGER_NAME: typing.Final = "api.access"
+access_logger: typing.Final = structlog.get_logger(ACCESS_LOGGER_NAME)
+ACCESS_LOG_METHODS: typing.Final[dict[str, typing.Callable[..., typing.Any]]] = {}
+UNMATCHED_ROUTE_TEMPLATE: typing.Final = "<unmatched>"
+# formatted ids of the last span, that logged in current context
+TRACING_CACHE: typing.Final[contextvars.ContextVar[tuple[trace.Span, dict[str, str]] | None]] = contextvars.ContextVar(
+    "microbootstrap_tracing_cache",
+    default=None,
+)
+ACCESS_LOG_PERCENTILES: typing.Final = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+# each power of two of durations is split into 32 buckets, so percentiles are off by 1/32 at most
+DURATION_BUCKET_BITS: typing.Final = 5
+DURATION_BUCKETS_PER_SHIFT: typing.Final = 1 << DURATION_BUCKET_BITS
+
+
+@functools.lru_cache(maxsize=4096)
+def quote_url_path(path: str) -> str:
+    return urllib.parse.quote(path)
+
+
+def get_access_log_method(log_level: str) -> typing.Callable[..., typing.Any]:
+    """Bind access logger once per level, instead of resolving lazy logger proxy on every request.
+
+    New proxy is bound, because cached proxy keeps logger of the configuration it was first used with.
+    """
+    try:
+        return ACCESS_LOG_METHODS[log_level]
+    except KeyError:
+        access_log_method: typing.Final[typing.Callable[..., typing.Any]] = getattr(
+            structlog.get_logger(ACCESS_LOGGER_NAME).bind(),
+            log_level,
+        )
+        ACCESS_LOG_METHODS[log_level] = access_log_method
+        return access_log_method
 
 
 def make_path_with_query_string(scope: ScopeType) -> str:
-    path_with_query_string: typing.Final = urllib.parse.quote(scope["path"])
+    path_with_query_string: typing.Final = quote_url_path(scope["path"])
     if scope["query_string"]:
         return f"{path_with_query_string}?{scope['query_string'].decode('ascii')}"
     return path_with_query_string
 
 
+def get_route_template(scope: ScopeType) -> str:
+    if "path_template" in scope:
+        return typing.cast("str", scope["path_template"])
+    return getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE_TEMPLATE
+
+
+def get_duration_bucket(duration: int) -> int:
+    """Log-linear histogram bucket: durations below 64 get own buckets, and longer ones keep 6 highest bits."""
+    bucket_shift: typing.Final = max(duration.bit_length() - DURATION_BUCKET_BITS - 1, 0)
+    return bucket_shift * DURATION_BUCKETS_PER_SHIFT + (duration >> bucket_shift)
+
+
+def get_bucket_max_duration(duration_bucket: int) -> int:
+    bucket_shift: typing.Final = max(duration_bucket // DURATION_BUCKETS_PER_SHIFT - 1, 0)
+    bucket_min_duration: typing.Final = (duration_bucket - bucket_shift * DURATION_BUCKETS_PER_SHIFT) << bucket_shift
+    return bucket_min_duration + (1 << bucket_shift) - 1
+
+
+def get_duration_percentile(duration_buckets: dict[int, int], count: int, percentile: float) -> int:
+    """Upper bound of bucket, that holds duration of given percentile."""
+    percentile_rank: typing.Final = max(math.ceil(count * percentile), 1)
+    seen_count = 0
+    for duration_bucket in sorted(duration_buckets):
+        seen_count += duration_buckets[duration_bucket]
+        if seen_count >= percentile_rank:
+            return get_bucket_max_duration(duration_bucket)
+    return 0
+
+
+@dataclasses.dataclass
+class RouteAccessStats:
+    # bucket counts instead of durations, so memory and flush time don't grow with traffic
+    duration_buckets: dict[int, int] = dataclasses.field(default_factory=dict)
+    count: int = 0
+    error_count: int = 0
+    response_bytes: int = 0
+
+
+class AccessLogAggregator:
+    """Collects access stats per method, route template and status class, and logs one summary per interval.
+
+    Errors and requests slower than `slow_threshold` seconds are still logged one line per request.
+    """
+
+    def __init__(self) -> None:
+        self.interval: float | None = None
+        self.slow_threshold = 0
+        self.route_stats: dict[tuple[str, str, str], RouteAccessStats] = {}
+        self._condition = threading.Condition()
+        self._closed = True
+
+    def start(self, interval: float, slow_threshold: float) -> None:
+        self.interval = interval
+        self.slow_threshold = int(slow_threshold * 1_000_000_000)
+        self._start_summary_writer()
+
+    def _start_summary_writer(self) -> None:
+        self._condition = threading.Condition()
+        self._closed = False
+        threading.Thread(
+            target=self._write_summaries_by_interval,
+            args=(self.interval,),
+            name="microbootstrap-access-log-aggregator",
+            daemon=True,
+        ).start()
+
+    def record(self, method: str, route_template: str, status_code: int, duration: int, response_bytes: int) -> None:
+        stats_key: typing.Final = (method, route_template, f"{status_code // 100}xx")
+        with self._condition:
+            route_stats = self.route_stats.get(stats_key)
+            if route_stats is None:
+                route_stats = self.route_stats[stats_key] = RouteAccessStats()
+            duration_bucket = get_duration_bucket(duration)
+            route_stats.duration_buckets[duration_bucket] = route_stats.duration_buckets.get(duration_bucket, 0) + 1
+            route_stats.count += 1
+            route_stats.response_bytes += response_bytes
+            if status_code >= http.HTTPStatus.INTERNAL_SERVER_ERROR:
+                route_stats.error_count += 1
+
+    def flush(self) -> None:
+        with self._condition:
+            route_stats: typing.Final = self.route_stats
+            self.route_stats = {}
+        access_log_method: typing.Final = get_access_log_method("info")
+        for (http_method, route_template, status_class), one_route_stats in route_stats.items():
+            access_log_method(
+                f"{http_method} {route_template} {status_class}",
+                http={"route": route_template, "method": http_method, "status_class": status_class},
+                count=one_route_stats.count,
+                error_count=one_route_stats.error_count,
+                duration={
+                    percentile_name: get_duration_percentile(
+                        one_route_stats.duration_buckets,
+                        one_route_stats.count,
+                        percentile,
+                    )
+                    for percentile_name, percentile in ACCESS_LOG_PERCENTILES.items()
+                },
+                bytes=one_route_stats.response_bytes,
+                interval=self.interval,
+            )
+
+    def close(self) -> None:
+        if self.interval is None:
+            return
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self.flush()
+        self.interval = None
+
+    def after_fork(self) -> None:
+        if self.interval is None:
+            return
+        # stats of parent process are logged by parent, and summary thread is not copied by fork
+        self.route_stats = {}
+        self._start_summary_writer()
+
+    def _write_summaries_by_interval(self, interval: float) -> None:
+        condition: typing.Final = self._condition
+        while True:
+            with condition:
+                # thread of previous start stops, when condition is replaced by new one
+                if self._closed or condition is not self._condition:
+                    return
+                condition.wait(interval)
+                if self._closed or condition is not self._condition:
+                    return
+            self.flush()
+
+
+ACCESS_LOG_AGGREGATOR: typing.Final = AccessLogAggregator()
+
+
 def fill_log_message(
     log_level: str,
     request: litestar.Request[typing.Any, typing.Any, typing.Any] | fastapi.Request,
     status_code: int,
     start_time: int,
+    response_bytes: int = 0,
 ) -> None:
     process_time: typing.Final = time.perf_counter_ns() - start_time
-    url_with_query: typing.Final = make_path_with_query_string(typing.cast("ScopeType", request.scope))
-    client_host: typing.Final = request.client.host if request.client is not None else None
-    client_port: typing.Final = request.client.port if request.client is not None else None
-    http_method: typing.Final = request.method
-    http_version: typing.Final = request.scope["http_version"]
-    log_on_correct_level: typing.Final = getattr(access_logger, log_level)
-    log_on_correct_level(
+    # scope is read directly, request properties build address and method objects on every call
+    request_scope: typing.Final = typing.cast("ScopeType", request.scope)
+    if ACCESS_LOG_AGGREGATOR.interval is not None:
+        ACCESS_LOG_AGGREGATOR.record(
+            request_scope["method"],
+            get_route_template(request_scope),
+            status_code,
+            process_time,
+            response_bytes,
+        )
+        if status_code < http.HTTPStatus.INTERNAL_SERVER_ERROR and process_time < ACCESS_LOG_AGGREGATOR.slow_threshold:
+            return
+    url_with_query: typing.Final = make_path_with_query_string(request_scope)
+    client_address: typing.Final = request_scope.get("client")
+    http_method: typing.Final = request_scope["method"]
+    get_access_log_method(log_level)(
         f"{http_method} {url_with_query}",
         http={
             "url": url_with_query,
             "status_code": status_code,
             "method": http_method,
-            "version": http_version,
+            "version": request_scope["http_version"],
+        },
+        network={
+            "client": {
+                "ip": client_address[0] if client_address else None,
+                "port": client_address[1] if client_address else None,
+            },
         },
-        network={"client": {"ip": client_host, "port": client_port}},
         duration=process_time,
     )
 
@@ -65,11 +274,18 @@ def tracer_injection(_: WrappedLogger, __: str, event_dict: EventDict) -> EventD
         event_dict["tracing"] = {}
         return event_dict
 
+    tracing_cache = TRACING_CACHE.get()
+    if tracing_cache is not None and tracing_cache[0] is current_span:
+        event_dict["tracing"] = tracing_cache[1]
+        return event_dict
+
     current_span_context = current_span.get_span_context()
-    event_dict["tracing"] = {
+    tracing: typing.Final = {
         "span_id": trace.format_span_id(current_span_context.span_id),
         "trace_id": trace.format_trace_id(current_span_context.trace_id),
     }
+    TRACING_CACHE.set((current_span, tracing))
+    event_dict["tracing"] = tracing
     return event_dict
 
 
@@ -78,7 +294,7 @@ STRUCTLOG_PRE_CHAIN_PROCESSORS: typing.Final[list[typing.Any]] = [
     structlog.stdlib.add_logger_name,
     tracer_injection,
     structlog.stdlib.PositionalArgumentsFormatter(),
-    structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
+    CachedTimeStamper(),
     structlog.processors.StackInfoRenderer(),
     structlog.processors.format_exc_info,
     structlog.processors.UnicodeDecoder(),
@@ -92,47 +308,124 @@ def _serialize_log_with_orjson_to_string(value: typing.Any, **kwargs: typing.Any
 STRUCTLOG_FORMATTER_PROCESSOR: typing.Final = structlog.processors.JSONRenderer(
     serializer=_serialize_log_with_orjson_to_string
 )
+STRUCTLOG_BYTES_FORMATTER_PROCESSOR: typing.Final = structlog.processors.JSONRenderer(serializer=orjson.dumps)
 
 _FAKER_STDLIB_LOGGER = logging.getLogger("microbootstrap.structlog")
 _FAKER_STDLIB_LOGGER.propagate = False
 _FAKER_STDLIB_LOGGER.addHandler(logging.NullHandler())
 
 
-def redirect_json_log_to_stdlib(_: WrappedLogger, __: str, event_dict: EventDict) -> EventDict:
+def forward_event_to_stdlib(_: WrappedLogger, __: str, event_dict: EventDict) -> EventDict:
+    """Pass structured event to Sentry and other stdlib listeners, without rendering it.
+
+    Event is copied into `structlog_event` extra, because renderer pops keys from event dict after.
+    """
     __tracebackhide__ = True
-    getattr(_FAKER_STDLIB_LOGGER, event_dict["level"])(
-        STRUCTLOG_FORMATTER_PROCESSOR(_, __, event_dict),
-        exc_info=event_dict.get("exc_info", bool(event_dict.get("exception", False))),
+    log_level: typing.Final = LOG_METHOD_LEVELS.get(event_dict["level"], logging.NOTSET)
+    if not _FAKER_STDLIB_LOGGER.isEnabledFor(log_level):
+        return event_dict
+    _FAKER_STDLIB_LOGGER.log(
+        log_level,
+        event_dict.get("event"),
+        exc_info=event_dict.get(
+            "exc_info",
+            bool(event_dict.get("exception", False) or event_dict.get(EXCEPTION_FINGERPRINT_KEY, False)),
+        ),
+        extra={"structlog_event": dict(event_dict)},
     )
     return event_dict
 
 
+def forward_error_event_to_stdlib(_: WrappedLogger, __: str, event_dict: EventDict) -> EventDict:
+    """Send only errors to Sentry, when structlog writes bytes without stdlib logging."""
+    __tracebackhide__ = True
+    if LOG_METHOD_LEVELS.get(event_dict["level"], logging.NOTSET) >= logging.ERROR:
+        return forward_event_to_stdlib(_, __, event_dict)
+    return event_dict
+
+
+def log_nothing(*_: typing.Any, **__: typing.Any) -> None:  # noqa: ANN401
+    return None
+
+
+async def alog_nothing(*_: typing.Any, **__: typing.Any) -> None:  # noqa: ANN401
+    return None
+
+
+@functools.cache
+def make_level_filtering_bound_logger(min_level: int) -> type[structlog.stdlib.BoundLogger]:
+    """Build stdlib bound logger, whose methods below `min_level` are no-ops, instead of `filter_by_level` processor."""
+
+    class LevelFilteringBoundLogger(structlog.stdlib.BoundLogger):
+        def log(self, level: int, event: str | None = None, *args: typing.Any, **kw: typing.Any) -> typing.Any:  # noqa: ANN401
+            if level < min_level:
+                return None
+            return super().log(level, event, *args, **kw)
+
+    for method_name, method_level in LOG_METHOD_LEVELS.items():
+        if method_level >= min_level:
+            continue
+        if hasattr(LevelFilteringBoundLogger, method_name):
+            setattr(LevelFilteringBoundLogger, method_name, log_nothing)
+        if hasattr(LevelFilteringBoundLogger, f"a{method_name}"):
+            setattr(LevelFilteringBoundLogger, f"a{method_name}", alog_nothing)
+    return LevelFilteringBoundLogger
+
+
+def bind_level_filtering_logger(
+    logger: typing.Any,  # noqa: ANN401
+    processors: typing.Iterable[typing.Any],
+    context: typing.Any,  # noqa: ANN401
+) -> typing.Any:  # noqa: ANN401
+    """Pick bound logger class by level of wrapped logger, once when logger is created."""
+    if isinstance(logger, logging.Logger):
+        return make_level_filtering_bound_logger(logger.getEffectiveLevel())(logger, processors, context)
+    # filtering classes are built on BoundLoggerBase, but are typed by protocol, that has no constructor
+    filtering_logger_class: typing.Final = typing.cast(
+        "type[structlog.BoundLoggerBase]",
+        structlog.make_filtering_bound_logger(logger.getEffectiveLevel()),
+    )
+    return filtering_logger_class(logger, processors, context)
+
+
 class MemoryLoggerFactory(structlog.stdlib.LoggerFactory):
-    def __init__(
+    """Logger factory, that attaches one shared buffered sink to every logger."""
+
+    def __init__(  # noqa: PLR0913
         self,
         *args: typing.Any,  # noqa: ANN401
         logging_buffer_capacity: int,
         logging_flush_level: int,
         logging_log_level: int,
         log_stream: typing.Any = sys.stdout,  # noqa: ANN401
+        logging_buffer_max_size: int | None = None,
+        logging_buffer_max_age: float | None = None,
+        logging_logger_levels: typing.Mapping[str, int] | None = None,
         **kwargs: typing.Any,  # noqa: ANN401
     ) -> None:
         super().__init__(*args, **kwargs)
         self.logging_buffer_capacity = logging_buffer_capacity
         self.logging_flush_level = logging_flush_level
         self.logging_log_level = logging_log_level
+        self.logging_logger_levels = logging_logger_levels or {}
         self.log_stream = log_stream
+        self.log_sink = BufferedLogSink(
+            log_stream,
+            capacity=logging_buffer_capacity,
+            flush_level=logging_flush_level,
+            max_size=logging_buffer_max_size,
+            max_age=logging_buffer_max_age,
+        )
 
     def __call__(self, *args: typing.Any) -> logging.Logger:  # noqa: ANN401
         logger: typing.Final = super().__call__(*args)
-        stream_handler: typing.Final = logging.StreamHandler(stream=self.log_stream)
-        handler: typing.Final = logging.handlers.MemoryHandler(
-            capacity=self.logging_buffer_capacity,
-            flushLevel=self.logging_flush_level,
-            target=stream_handler,
-        )
-        logger.addHandler(handler)
-        logger.setLevel(self.logging_log_level)
+        # sinks of previous bootstraps are replaced, so records are not written twice
+        for previous_handler in [*logger.handlers]:
+            if isinstance(previous_handler, BufferedLogSink) and previous_handler is not self.log_sink:
+                logger.removeHandler(previous_handler)
+        if self.log_sink not in logger.handlers:
+            logger.addHandler(self.log_sink)
+        logger.setLevel(resolve_logger_setting(logger.name, self.logging_log_level, self.logging_logger_levels))
         logger.propagate = False
         return logger
 
@@ -141,8 +434,30 @@ class LoggingConfig(BaseInstrumentConfig):
     service_debug: bool = True
 
     logging_log_level: int = logging.INFO
+    logging_logger_levels: dict[str, int] = pydantic.Field(default_factory=dict)
     logging_flush_level: int = logging.ERROR
     logging_buffer_capacity: int = 10
+    logging_buffer_max_size: int | None = 64 * 1024
+    logging_buffer_max_age: float | None = 0.2
+    logging_background_writer: bool = False
+    logging_background_queue_size: int = pydantic.Field(default=10_000, ge=1)
+    logging_overflow_policy: LogOverflowPolicy = LOG_OVERFLOW_BLOCK
+    logging_render_bytes: bool = False
+    logging_access_log_interval: float | None = None
+    logging_access_log_slow_threshold: float = 1.0
+    logging_flight_recorder_size: int = pydantic.Field(default=0, ge=0)
+    logging_rate_limit_events: int | None = pydantic.Field(default=None, ge=1)
+    logging_rate_limit_window: float = pydantic.Field(default=1.0, gt=0)
+    logging_sample_rates: dict[str, float] = pydantic.Field(default_factory=dict)
+    logging_timestamp_precision: TimestampPrecision = TIMESTAMP_SECONDS
+    logging_structured_exceptions: bool = False
+    logging_exception_max_frames: int = pydantic.Field(default=20, ge=2)
+    logging_exception_show_locals: bool = False
+    logging_exception_locals_max_string: int = pydantic.Field(default=80, ge=1)
+    logging_exception_dedup_window: float | None = pydantic.Field(default=None, gt=0)
+    logging_drop_loggers: list[str] = pydantic.Field(default_factory=list)
+    logging_socket_address: str | None = None
+    logging_socket_framing: SocketFraming = SOCKET_FRAMING_NEWLINE
     logging_extra_processors: list[typing.Any] = pydantic.Field(default_factory=list)
     logging_unset_handlers: list[str] = pydantic.Field(
         default_factory=lambda: ["uvicorn", "uvicorn.access"],
@@ -157,16 +472,94 @@ class LoggingConfig(BaseInstrumentConfig):
         ]
         return self
 
+    @pydantic.field_validator("logging_socket_address")
+    @classmethod
+    def validate_logging_socket_address(cls, logging_socket_address: str | None) -> str | None:
+        if logging_socket_address is not None:
+            parse_socket_address(logging_socket_address)
+        return logging_socket_address
+
 
 class LoggingInstrument(Instrument[LoggingConfig]):
     instrument_name = "Logging"
     ready_condition = "Always ready"
+    background_writer: BackgroundLogWriter | None = None
+    socket_writer: SocketLogWriter | None = None
+    log_sink: BufferedLogSink | None = None
+    flight_recorder: FlightRecorder | None = None
+    log_rate_limiter: LogRateLimiter | None = None
 
     def is_ready(self) -> bool:
         return True
 
     def teardown(self) -> None:
+        ACCESS_LOG_AGGREGATOR.close()
+        if self.log_rate_limiter:
+            self.log_rate_limiter.write_summaries()
         structlog.reset_defaults()
+        ACCESS_LOG_METHODS.clear()
+        if self.log_sink:
+            self.log_sink.close()
+        if self.background_writer:
+            self.background_writer.close()
+        if self.socket_writer:
+            self.socket_writer.close()
+
+    def after_fork(self) -> None:
+        ACCESS_LOG_AGGREGATOR.after_fork()
+        if self.flight_recorder:
+            self.flight_recorder.recorded_events.clear()
+        if self.log_sink:
+            self.log_sink.after_fork()
+        if self.background_writer:
+            self.background_writer.after_fork()
+        if self.socket_writer:
+            self.socket_writer.after_fork()
+
+    @property
+    def render_bytes(self) -> bool:
+        return self.instrument_config.logging_render_bytes and not self.instrument_config.service_debug
+
+    @property
+    def log_stream(self) -> typing.TextIO | typing.BinaryIO | BackgroundLogWriter | SocketLogWriter:
+        if self.background_writer:
+            return self.background_writer
+        if self.socket_writer:
+            return self.socket_writer
+        return sys.stdout.buffer if self.render_bytes else sys.stdout
+
+    @functools.cached_property
+    def pre_chain_processors(self) -> list[typing.Any]:
+        timestamp_precision: typing.Final = self.instrument_config.logging_timestamp_precision
+        exception_renderer: typing.Final = self._build_exception_renderer()
+        if timestamp_precision == TIMESTAMP_SECONDS and exception_renderer is None:
+            return STRUCTLOG_PRE_CHAIN_PROCESSORS
+        pre_chain_processors: typing.Final = [*STRUCTLOG_PRE_CHAIN_PROCESSORS]
+        for processor_index, one_processor in enumerate(pre_chain_processors):
+            if isinstance(one_processor, CachedTimeStamper):
+                pre_chain_processors[processor_index] = CachedTimeStamper(timestamp_precision)
+            elif one_processor is structlog.processors.format_exc_info and exception_renderer:
+                pre_chain_processors[processor_index] = exception_renderer
+        return pre_chain_processors
+
+    def _build_exception_renderer(self) -> DeduplicatingExceptionRenderer | None:
+        if (
+            not self.instrument_config.logging_structured_exceptions
+            and self.instrument_config.logging_exception_dedup_window is None
+        ):
+            return None
+        return DeduplicatingExceptionRenderer(
+            structlog.processors.ExceptionRenderer(
+                BoundedExceptionDictTransformer(
+                    show_locals=self.instrument_config.logging_exception_show_locals,
+                    locals_max_string=self.instrument_config.logging_exception_locals_max_string,
+                    max_frames=self.instrument_config.logging_exception_max_frames,
+                ),
+            )
+            if self.instrument_config.logging_structured_exceptions
+            else structlog.processors.ExceptionRenderer(),
+            dedup_window=self.instrument_config.logging_exception_dedup_window,
+        )
 
     def _unset_handlers(self) -> None:
         for unset_handlers_logger in self.instrument_config.logging_unset_handlers:
@@ -177,31 +570,110 @@ class LoggingInstrument(Instrument[LoggingConfig]):
             structlog.configure(
                 processors=[
                     *structlog.get_config()["processors"][:-1],
-                    redirect_json_log_to_stdlib,  # ensure log is sent to Sentry
+                    forward_event_to_stdlib,  # ensure log is sent to Sentry
                     structlog.get_config()["processors"][-1],
                 ]
             )
             return
+        if self.render_bytes:
+            self._configure_structlog_bytes_loggers()
+            return
+        logger_factory: typing.Final = MemoryLoggerFactory(
+            logging_buffer_capacity=self.instrument_config.logging_buffer_capacity,
+            logging_flush_level=self.instrument_config.logging_flush_level,
+            logging_log_level=self.instrument_config.logging_log_level,
+            log_stream=self.log_stream,
+            logging_buffer_max_size=self.instrument_config.logging_buffer_max_size,
+            logging_buffer_max_age=self.instrument_config.logging_buffer_max_age,
+            logging_logger_levels=self.instrument_config.logging_logger_levels,
+        )
+        self.log_sink = logger_factory.log_sink
         structlog.configure(
-            processors=[
-                structlog.stdlib.filter_by_level,
-                *STRUCTLOG_PRE_CHAIN_PROCESSORS,
-                *self.instrument_config.logging_extra_processors,
-                STRUCTLOG_FORMATTER_PROCESSOR,
-            ],
+            processors=self._add_flight_recorder(
+                [
+                    *self._build_log_rate_limiter(),
+                    *self.pre_chain_processors,
+                    *self.instrument_config.logging_extra_processors,
+                    STRUCTLOG_FORMATTER_PROCESSOR,
+                ],
+            ),
             context_class=dict,
-            logger_factory=MemoryLoggerFactory(
-                logging_buffer_capacity=self.instrument_config.logging_buffer_capacity,
-                logging_flush_level=self.instrument_config.logging_flush_level,
-                logging_log_level=self.instrument_config.logging_log_level,
+            logger_factory=logger_factory,
+            # flight recorder filters levels by itself, after recording events below log level
+            wrapper_class=(
+                structlog.stdlib.BoundLogger if self.flight_recorder else bind_level_filtering_logger  # type: ignore[arg-type]
             ),
-            wrapper_class=structlog.stdlib.BoundLogger,
             cache_logger_on_first_use=True,
         )
 
+    def _configure_structlog_bytes_loggers(self) -> None:
+        self.log_sink = BufferedLogSink(
+            self.log_stream,
+            capacity=self.instrument_config.logging_buffer_capacity,
+            flush_level=self.instrument_config.logging_flush_level,
+            max_size=self.instrument_config.logging_buffer_max_size,
+            max_age=self.instrument_config.logging_buffer_max_age,
+            binary=True,
+        )
+        structlog.configure(
+            processors=self._add_flight_recorder(
+                [
+                    *self._build_log_rate_limiter(),
+                    *self.pre_chain_processors,
+                    *self.instrument_config.logging_extra_processors,
+                    forward_error_event_to_stdlib,
+                    STRUCTLOG_BYTES_FORMATTER_PROCESSOR,
+                ],
+            ),
+            context_class=dict,
+            logger_factory=BufferedBytesLoggerFactory(
+                self.log_sink,
+                log_level=self.instrument_config.logging_log_level,
+                logger_levels=self.instrument_config.logging_logger_levels,
+            ),
+            # flight recorder filters levels by itself, after recording events below log level
+            wrapper_class=(
+                structlog.make_filtering_bound_logger(logging.NOTSET)
+                if self.flight_recorder
+                else bind_level_filtering_logger  # type: ignore[arg-type]
+            ),
+            cache_logger_on_first_use=True,
+        )
+
+    def _build_log_rate_limiter(self) -> list[LogRateLimiter]:
+        # limiter goes first in chain, so dropped events are not processed at all
+        if self.instrument_config.logging_rate_limit_events is None and not self.instrument_config.logging_sample_rates:
+            self.log_rate_limiter = None
+            return []
+        self.log_rate_limiter = LogRateLimiter(
+            events_per_window=self.instrument_config.logging_rate_limit_events,
+            window=self.instrument_config.logging_rate_limit_window,
+            sample_rates=self.instrument_config.logging_sample_rates,
+        )
+        return [self.log_rate_limiter]
+
+    def _add_flight_recorder(self, processors: list[typing.Any]) -> list[typing.Any]:
+        if not self.instrument_config.logging_flight_recorder_size:
+            self.flight_recorder = None
+            return processors
+        self.flight_recorder = FlightRecorder(
+            self.instrument_config.logging_flight_recorder_size,
+            typing.cast("BufferedLogSink", self.log_sink),
+            # exception and span of event are known only when it is logged, not when it is replayed
+            record_processors=(tracer_injection, resolve_exc_info),
+        )
+        self.flight_recorder.processors = processors
+        return [self.flight_recorder, *processors]
+
     def _configure_foreign_loggers(self) -> None:
         root_logger: typing.Final = logging.getLogger()
-        stream_handler: typing.Final = logging.StreamHandler(sys.stdout)
+        # in bytes mode foreign records share buffer with structlog records, so their order is kept
+        stream_handler: typing.Final[logging.Handler] = (
+            typing.cast("BufferedLogSink", self.log_sink)
+            if self.render_bytes
+            # log stream is binary one only in bytes mode
+            else logging.StreamHandler(typing.cast("TextLogStream", self.log_stream))
+        )
         stream_handler.setFormatter(
             structlog.stdlib.ProcessorFormatter(
                 foreign_pre_chain=structlog.get_config()["processors"][:-1],
@@ -212,22 +684,45 @@ class LoggingInstrument(Instrument[LoggingConfig]):
                 logger=root_logger,
             )
             if self.instrument_config.service_debug
-            else structlog.stdlib.ProcessorFormatter(
-                foreign_pre_chain=STRUCTLOG_PRE_CHAIN_PROCESSORS,
-                processors=[
-                    structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-                    STRUCTLOG_FORMATTER_PROCESSOR,
-                ],
-                logger=root_logger,
-            )
+            else ForeignLogFormatter(self.pre_chain_processors, STRUCTLOG_FORMATTER_PROCESSOR, logger=root_logger)
         )
+        if self.instrument_config.logging_logger_levels or self.instrument_config.logging_drop_loggers:
+            stream_handler.addFilter(
+                ForeignLogFilter(
+                    self.instrument_config.logging_logger_levels,
+                    self.instrument_config.logging_drop_loggers,
+                ),
+            )
         root_logger.addHandler(stream_handler)
         root_logger.setLevel(self.instrument_config.logging_log_level)
+        for logger_name, logger_level in self.instrument_config.logging_logger_levels.items():
+            logging.getLogger(logger_name).setLevel(logger_level)
 
     def bootstrap(self) -> None:
+        self.socket_writer = (
+            SocketLogWriter(
+                self.instrument_config.logging_socket_address,
+                framing=self.instrument_config.logging_socket_framing,
+            )
+            if self.instrument_config.logging_socket_address and not self.instrument_config.service_debug
+            else None
+        )
+        if self.instrument_config.logging_background_writer:
+            self.background_writer = BackgroundLogWriter(
+                self.socket_writer or (sys.stdout.buffer if self.render_bytes else sys.stdout),
+                queue_size=self.instrument_config.logging_background_queue_size,
+                overflow_policy=self.instrument_config.logging_overflow_policy,
+            )
         self._unset_handlers()
         self._configure_structlog_loggers()
         self._configure_foreign_loggers()
+        ACCESS_LOG_METHODS.clear()
+        ACCESS_LOG_AGGREGATOR.close()
+        if self.instrument_config.logging_access_log_interval is not None:
+            ACCESS_LOG_AGGREGATOR.start(
+                self.instrument_config.logging_access_log_interval,
+                self.instrument_config.logging_access_log_slow_threshold,
+            )
 
     @classmethod
     def get_config_type(cls) -> type[LoggingConfig]:
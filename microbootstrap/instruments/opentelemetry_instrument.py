@@ -1,12 +1,16 @@
 from __future__ import annotations
 import dataclasses
+import hashlib
 import logging
 import os
+import pathlib
+import sys
+import time
 import typing
 
+import orjson
 import pydantic
 import structlog
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.dependencies import DependencyConflictError
 from opentelemetry.instrumentation.environment_variables import OTEL_PYTHON_DISABLED_INSTRUMENTATIONS
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor  # type: ignore[attr-defined] # noqa: TC002
@@ -18,7 +22,9 @@ from opentelemetry.semconv.resource import ResourceAttributes
 from opentelemetry.trace import format_span_id, set_tracer_provider
 from opentelemetry.util._importlib_metadata import entry_points
 
+from microbootstrap.bootstrap_timings import trace_bootstrap_step
 from microbootstrap.instruments.base import BaseInstrumentConfig, Instrument
+from microbootstrap.instruments.logging_instrument import LoggingInstrument
 
 
 LOGGER_OBJ: typing.Final = structlog.get_logger(__name__)
@@ -64,6 +70,8 @@ class OpentelemetryConfig(BaseInstrumentConfig):
             for one_package_to_exclude in os.environ.get(OTEL_PYTHON_DISABLED_INSTRUMENTATIONS, "").split(",")
         ],
     )
+    opentelemetry_allowed_instrumentations: list[str] = pydantic.Field(default_factory=list)
+    opentelemetry_instrumentors_cache_path: str | None = None
     opentelemetry_log_traces: bool = False
     opentelemetry_generate_health_check_spans: bool = True
 
@@ -95,28 +103,110 @@ def _format_span(readable_span: ReadableSpan) -> str:
     return typing.cast("str", readable_span.to_json(indent=None)) + os.linesep
 
 
+INSTRUMENTOR_LOADED: typing.Final = "loaded"
+INSTRUMENTOR_FAILED: typing.Final = "failed"
+INSTRUMENTOR_CONFLICTED: typing.Final = "conflicted"
+
+
+DISTRIBUTION_METADATA_SUFFIXES: typing.Final = (".dist-info", ".egg-info")
+
+
+def build_distributions_fingerprint() -> str:
+    """Fingerprint installed distributions by names of their metadata directories, e.g. `requests-2.32.3.dist-info`.
+
+    Names hold distribution versions, so listing import path directories is enough, reading metadata is not needed.
+    Current and script directories are skipped, because application, its logs and the cache itself are written there.
+    """
+    fingerprint: typing.Final = hashlib.sha256(sys.executable.encode())
+    for import_path in sys.path[1:]:
+        if not import_path:
+            continue
+        try:
+            path_entries = os.listdir(import_path)  # noqa: PTH208
+        except OSError:
+            continue
+        fingerprint.update(f"{import_path}:".encode())
+        for entry_name in sorted(path_entries):
+            if entry_name.endswith(DISTRIBUTION_METADATA_SUFFIXES):
+                fingerprint.update(f"{entry_name};".encode())
+    return fingerprint.hexdigest()
+
+
+def read_instrumentors_cache(cache_path: str, fingerprint: str) -> dict[str, str]:
+    try:
+        cache_content: typing.Final = orjson.loads(pathlib.Path(cache_path).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    if not isinstance(cache_content, dict) or cache_content.get("fingerprint") != fingerprint:
+        return {}
+    return typing.cast("dict[str, str]", cache_content.get("instrumentors", {}))
+
+
+def write_instrumentors_cache(cache_path: str, fingerprint: str, instrumentors_statuses: dict[str, str]) -> None:
+    cache_file: typing.Final = pathlib.Path(cache_path)
+    temporary_file: typing.Final = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        temporary_file.write_bytes(
+            orjson.dumps({"fingerprint": fingerprint, "instrumentors": instrumentors_statuses}),
+        )
+        # replacing is atomic, so concurrently starting workers never read a partially written cache
+        temporary_file.replace(cache_file)
+    except OSError:
+        LOGGER_OBJ.debug("Writing instrumentors cache failed", cache_path=cache_path)
+
+
 class BaseOpentelemetryInstrument(Instrument[OpentelemetryConfigT]):
     instrument_name = "Opentelemetry"
     ready_condition = "Provide all necessary config parameters"
+    bootstrap_dependencies = (LoggingInstrument,)
+
+    def _load_instrumentor(self, entry_point: typing.Any) -> str:  # noqa: ANN401
+        try:
+            entry_point.load()().instrument(tracer_provider=self.tracer_provider)
+        except DependencyConflictError as exc:
+            LOGGER_OBJ.debug("Skipping instrumentation", entry_point_name=entry_point.name, reason=exc.conflict)
+            return INSTRUMENTOR_CONFLICTED
+        except ModuleNotFoundError:
+            return INSTRUMENTOR_FAILED
+        except ImportError:
+            LOGGER_OBJ.debug("Importing failed, skipping it", entry_point_name=entry_point.name)
+            return INSTRUMENTOR_FAILED
+        except Exception:
+            LOGGER_OBJ.debug("Instrumenting failed", entry_point_name=entry_point.name)
+            raise
+        return INSTRUMENTOR_LOADED
 
     def _load_instrumentors(self) -> None:
+        cache_path: typing.Final = self.instrument_config.opentelemetry_instrumentors_cache_path
+        fingerprint: typing.Final = build_distributions_fingerprint() if cache_path else ""
+        cached_statuses: typing.Final = read_instrumentors_cache(cache_path, fingerprint) if cache_path else {}
+        discovered_statuses: typing.Final = dict(cached_statuses)
+        self.instrumentors_load_durations: dict[str, int] = {}
+
         for entry_point in entry_points(group="opentelemetry_instrumentor"):
             if entry_point.name in self.instrument_config.opentelemetry_disabled_instrumentations:
                 continue
-
-            try:
-                entry_point.load()().instrument(tracer_provider=self.tracer_provider)
-            except DependencyConflictError as exc:
-                LOGGER_OBJ.debug("Skipping instrumentation", entry_point_name=entry_point.name, reason=exc.conflict)
-                continue
-            except ModuleNotFoundError:
+            if (
+                self.instrument_config.opentelemetry_allowed_instrumentations
+                and entry_point.name not in self.instrument_config.opentelemetry_allowed_instrumentations
+            ):
                 continue
-            except ImportError:
-                LOGGER_OBJ.debug("Importing failed, skipping it", entry_point_name=entry_point.name)
+            if cached_statuses.get(entry_point.name, INSTRUMENTOR_LOADED) != INSTRUMENTOR_LOADED:
                 continue
-            except Exception:
-                LOGGER_OBJ.debug("Instrumenting failed", entry_point_name=entry_point.name)
-                raise
+
+            load_start_time = time.perf_counter_ns()
+            with trace_bootstrap_step(f"load instrumentor {entry_point.name}"):
+                discovered_statuses[entry_point.name] = self._load_instrumentor(entry_point)
+            self.instrumentors_load_durations[entry_point.name] = time.perf_counter_ns() - load_start_time
+            LOGGER_OBJ.debug(
+                "Instrumentor processed",
+                entry_point_name=entry_point.name,
+                status=discovered_statuses[entry_point.name],
+                duration=self.instrumentors_load_durations[entry_point.name],
+            )
+
+        if cache_path and discovered_statuses != cached_statuses:
+            write_instrumentors_cache(cache_path, fingerprint, discovered_statuses)
 
     def is_ready(self) -> bool:
         return (
@@ -129,6 +219,23 @@ class BaseOpentelemetryInstrument(Instrument[OpentelemetryConfigT]):
         for instrumentor_with_params in self.instrument_config.opentelemetry_instrumentors:
             instrumentor_with_params.instrumentor.uninstrument(**instrumentor_with_params.additional_params)
 
+    def after_fork(self) -> None:
+        # gRPC channel of inherited exporter must not be used after fork, so it is abandoned, not shut down.
+        # Batch processor clears its queue in child process, so spans of parent are not exported twice.
+        if self.export_span_processor:
+            self.export_span_processor.span_processor = self._build_export_span_processor()
+
+    def _build_export_span_processor(self) -> BatchSpanProcessor:
+        # gRPC exporter is heavy to import, so load it only when traces are actually exported
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter  # noqa: PLC0415
+
+        return BatchSpanProcessor(
+            OTLPSpanExporter(
+                endpoint=self.instrument_config.opentelemetry_endpoint,
+                insecure=self.instrument_config.opentelemetry_insecure,
+            ),
+        )
+
     def bootstrap(self) -> None:
         logging.getLogger("opentelemetry.instrumentation.instrumentor").disabled = True
         logging.getLogger("opentelemetry.trace").disabled = True
@@ -150,15 +257,10 @@ class BaseOpentelemetryInstrument(Instrument[OpentelemetryConfigT]):
 
         if self.instrument_config.opentelemetry_log_traces:
             self.tracer_provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter(formatter=_format_span)))
+        self.export_span_processor: ReplaceableSpanProcessor | None = None
         if self.instrument_config.opentelemetry_endpoint:
-            self.tracer_provider.add_span_processor(
-                BatchSpanProcessor(
-                    OTLPSpanExporter(
-                        endpoint=self.instrument_config.opentelemetry_endpoint,
-                        insecure=self.instrument_config.opentelemetry_insecure,
-                    ),
-                ),
-            )
+            self.export_span_processor = ReplaceableSpanProcessor(self._build_export_span_processor())
+            self.tracer_provider.add_span_processor(self.export_span_processor)
         for opentelemetry_instrumentor in self.instrument_config.opentelemetry_instrumentors:
             opentelemetry_instrumentor.instrumentor.instrument(
                 tracer_provider=self.tracer_provider,
@@ -193,6 +295,25 @@ def _is_root_span(span: ReadableSpan) -> bool:
     return span.parent is None or span.parent.is_remote
 
 
+@dataclasses.dataclass
+class ReplaceableSpanProcessor(SpanProcessor):
+    """Delegates to span processor, that can be replaced after it's added to tracer provider."""
+
+    span_processor: SpanProcessor
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        self.span_processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        self.span_processor.on_end(span)
+
+    def shutdown(self) -> None:
+        self.span_processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.span_processor.force_flush(timeout_millis)
+
+
 # Extended `pyroscope-otel` span processor: https://github.com/grafana/otel-profiling-python/blob/990662d416943e992ab70036b35b27488c98336a/src/pyroscope/otel/__init__.py
 # Includes `span_name` to identify if it makes sense to go to profiles from traces.
 class PyroscopeSpanProcessor(SpanProcessor):
@@ -33,6 +33,10 @@ class PyroscopeInstrument(Instrument[PyroscopeConfig]):
     def teardown(self) -> None:
         pyroscope.shutdown()
 
+    def after_fork(self) -> None:
+        # profiling agent threads are not copied by fork
+        self.bootstrap()
+
     def bootstrap(self) -> None:
         pyroscope.configure(
             application_name=self.instrument_config.opentelemetry_service_name or self.instrument_config.service_name,
@@ -116,8 +116,13 @@ class SentryInstrument(Instrument[SentryConfig]):
         )
         if self.instrument_config.sentry_tags:
             # for sentry<2.1.0
+            # global scope keeps tags visible regardless of the thread instrument is bootstrapped in
             with contextlib.suppress(AttributeError):
-                sentry_sdk.set_tags(self.instrument_config.sentry_tags)
+                sentry_sdk.get_global_scope().set_tags(self.instrument_config.sentry_tags)
+
+    def after_fork(self) -> None:
+        # new client gets new transport with its own worker thread and connection pool
+        self.bootstrap()
 
     @classmethod
     def get_config_type(cls) -> type[SentryConfig]:
@@ -1,28 +1,35 @@
 from __future__ import annotations
 import typing
 
-from microbootstrap.console_writer import ConsoleWriter
+from microbootstrap.bootstrap_timings import BOOTSTRAP_ROOT_SPAN_NAME, TEARDOWN_PHASE, BootstrapTimings
+from microbootstrap.console_writer import build_console_writer
+from microbootstrap.helpers import register_after_fork
 from microbootstrap.instruments.instrument_box import InstrumentBox
 from microbootstrap.instruments.logging_instrument import LoggingInstrument
 from microbootstrap.instruments.opentelemetry_instrument import OpentelemetryInstrument
+from microbootstrap.instruments.prometheus_instrument import PrometheusInstrument
 from microbootstrap.instruments.pyroscope_instrument import PyroscopeInstrument
 from microbootstrap.instruments.sentry_instrument import SentryInstrument
+from microbootstrap.log_writers import publish_log_sink_metrics
 
 
 if typing.TYPE_CHECKING:
     import typing_extensions
 
+    from microbootstrap.console_writer import ConsoleWriterProtocol
     from microbootstrap.instruments.base import Instrument, InstrumentConfigT
     from microbootstrap.settings import InstrumentsSetupperSettings
 
 
 class InstrumentsSetupper:
-    console_writer: ConsoleWriter
+    console_writer: ConsoleWriterProtocol
     instrument_box: InstrumentBox
+    bootstrap_timings: BootstrapTimings
 
     def __init__(self, settings: InstrumentsSetupperSettings) -> None:
         self.settings = settings
-        self.console_writer = ConsoleWriter(writer_enabled=settings.service_debug)
+        self.bootstrap_timings = BootstrapTimings()
+        self.console_writer = build_console_writer(settings, self.bootstrap_timings)
         self.instrument_box.initialize(self.settings)
 
     def configure_instrument(self, instrument_config: InstrumentConfigT) -> typing_extensions.Self:
@@ -49,15 +56,32 @@ class InstrumentsSetupper:
         return cls.instrument_box.extend_instruments
 
     def setup(self) -> None:
+        with self.bootstrap_timings.trace_step(BOOTSTRAP_ROOT_SPAN_NAME):
+            ready_instruments: typing.Final = self.instrument_box.bootstrap_instruments(
+                self.settings.service_bootstrap_workers,
+                self.bootstrap_timings,
+            )
         for instrument in self.instrument_box.instruments:
-            if instrument.is_ready():
-                instrument.bootstrap()
             instrument.write_status(self.console_writer)
+        if any(isinstance(instrument, PrometheusInstrument) for instrument in ready_instruments):
+            self.bootstrap_timings.publish_metrics()
+            for instrument in ready_instruments:
+                if isinstance(instrument, LoggingInstrument) and instrument.log_sink:
+                    publish_log_sink_metrics(instrument.log_sink)
+        self.bootstrap_timings.export_trace()
+        self.console_writer.write_bootstrap_summary()
+        register_after_fork(self.after_fork)
+
+    def after_fork(self) -> None:
+        for instrument in self.instrument_box.instruments:
+            if instrument.is_ready():
+                instrument.after_fork()
 
     def teardown(self) -> None:
         for instrument in self.instrument_box.instruments:
             if instrument.is_ready():
-                instrument.teardown()
+                with self.bootstrap_timings.measure(instrument.instrument_name, TEARDOWN_PHASE):
+                    instrument.teardown()
 
     def __enter__(self) -> None:
         self.setup()
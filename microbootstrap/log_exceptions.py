@@ -0,0 +1,180 @@
+from __future__ import annotations
+import dataclasses
+import hashlib
+import sys
+import threading
+import time
+import types
+import typing
+
+import structlog
+
+
+if typing.TYPE_CHECKING:
+    from structlog.typing import EventDict, ExcInfo, WrappedLogger
+
+
+EXCEPTION_FINGERPRINT_KEY: typing.Final = "exception_fingerprint"
+EXCEPTION_REPEATS_KEY: typing.Final = "exception_repeats"
+MAX_TRACKED_FINGERPRINTS: typing.Final = 1024
+
+
+def get_exc_info(exc_info_value: typing.Any) -> ExcInfo | None:  # noqa: ANN401
+    """Convert `exc_info` event value into exception tuple, like stdlib logging and `format_exc_info` do."""
+    if isinstance(exc_info_value, BaseException):
+        return (type(exc_info_value), exc_info_value, exc_info_value.__traceback__)
+    if isinstance(exc_info_value, tuple):
+        return exc_info_value if exc_info_value[0] is not None else None
+    if exc_info_value:
+        current_exc_info: typing.Final = sys.exc_info()
+        return current_exc_info if current_exc_info[0] is not None else None
+    return None
+
+
+def resolve_exc_info(_: WrappedLogger, __: str, event_dict: EventDict) -> EventDict:
+    """Replace `exc_info=True` with current exception tuple, e.g. before event is kept to be rendered later."""
+    if "exc_info" in event_dict:
+        exc_info: typing.Final = get_exc_info(event_dict["exc_info"])
+        if exc_info is None:
+            del event_dict["exc_info"]
+        else:
+            event_dict["exc_info"] = exc_info
+    return event_dict
+
+
+def get_exception_key(exc_info: ExcInfo) -> tuple[typing.Any, ...]:
+    """Collect exception types and code locations of whole exception chain, but not messages, that often hold ids.
+
+    Key holds code objects, so it is cheap to build and compare in process, but differs between processes.
+    """
+    exception_key: typing.Final[list[typing.Any]] = []
+    seen_exceptions: typing.Final[set[int]] = set()
+    exc_value: BaseException | None = exc_info[1]
+    exc_traceback: types.TracebackType | None = exc_info[2]
+    while exc_value is not None and id(exc_value) not in seen_exceptions:
+        seen_exceptions.add(id(exc_value))
+        exception_key.append(type(exc_value))
+        while exc_traceback is not None:
+            exception_key.extend((exc_traceback.tb_frame.f_code, exc_traceback.tb_lineno))
+            exc_traceback = exc_traceback.tb_next
+        exc_value = exc_value.__cause__ or (None if exc_value.__suppress_context__ else exc_value.__context__)
+        exc_traceback = exc_value.__traceback__ if exc_value is not None else None
+    return tuple(exception_key)
+
+
+def format_exception_fingerprint(exception_key: tuple[typing.Any, ...]) -> str:
+    """Hash exception key into short hex fingerprint, that is the same in all processes."""
+    fingerprint_parts: typing.Final = []
+    for key_part in exception_key:
+        if isinstance(key_part, type):
+            fingerprint_parts.append(f"{key_part.__module__}.{key_part.__qualname__}")
+        elif isinstance(key_part, types.CodeType):
+            fingerprint_parts.append(f"{key_part.co_filename}:{key_part.co_name}")
+        else:
+            fingerprint_parts.append(str(key_part))
+    return hashlib.blake2b("\n".join(fingerprint_parts).encode(), digest_size=8).hexdigest()
+
+
+def get_exception_fingerprint(exc_info: ExcInfo) -> str:
+    return format_exception_fingerprint(get_exception_key(exc_info))
+
+
+def limit_traceback_frames(
+    exc_traceback: types.TracebackType | None,
+    max_frames: int,
+) -> tuple[types.TracebackType | None, int]:
+    """Keep first and last halves of `max_frames` frames, and return new traceback with number of skipped frames."""
+    traceback_frames: typing.Final = []
+    while exc_traceback is not None:
+        traceback_frames.append(exc_traceback)
+        exc_traceback = exc_traceback.tb_next
+    if len(traceback_frames) <= max_frames:
+        return (traceback_frames[0] if traceback_frames else None), 0
+
+    half_frames: typing.Final = max_frames // 2
+    limited_traceback: types.TracebackType | None = None
+    for one_traceback in reversed([*traceback_frames[:half_frames], *traceback_frames[-half_frames:]]):
+        limited_traceback = types.TracebackType(
+            limited_traceback,
+            one_traceback.tb_frame,
+            one_traceback.tb_lasti,
+            one_traceback.tb_lineno,
+        )
+    return limited_traceback, len(traceback_frames) - 2 * half_frames
+
+
+class BoundedExceptionDictTransformer(structlog.tracebacks.ExceptionDictTransformer):
+    """Structured traceback, that drops middle frames before extracting them, not after.
+
+    So deep tracebacks, e.g. of recursion errors, cost as much as short ones.
+    Tracebacks of chained exceptions are still limited by structlog after extraction.
+    """
+
+    def __call__(self, exc_info: ExcInfo) -> list[dict[str, typing.Any]]:
+        limited_traceback, skipped_frames = limit_traceback_frames(exc_info[2], self.max_frames)
+        rendered_stacks: typing.Final = super().__call__((exc_info[0], exc_info[1], limited_traceback))
+        if skipped_frames:
+            rendered_stacks[0]["frames"].insert(
+                self.max_frames // 2,
+                {"filename": "", "lineno": -1, "name": f"Skipped frames: {skipped_frames}"},
+            )
+        return rendered_stacks
+
+
+@dataclasses.dataclass
+class RenderedException:
+    fingerprint: str
+    expires_at: float
+    repeats: int = 0
+
+
+class DeduplicatingExceptionRenderer:
+    """Processor, that renders exception of event, and within `dedup_window` renders identical tracebacks only once.
+
+    Repeated exceptions get only `exception_fingerprint` and `exception_repeats` count, so error storms
+    are not amplified by traceback formatting. First rendered exception gets fingerprint too, to find it by.
+    """
+
+    def __init__(
+        self,
+        exception_renderer: structlog.processors.ExceptionRenderer,
+        dedup_window: float | None = None,
+    ) -> None:
+        self.exception_renderer = exception_renderer
+        self.dedup_window = dedup_window
+        self.rendered_exceptions: dict[tuple[typing.Any, ...], RenderedException] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+        if self.dedup_window is None or "exc_info" not in event_dict:
+            return self.exception_renderer(logger, method_name, event_dict)
+        exc_info: typing.Final = get_exc_info(event_dict.pop("exc_info"))
+        if exc_info is None:
+            return event_dict
+
+        exception_key: typing.Final = get_exception_key(exc_info)
+        current_time: typing.Final = time.monotonic()
+        with self._lock:
+            rendered_exception = self.rendered_exceptions.get(exception_key)
+            if rendered_exception is not None and rendered_exception.expires_at > current_time:
+                rendered_exception.repeats += 1
+                event_dict[EXCEPTION_FINGERPRINT_KEY] = rendered_exception.fingerprint
+                event_dict[EXCEPTION_REPEATS_KEY] = rendered_exception.repeats
+                return event_dict
+            if len(self.rendered_exceptions) >= MAX_TRACKED_FINGERPRINTS:
+                self._remove_expired(current_time)
+            rendered_exception = self.rendered_exceptions[exception_key] = RenderedException(
+                fingerprint=format_exception_fingerprint(exception_key),
+                expires_at=current_time + self.dedup_window,
+            )
+
+        event_dict[EXCEPTION_FINGERPRINT_KEY] = rendered_exception.fingerprint
+        event_dict["exc_info"] = exc_info
+        return self.exception_renderer(logger, method_name, event_dict)
+
+    def _remove_expired(self, current_time: float) -> None:
+        for exception_key, rendered_exception in [*self.rendered_exceptions.items()]:
+            if rendered_exception.expires_at <= current_time:
+                del self.rendered_exceptions[exception_key]
+        if len(self.rendered_exceptions) >= MAX_TRACKED_FINGERPRINTS:
+            self.rendered_exceptions.clear()
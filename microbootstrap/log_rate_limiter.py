@@ -0,0 +1,107 @@
+from __future__ import annotations
+import dataclasses
+import logging
+import math
+import random
+import threading
+import time
+import typing
+
+import structlog
+
+from microbootstrap.log_writers import LOG_METHOD_LEVELS, resolve_logger_setting
+
+
+if typing.TYPE_CHECKING:
+    from structlog.typing import EventDict, WrappedLogger
+
+
+SUPPRESSED_EVENTS_SUMMARY: typing.Final = "Suppressed similar events"
+
+
+@dataclasses.dataclass
+class RateLimitWindow:
+    closes_at: float
+    passed_events: int = 0
+    suppressed_events: int = 0
+
+
+class LogRateLimiter:
+    """Processor, that samples events per logger and limits events with the same name per time window.
+
+    Errors are never dropped. For every window, that suppressed events, one summary is logged once it closes.
+    Closed windows are checked on next event, so dropped events cost a dictionary lookup.
+    """
+
+    def __init__(
+        self,
+        events_per_window: int | None = None,
+        window: float = 1.0,
+        sample_rates: typing.Mapping[str, float] | None = None,
+    ) -> None:
+        self.events_per_window = events_per_window
+        self.window = window
+        self.sample_rates = sample_rates or {}
+        self.logger_sample_rates: dict[str | None, float] = {}
+        self.windows: dict[tuple[str | None, typing.Any], RateLimitWindow] = {}
+        self.next_window_closes_at = math.inf
+        self._lock = threading.Lock()
+
+    def __call__(self, logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+        if LOG_METHOD_LEVELS.get(method_name, logging.INFO) >= logging.ERROR:
+            return event_dict
+        event_name: typing.Final = event_dict.get("event")
+        if event_name == SUPPRESSED_EVENTS_SUMMARY:
+            return event_dict
+
+        logger_name: typing.Final = getattr(logger, "name", None)
+        if self.sample_rates and random.random() >= self._get_sample_rate(logger_name):  # noqa: S311
+            raise structlog.DropEvent
+        if self.events_per_window is None:
+            return event_dict
+
+        current_time: typing.Final = time.monotonic()
+        if current_time >= self.next_window_closes_at:
+            self.write_summaries(current_time)
+        with self._lock:
+            rate_limit_window = self.windows.get((logger_name, event_name))
+            if rate_limit_window is None or rate_limit_window.closes_at <= current_time:
+                rate_limit_window = self.windows[logger_name, event_name] = RateLimitWindow(current_time + self.window)
+                self.next_window_closes_at = min(self.next_window_closes_at, rate_limit_window.closes_at)
+            if rate_limit_window.passed_events >= self.events_per_window:
+                rate_limit_window.suppressed_events += 1
+                raise structlog.DropEvent
+            rate_limit_window.passed_events += 1
+        return event_dict
+
+    def write_summaries(self, current_time: float = math.inf) -> None:
+        """Log summaries of closed windows, all windows are closed by default, e.g. on teardown."""
+        with self._lock:
+            closed_windows: typing.Final = {
+                window_key: rate_limit_window
+                for window_key, rate_limit_window in self.windows.items()
+                if rate_limit_window.closes_at <= current_time
+            }
+            for window_key in closed_windows:
+                del self.windows[window_key]
+            self.next_window_closes_at = min(
+                (rate_limit_window.closes_at for rate_limit_window in self.windows.values()),
+                default=math.inf,
+            )
+
+        for (logger_name, event_name), rate_limit_window in closed_windows.items():
+            if rate_limit_window.suppressed_events:
+                structlog.get_logger(logger_name).warning(
+                    SUPPRESSED_EVENTS_SUMMARY,
+                    suppressed_event=event_name,
+                    suppressed_events=rate_limit_window.suppressed_events,
+                    window=self.window,
+                )
+
+    def _get_sample_rate(self, logger_name: str | None) -> float:
+        try:
+            return self.logger_sample_rates[logger_name]
+        except KeyError:
+            sample_rate: typing.Final = resolve_logger_setting(logger_name, 1.0, self.sample_rates)
+            self.logger_sample_rates[logger_name] = sample_rate
+            return sample_rate
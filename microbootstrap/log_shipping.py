@@ -0,0 +1,195 @@
+from __future__ import annotations
+import collections
+import contextlib
+import errno
+import socket
+import struct
+import threading
+import time
+import typing
+import urllib.parse
+
+
+SOCKET_FRAMING_NEWLINE: typing.Final = "newline"
+SOCKET_FRAMING_LENGTH_PREFIX: typing.Final = "length_prefix"
+SocketFraming = typing.Literal["newline", "length_prefix"]
+LENGTH_PREFIX: typing.Final = struct.Struct(">I")
+# fits into UDP datagram, and into default Unix datagram limits
+MAX_DATAGRAM_SIZE: typing.Final = 60_000
+MAX_PENDING_STREAM_SIZE: typing.Final = 1024 * 1024
+RECONNECT_INTERVAL: typing.Final = 1.0
+
+
+def parse_socket_address(address: str) -> tuple[socket.AddressFamily, socket.SocketKind, typing.Any]:
+    """Parse address like "unix:///run/agent.sock", "unixgram:///run/agent.sock" or "udp://127.0.0.1:5170"."""
+    parsed_address: typing.Final = urllib.parse.urlsplit(address)
+    if parsed_address.scheme in {"unix", "unixgram"} and parsed_address.path:
+        return (
+            socket.AF_UNIX,
+            socket.SOCK_STREAM if parsed_address.scheme == "unix" else socket.SOCK_DGRAM,
+            parsed_address.path,
+        )
+    if parsed_address.scheme == "udp" and parsed_address.hostname and parsed_address.port:
+        return (
+            socket.AF_INET6 if ":" in parsed_address.hostname else socket.AF_INET,
+            socket.SOCK_DGRAM,
+            (parsed_address.hostname, parsed_address.port),
+        )
+    msg: typing.Final = f"Log socket address must be unix://, unixgram:// or udp://host:port, got {address!r}"
+    raise ValueError(msg)
+
+
+class SocketLogWriter:
+    """File-like stream, that ships batches of log lines to local agent, e.g. fluent-bit or vector, over socket.
+
+    Lines are framed by newline or by 4-byte big-endian length prefix. Sends never block: datagrams, that socket can't
+    take, are dropped, and stream frames wait for next batch, up to `MAX_PENDING_STREAM_SIZE` bytes. Records dropped
+    because of that, or while agent is unavailable, are counted in `dropped_records`.
+    """
+
+    def __init__(self, address: str, framing: SocketFraming = SOCKET_FRAMING_NEWLINE) -> None:
+        self.address = address
+        self.framing = framing
+        self.socket_family, self.socket_type, self.socket_address = parse_socket_address(address)
+        self.dropped_records = 0
+        self._lock = threading.Lock()
+        self._socket: socket.socket | None = None
+        self._next_connect_at = 0.0
+        # unsent bytes, and sizes of frames they belong to, to count dropped records
+        self._pending_buffer = bytearray()
+        self._pending_frame_sizes: collections.deque[int] = collections.deque()
+        # number of bytes of first pending frame, that are already sent
+        self._pending_offset = 0
+
+    def write(self, chunk: str | bytes) -> int:
+        encoded_chunk: typing.Final = chunk.encode() if isinstance(chunk, str) else chunk
+        frames: typing.Final = [self._frame_line(one_line) for one_line in encoded_chunk.split(b"\n") if one_line]
+        with self._lock:
+            if self.socket_type == socket.SOCK_DGRAM:
+                self._send_datagrams(frames)
+            else:
+                self._queue_stream_frames(frames)
+                self._send_pending_frames()
+        return len(chunk)
+
+    def flush(self) -> None:
+        """Retry sending stream frames, that socket could not take before."""
+        with self._lock:
+            self._send_pending_frames()
+
+    def close(self) -> None:
+        """Send pending stream frames, waiting for agent at most `RECONNECT_INTERVAL`, and close socket."""
+        with self._lock:
+            agent_socket: typing.Final = self._connect() if self._pending_buffer else None
+            if agent_socket is not None:
+                agent_socket.settimeout(RECONNECT_INTERVAL)
+                with contextlib.suppress(OSError):
+                    agent_socket.sendall(self._pending_buffer)
+                    self._clear_pending_frames()
+            self.dropped_records += len(self._pending_frame_sizes)
+            self._clear_pending_frames()
+            self._disconnect()
+
+    def after_fork(self) -> None:
+        # stream socket shared with parent process would mix frames of both, so child connects by itself
+        with self._lock:
+            self._clear_pending_frames()
+            if self._socket is not None:
+                self._socket.close()
+                self._socket = None
+            self._next_connect_at = 0.0
+
+    def _frame_line(self, line: bytes) -> bytes:
+        if self.framing == SOCKET_FRAMING_LENGTH_PREFIX:
+            return LENGTH_PREFIX.pack(len(line)) + line
+        return line + b"\n"
+
+    def _connect(self) -> socket.socket | None:
+        if self._socket is not None or time.monotonic() < self._next_connect_at:
+            return self._socket
+        agent_socket: typing.Final = socket.socket(self.socket_family, self.socket_type)
+        agent_socket.setblocking(False)
+        try:
+            agent_socket.connect(self.socket_address)
+        except OSError:
+            agent_socket.close()
+            self._next_connect_at = time.monotonic() + RECONNECT_INTERVAL
+            return None
+        self._socket = agent_socket
+        return agent_socket
+
+    def _disconnect(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        self._next_connect_at = time.monotonic() + RECONNECT_INTERVAL
+        # partially sent frame can't be completed on new connection
+        if self._pending_offset:
+            del self._pending_buffer[: self._pending_frame_sizes.popleft() - self._pending_offset]
+            self._pending_offset = 0
+            self.dropped_records += 1
+
+    def _send_datagrams(self, frames: list[bytes]) -> None:
+        datagram_frames: list[bytes] = []
+        datagram_size = 0
+        for one_frame in frames:
+            # record, that doesn't fit into datagram, is dropped alone, and socket is kept
+            if len(one_frame) > MAX_DATAGRAM_SIZE:
+                self.dropped_records += 1
+                continue
+            if datagram_frames and datagram_size + len(one_frame) > MAX_DATAGRAM_SIZE:
+                self._send_datagram(datagram_frames)
+                datagram_frames, datagram_size = [], 0
+            datagram_frames.append(one_frame)
+            datagram_size += len(one_frame)
+        if datagram_frames:
+            self._send_datagram(datagram_frames)
+
+    def _send_datagram(self, frames: list[bytes]) -> None:
+        agent_socket: typing.Final = self._connect()
+        if agent_socket is None:
+            self.dropped_records += len(frames)
+            return
+        try:
+            agent_socket.send(b"".join(frames))
+        except BlockingIOError:
+            self.dropped_records += len(frames)
+        except OSError as exc:
+            self.dropped_records += len(frames)
+            if exc.errno != errno.EMSGSIZE:
+                self._disconnect()
+
+    def _queue_stream_frames(self, frames: list[bytes]) -> None:
+        frame_sizes: typing.Final = [len(one_frame) for one_frame in frames]
+        if len(self._pending_buffer) + sum(frame_sizes) > MAX_PENDING_STREAM_SIZE:
+            self.dropped_records += len(frames)
+            return
+        for one_frame in frames:
+            self._pending_buffer += one_frame
+        self._pending_frame_sizes.extend(frame_sizes)
+
+    def _send_pending_frames(self) -> None:
+        if not self._pending_buffer:
+            return
+        agent_socket: typing.Final = self._connect()
+        if agent_socket is None:
+            return
+        try:
+            sent_size = agent_socket.send(self._pending_buffer)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._disconnect()
+            return
+
+        # trimming from start of bytearray doesn't move remaining bytes every time
+        del self._pending_buffer[:sent_size]
+        sent_size += self._pending_offset
+        while self._pending_frame_sizes and sent_size >= self._pending_frame_sizes[0]:
+            sent_size -= self._pending_frame_sizes.popleft()
+        self._pending_offset = sent_size
+
+    def _clear_pending_frames(self) -> None:
+        self._pending_buffer.clear()
+        self._pending_frame_sizes.clear()
+        self._pending_offset = 0
@@ -0,0 +1,50 @@
+from __future__ import annotations
+import time
+import typing
+
+
+if typing.TYPE_CHECKING:
+    from structlog.typing import EventDict, WrappedLogger
+
+
+TIMESTAMP_SECONDS: typing.Final = "seconds"
+TIMESTAMP_MILLISECONDS: typing.Final = "milliseconds"
+TIMESTAMP_MICROSECONDS: typing.Final = "microseconds"
+TIMESTAMP_EPOCH_NS: typing.Final = "epoch_ns"
+TimestampPrecision = typing.Literal["seconds", "milliseconds", "microseconds", "epoch_ns"]
+TIMESTAMP_FORMAT: typing.Final = "%Y-%m-%d %H:%M:%S"
+NANOSECONDS_IN_SECOND: typing.Final = 1_000_000_000
+
+
+class CachedTimeStamper:
+    """Processor, that adds UTC timestamp like `TimeStamper(fmt="%Y-%m-%d %H:%M:%S")`.
+
+    Formatted second is cached and reused until clock ticks, so `strftime` runs once per second, not per event.
+    Milliseconds and microseconds are appended to cached second, `epoch_ns` adds integer nanoseconds since epoch.
+    """
+
+    def __init__(self, precision: TimestampPrecision = TIMESTAMP_SECONDS, key: str = "timestamp") -> None:
+        self.precision = precision
+        self.key = key
+        # second and its formatted prefix are replaced together, so threads never see them mismatched
+        self._cached_second: tuple[int, str] = (-1, "")
+
+    def __call__(self, _: WrappedLogger, __: str, event_dict: EventDict) -> EventDict:
+        event_dict[self.key] = self.format_time(time.time_ns())
+        return event_dict
+
+    def format_time(self, time_ns: int) -> str | int:
+        if self.precision == TIMESTAMP_EPOCH_NS:
+            return time_ns
+        current_second, nanoseconds = divmod(time_ns, NANOSECONDS_IN_SECOND)
+        cached_second = self._cached_second
+        if cached_second[0] != current_second:
+            cached_second = self._cached_second = (
+                current_second,
+                time.strftime(TIMESTAMP_FORMAT, time.gmtime(current_second)),
+            )
+        if self.precision == TIMESTAMP_MILLISECONDS:
+            return f"{cached_second[1]}.{nanoseconds // 1_000_000:03d}"
+        if self.precision == TIMESTAMP_MICROSECONDS:
+            return f"{cached_second[1]}.{nanoseconds // 1_000:06d}"
+        return cached_second[1]
@@ -0,0 +1,332 @@
+from __future__ import annotations
+import collections
+import contextlib
+import dataclasses
+import functools
+import logging
+import threading
+import time
+import typing
+
+
+if typing.TYPE_CHECKING:
+    from prometheus_client.metrics_core import Metric
+
+    from microbootstrap.log_shipping import SocketLogWriter
+
+
+LOG_OVERFLOW_BLOCK: typing.Final = "block"
+LOG_OVERFLOW_DROP_OLDEST: typing.Final = "drop_oldest"
+LOG_OVERFLOW_DROP_NEWEST: typing.Final = "drop_newest"
+LogOverflowPolicy = typing.Literal["block", "drop_oldest", "drop_newest"]
+LOG_BUFFER_RECORDS_METRIC_NAME: typing.Final = "microbootstrap_log_buffer_records"
+LOG_BUFFER_FLUSHES_METRIC_NAME: typing.Final = "microbootstrap_log_buffer_flushes"
+LOG_METHOD_LEVELS: typing.Final = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "msg": logging.INFO,
+    "warning": logging.WARNING,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "fatal": logging.CRITICAL,
+}
+LogChunk = typing.TypeVar("LogChunk", str, bytes)
+LoggerSetting = typing.TypeVar("LoggerSetting")
+
+
+class TextLogStream(typing.Protocol):
+    """Stream, that string log lines are written to, e.g. stdout or writers of this module."""
+
+    def write(self, chunk: str, /) -> object: ...
+
+    def flush(self) -> object: ...
+
+
+def resolve_logger_setting(
+    logger_name: str | None,
+    default_value: LoggerSetting,
+    logger_settings: typing.Mapping[str, LoggerSetting],
+) -> LoggerSetting:
+    """Find setting of the closest configured parent, e.g. level of "sqlalchemy" for "sqlalchemy.engine"."""
+    while logger_name:
+        if logger_name in logger_settings:
+            return logger_settings[logger_name]
+        logger_name = logger_name.rpartition(".")[0]
+    return default_value
+
+
+def join_log_chunks(log_chunks: list[LogChunk]) -> LogChunk:
+    return (b"" if isinstance(log_chunks[0], bytes) else "").join(log_chunks)
+
+
+class BackgroundLogWriter:
+    """File-like stream, that queues written chunks and writes them to target stream from a dedicated thread.
+
+    Logging from event loop never waits for slow stdout, unless the queue is full and overflow policy is "block".
+    """
+
+    def __init__(
+        self,
+        target_stream: typing.TextIO | typing.BinaryIO | SocketLogWriter,
+        queue_size: int = 10_000,
+        overflow_policy: LogOverflowPolicy = LOG_OVERFLOW_BLOCK,
+    ) -> None:
+        self.target_stream = target_stream
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.dropped_records = 0
+        self._start_writer_thread()
+
+    def _start_writer_thread(self) -> None:
+        self._pending_chunks: collections.deque[typing.Any] = collections.deque()
+        self._condition = threading.Condition()
+        self._closing = False
+        self._closed = False
+        self._writer_thread = threading.Thread(
+            target=self._write_in_background,
+            name="microbootstrap-log-writer",
+            daemon=True,
+        )
+        self._writer_thread.start()
+
+    def write(self, chunk: str | bytes) -> int:
+        with self._condition:
+            if not self._closed and len(self._pending_chunks) >= self.queue_size:
+                if self.overflow_policy == LOG_OVERFLOW_DROP_NEWEST:
+                    self.dropped_records += 1
+                    return len(chunk)
+                if self.overflow_policy == LOG_OVERFLOW_DROP_OLDEST:
+                    self._pending_chunks.popleft()
+                    self.dropped_records += 1
+                else:
+                    self._condition.wait_for(lambda: len(self._pending_chunks) < self.queue_size or self._closed)
+
+            if not self._closed:
+                self._pending_chunks.append(chunk)
+                self._condition.notify_all()
+                return len(chunk)
+
+        # writer thread is stopped, so nothing is reordered by writing synchronously
+        self._write_to_target(chunk)
+        return len(chunk)
+
+    def flush(self) -> None:
+        """Do nothing, writer thread flushes target stream after every batch."""
+
+    def close(self) -> None:
+        """Stop writer thread, after everything queued before is written."""
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        self._writer_thread.join()
+
+    def after_fork(self) -> None:
+        # writer thread is not copied by fork, and chunks queued by parent process are written by parent
+        self._start_writer_thread()
+
+    def _write_to_target(self, chunk: str | bytes) -> None:
+        try:
+            self.target_stream.write(chunk)  # type: ignore[arg-type]
+            self.target_stream.flush()
+        except (OSError, ValueError):
+            return
+
+    def _write_in_background(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending_chunks or self._closing)
+                if not self._pending_chunks:
+                    self._closed = True
+                    self._condition.notify_all()
+                    return
+                pending_chunks = list(self._pending_chunks)
+                self._pending_chunks.clear()
+                self._condition.notify_all()
+
+            self._write_to_target(join_log_chunks(pending_chunks))
+
+
+class BufferedLogSink(logging.Handler):
+    """Buffer shared by all loggers, so records are flushed in the order they were logged, under a single lock.
+
+    Buffer is flushed when it holds `capacity` records or `max_size` characters, when a record of `flush_level` comes,
+    or when its oldest record has waited for `max_age` seconds, so logs are not delayed indefinitely at low traffic.
+    Timer thread is started by the first record left in buffer, so sinks replaced before use do not keep threads.
+    Binary sink keeps lines as bytes, so already encoded lines are not decoded and encoded again.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        target_stream: typing.TextIO | typing.BinaryIO | BackgroundLogWriter | SocketLogWriter,
+        capacity: int,
+        flush_level: int,
+        *,
+        max_size: int | None = None,
+        max_age: float | None = None,
+        binary: bool = False,
+    ) -> None:
+        super().__init__()
+        self.target_stream = target_stream
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self.max_size = max_size
+        self.max_age = max_age
+        self.binary = binary
+        self.buffered_lines: list[typing.Any] = []
+        self.buffered_size = 0
+        self.flush_count = 0
+        self._first_buffered_at = 0.0
+        self._age_condition = threading.Condition(self.lock)
+        self._closed = False
+        self._needs_age_flusher = max_age is not None
+
+    def _start_age_flusher(self) -> None:
+        self._needs_age_flusher = False
+        threading.Thread(target=self._flush_by_age, name="microbootstrap-log-flusher", daemon=True).start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            formatted_line: typing.Final = self.format(record) + "\n"
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+            return
+        self.write_line(formatted_line.encode() if self.binary else formatted_line, record.levelno)
+
+    def write_line(self, line: str | bytes, levelno: int) -> None:
+        with self.lock:  # type: ignore[union-attr]
+            if not self.buffered_lines:
+                self._first_buffered_at = time.monotonic()
+                self._age_condition.notify()
+            self.buffered_lines.append(line)
+            self.buffered_size += len(line)
+            if (
+                len(self.buffered_lines) >= self.capacity
+                or levelno >= self.flush_level
+                or (self.max_size is not None and self.buffered_size >= self.max_size)
+            ):
+                self.flush()
+            elif self._needs_age_flusher:
+                self._start_age_flusher()
+
+    def flush(self) -> None:
+        with self.lock:  # type: ignore[union-attr]
+            if not self.buffered_lines:
+                return
+            buffered_content: typing.Final = join_log_chunks(self.buffered_lines)
+            self.buffered_lines.clear()
+            self.buffered_size = 0
+            self.flush_count += 1
+            with contextlib.suppress(OSError, ValueError):
+                self.target_stream.write(buffered_content)
+                self.target_stream.flush()
+
+    def close(self) -> None:
+        with self.lock:  # type: ignore[union-attr]
+            self._closed = True
+            self._age_condition.notify()
+        self.flush()
+        super().close()
+
+    def after_fork(self) -> None:
+        # records buffered by parent process are flushed by parent, and flusher thread is not copied by fork
+        with self.lock:  # type: ignore[union-attr]
+            self.buffered_lines.clear()
+            self.buffered_size = 0
+        self._age_condition = threading.Condition(self.lock)
+        self._needs_age_flusher = self.max_age is not None
+
+    def _flush_by_age(self) -> None:
+        with self._age_condition:
+            while not self._closed:
+                if not self.buffered_lines:
+                    self._age_condition.wait()
+                    continue
+                remaining_age = self._first_buffered_at + typing.cast("float", self.max_age) - time.monotonic()
+                if remaining_age > 0:
+                    self._age_condition.wait(remaining_age)
+                    continue
+                self.flush()
+
+
+class BufferedBytesLogger:
+    """Structlog logger, that writes lines rendered to bytes straight into binary log sink, skipping stdlib logging."""
+
+    def __init__(self, log_sink: BufferedLogSink, name: str | None = None, level: int = logging.NOTSET) -> None:
+        self.log_sink = log_sink
+        self.name = name
+        self.level = level
+
+    def getEffectiveLevel(self) -> int:  # noqa: N802
+        return self.level
+
+    def __getattr__(self, method_name: str) -> typing.Callable[[bytes], None]:
+        if method_name not in LOG_METHOD_LEVELS:
+            raise AttributeError(method_name)
+        write_message: typing.Final = functools.partial(self._write_message, LOG_METHOD_LEVELS[method_name])
+        setattr(self, method_name, write_message)
+        return write_message
+
+    def _write_message(self, levelno: int, message: bytes) -> None:
+        self.log_sink.write_line(message + b"\n", levelno)
+
+
+class BufferedBytesLoggerFactory:
+    def __init__(
+        self,
+        log_sink: BufferedLogSink,
+        log_level: int = logging.NOTSET,
+        logger_levels: typing.Mapping[str, int] | None = None,
+    ) -> None:
+        self.log_sink = log_sink
+        self.log_level = log_level
+        self.logger_levels = logger_levels or {}
+
+    def __call__(self, *args: typing.Any) -> BufferedBytesLogger:  # noqa: ANN401
+        logger_name: typing.Final = args[0] if args else None
+        return BufferedBytesLogger(
+            self.log_sink,
+            name=logger_name,
+            level=resolve_logger_setting(logger_name, self.log_level, self.logger_levels),
+        )
+
+
+@dataclasses.dataclass(eq=False)
+class LogSinkMetricsCollector:
+    """Prometheus collector, that reads buffer occupancy and flush count of current log sink on every scrape."""
+
+    log_sink: BufferedLogSink | None = None
+
+    def collect(self) -> typing.Iterator[Metric]:
+        if self.log_sink is None:
+            return
+
+        from prometheus_client.metrics_core import CounterMetricFamily, GaugeMetricFamily  # noqa: PLC0415
+
+        yield GaugeMetricFamily(
+            LOG_BUFFER_RECORDS_METRIC_NAME,
+            "Number of log records waiting in buffer",
+            value=len(self.log_sink.buffered_lines),
+        )
+        yield CounterMetricFamily(
+            LOG_BUFFER_FLUSHES_METRIC_NAME,
+            "Number of log buffer flushes",
+            value=self.log_sink.flush_count,
+        )
+
+
+LOG_SINK_METRICS_COLLECTOR: typing.Final = LogSinkMetricsCollector()
+
+
+def publish_log_sink_metrics(log_sink: BufferedLogSink) -> None:
+    """Expose log sink metrics to Prometheus, if `prometheus_client` is installed."""
+    try:
+        import prometheus_client  # noqa: PLC0415
+    except ImportError:  # pragma: no cover
+        return
+
+    LOG_SINK_METRICS_COLLECTOR.log_sink = log_sink
+    # collector may be registered already by previous bootstrap
+    with contextlib.suppress(ValueError):
+        prometheus_client.REGISTRY.register(LOG_SINK_METRICS_COLLECTOR)
@@ -9,6 +9,10 @@ from microbootstrap.helpers import optimize_exclude_paths
 from microbootstrap.instruments.logging_instrument import fill_log_message
 
 
+if typing.TYPE_CHECKING:
+    from starlette.responses import StreamingResponse
+
+
 def build_fastapi_logging_middleware(
     exclude_endpoints: typing.Iterable[str],
 ) -> type[BaseHTTPMiddleware]:
@@ -27,16 +31,28 @@ def build_fastapi_logging_middleware(
 
             start_time: typing.Final = time.perf_counter_ns()
             try:
-                response = await call_next(request)
+                # call_next returns streaming response, that proxies body of inner application
+                response = typing.cast("StreamingResponse", await call_next(request))
             except Exception:  # noqa: BLE001
-                response = fastapi.Response(status_code=500)
+                fill_log_message("exception", request, status.HTTP_500_INTERNAL_SERVER_ERROR, start_time)
+                return fastapi.Response(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-            fill_log_message(
-                "exception" if response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR else "info",
-                request,
-                response.status_code,
-                start_time,
+            log_level: typing.Final = (
+                "exception" if response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR else "info"
             )
+            body_iterator: typing.Final = response.body_iterator
+
+            # body is counted by chunks, because streaming responses have no content-length
+            async def count_response_bytes() -> typing.AsyncIterator[str | bytes | memoryview]:
+                response_bytes = 0
+                try:
+                    async for body_chunk in body_iterator:
+                        response_bytes += len(body_chunk)
+                        yield body_chunk
+                finally:
+                    fill_log_message(log_level, request, response.status_code, start_time, response_bytes)
+
+            response.body_iterator = count_response_bytes()
             return response
 
     return FastAPILoggingMiddleware
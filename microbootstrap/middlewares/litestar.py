@@ -35,15 +35,33 @@ def build_litestar_logging_middleware(
                 return
 
             start_time: typing.Final[int] = time.perf_counter_ns()
+            response_status: int | None = None
+            response_bytes = 0
+
+            def log_response() -> None:
+                nonlocal response_status
+                if response_status is None:
+                    return
+                log_level: str = "info" if response_status < HTTP_500_INTERNAL_SERVER_ERROR else "exception"
+                fill_log_message(log_level, request, response_status, start_time, response_bytes)
+                response_status = None
 
             async def log_message_wrapper(message: litestar.types.Message) -> None:
+                nonlocal response_status, response_bytes
                 if message["type"] == "http.response.start":
-                    status = message["status"]
-                    log_level: str = "info" if status < HTTP_500_INTERNAL_SERVER_ERROR else "exception"
-                    fill_log_message(log_level, request, status, start_time)
+                    response_status = message["status"]
+                elif message["type"] == "http.response.body":
+                    # body is counted by chunks, because streaming responses have no content-length
+                    response_bytes += len(message.get("body", b""))
+                    if not message.get("more_body", False):
+                        log_response()
 
                 await send_function(message)
 
-            await self.app(request_scope, receive, log_message_wrapper)
+            try:
+                await self.app(request_scope, receive, log_message_wrapper)
+            finally:
+                # response may be interrupted before its last body chunk
+                log_response()
 
     return LitestarLoggingMiddleware
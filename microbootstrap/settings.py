@@ -1,8 +1,14 @@
 from __future__ import annotations
+import contextlib
+import functools
+import hashlib
 import os
+import pathlib
 import typing
 
+import orjson
 import pydantic
+import pydantic_core
 import pydantic_settings
 
 from microbootstrap import (
@@ -20,6 +26,10 @@ from microbootstrap import (
 )
 
 
+if typing.TYPE_CHECKING:
+    import typing_extensions
+
+
 SettingsT = typing.TypeVar("SettingsT", bound="BaseServiceSettings")
 ENV_PREFIX_VAR_NAME: typing.Final = "ENVIRONMENT_PREFIX"
 ENV_PREFIX: typing.Final = os.getenv(ENV_PREFIX_VAR_NAME, "")
@@ -40,6 +50,8 @@ class BaseServiceSettings(
         "1.0.0",
         validation_alias=pydantic.AliasChoices("CI_COMMIT_TAG", f"{ENV_PREFIX}SERVICE_VERSION"),
     )
+    service_bootstrap_workers: int = pydantic.Field(default=1, ge=1)
+    service_bootstrap_summary: bool = False
 
     model_config = pydantic_settings.SettingsConfigDict(
         env_file=".env",
@@ -49,12 +61,98 @@ class BaseServiceSettings(
         extra="allow",
     )
 
+    def save_snapshot(self, snapshot_path: str | os.PathLike[str]) -> None:
+        """Save resolved settings, so other processes can load them with `from_snapshot` instead of resolving again.
+
+        Secret values are saved unmasked, and snapshot is readable by its owner only. Settings holding objects, that
+        can't be saved as JSON, e.g. `sentry_integrations` or middleware classes, are not saved, and previous snapshot
+        is removed, so `from_snapshot` resolves them as usual.
+        """
+        snapshot_file: typing.Final = pathlib.Path(snapshot_path)
+        try:
+            # JSON mode would mask secrets, so they are unwrapped from python values before conversion
+            snapshot_values: typing.Final = pydantic_core.to_jsonable_python(
+                unwrap_secret_values(self.model_dump(include=self.model_fields_set)),
+            )
+        except pydantic_core.PydanticSerializationError:
+            snapshot_file.unlink(missing_ok=True)
+            return
+        temporary_file: typing.Final = snapshot_file.with_name(f"{snapshot_file.name}.{os.getpid()}.tmp")
+        temporary_file.touch(mode=0o600)
+        temporary_file.write_bytes(
+            orjson.dumps({"fingerprint": build_settings_fingerprint(type(self)), "values": snapshot_values}),
+        )
+        temporary_file.replace(snapshot_file)
+
+    @classmethod
+    def from_snapshot(cls, snapshot_path: str | os.PathLike[str]) -> typing_extensions.Self:
+        """Load settings saved by `save_snapshot`, skipping environment and `.env` resolution.
+
+        Settings are resolved as usual if the snapshot is missing or the environment has changed since it was saved.
+        """
+        try:
+            snapshot_content: typing.Final = orjson.loads(pathlib.Path(snapshot_path).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return cls()
+        current_fingerprint: typing.Final = build_settings_fingerprint(cls)
+        if not isinstance(snapshot_content, dict) or snapshot_content.get("fingerprint") != current_fingerprint:
+            return cls()
+        # validating into a bare instance bypasses `BaseSettings.__init__`, that invokes settings sources
+        settings_from_snapshot: typing.Final = cls.__new__(cls)
+        cls.__pydantic_validator__.validate_python(snapshot_content["values"], self_instance=settings_from_snapshot)
+        return settings_from_snapshot
+
+
+def unwrap_secret_values(dumped_value: typing.Any) -> typing.Any:  # noqa: ANN401
+    if isinstance(dumped_value, (pydantic.SecretStr, pydantic.SecretBytes)):
+        return dumped_value.get_secret_value()
+    if isinstance(dumped_value, dict):
+        return {one_key: unwrap_secret_values(one_value) for one_key, one_value in dumped_value.items()}
+    if isinstance(dumped_value, (list, tuple, set, frozenset)):
+        return [unwrap_secret_values(one_value) for one_value in dumped_value]
+    return dumped_value
+
+
+@functools.cache
+def collect_environment_names(settings_type: type[BaseServiceSettings]) -> frozenset[str]:
+    """Lowercased names of environment variables, that settings of given type can be resolved from."""
+    env_prefix: typing.Final = settings_type.model_config.get("env_prefix", "")
+    environment_names: typing.Final = {ENV_PREFIX_VAR_NAME}
+    for field_name, field_info in settings_type.model_fields.items():
+        environment_names.add(f"{env_prefix}{field_name}")
+        if field_info.alias:
+            environment_names.add(field_info.alias)
+        if isinstance(field_info.validation_alias, str):
+            environment_names.add(field_info.validation_alias)
+        elif isinstance(field_info.validation_alias, pydantic.AliasChoices):
+            environment_names.update(
+                one_choice for one_choice in field_info.validation_alias.choices if isinstance(one_choice, str)
+            )
+    return frozenset(one_name.lower() for one_name in environment_names)
+
+
+def build_settings_fingerprint(settings_type: type[BaseServiceSettings]) -> str:
+    fingerprint: typing.Final = hashlib.sha256(f"{settings_type.__module__}.{settings_type.__qualname__}".encode())
+    environment_names: typing.Final = collect_environment_names(settings_type)
+    for environment_name, environment_value in sorted(os.environ.items()):
+        if environment_name.lower() in environment_names:
+            fingerprint.update(f"{environment_name}={environment_value};".encode())
+
+    env_files: typing.Final = settings_type.model_config.get("env_file")
+    for one_env_file in env_files if isinstance(env_files, (list, tuple)) else (env_files,):
+        if one_env_file is None:
+            continue
+        with contextlib.suppress(OSError):
+            fingerprint.update(pathlib.Path(one_env_file).read_bytes())
+    return fingerprint.hexdigest()
+
 
 class ServerConfig(pydantic.BaseModel):
     server_host: str = "0.0.0.0"  # noqa: S104
     server_port: int = 8000
     server_reload: bool = True
     server_workers_count: int = 1
+    server_prefork: bool = False
 
 
 class LitestarSettings(  # type: ignore[misc]
@@ -0,0 +1,115 @@
+"""Cost of one access log line, from `fill_log_message` call to written stdout buffer.
+
+"previous" reproduces previous behaviour: path is quoted, request properties are read and logger proxy is resolved
+for every request. "fast path" is the current implementation. Both are measured with string and bytes rendering.
+Stdout is replaced with devnull, so only access log overhead is measured.
+
+Run with ``python -m tests.benchmarks.bench_access_log``.
+"""
+
+from __future__ import annotations
+import functools
+import os
+import sys
+import time
+import typing
+import urllib.parse
+
+import litestar
+import structlog
+
+from microbootstrap import LoggingConfig
+from microbootstrap.instruments.logging_instrument import (
+    ACCESS_LOGGER_NAME,
+    LoggingInstrument,
+    fill_log_message,
+)
+
+
+if typing.TYPE_CHECKING:
+    from litestar.types import HTTPScope
+
+
+LINES_COUNT: typing.Final = 50_000
+HTTP_SCOPE: typing.Final[dict[str, typing.Any]] = {
+    "type": "http",
+    "method": "GET",
+    "path": "/users/1",
+    "query_string": b"page=1",
+    "http_version": "1.1",
+    "client": ("127.0.0.1", 1234),
+    "headers": [],
+}
+
+
+def fill_log_message_previous(
+    access_logger: typing.Any,  # noqa: ANN401
+    log_level: str,
+    request: litestar.Request[typing.Any, typing.Any, typing.Any],
+    status_code: int,
+    start_time: int,
+) -> None:
+    process_time: typing.Final = time.perf_counter_ns() - start_time
+    path_with_query_string: typing.Final = urllib.parse.quote(request.scope["path"])
+    url_with_query: typing.Final = (
+        f"{path_with_query_string}?{request.scope['query_string'].decode('ascii')}"
+        if request.scope["query_string"]
+        else path_with_query_string
+    )
+    client_host: typing.Final = request.client.host if request.client is not None else None
+    client_port: typing.Final = request.client.port if request.client is not None else None
+    http_method: typing.Final = request.method
+    getattr(access_logger, log_level)(
+        f"{http_method} {url_with_query}",
+        http={
+            "url": url_with_query,
+            "status_code": status_code,
+            "method": http_method,
+            "version": request.scope["http_version"],
+        },
+        network={"client": {"ip": client_host, "port": client_port}},
+        duration=process_time,
+    )
+
+
+def measure_line_time(
+    fill_log_function: typing.Callable[..., None],
+    logging_render_bytes: bool,
+) -> float:
+    logging_instrument: typing.Final = LoggingInstrument(
+        LoggingConfig(service_debug=False, logging_render_bytes=logging_render_bytes, logging_buffer_capacity=100),
+    )
+    logging_instrument.bootstrap()
+    request: typing.Final[litestar.Request[typing.Any, typing.Any, typing.Any]] = litestar.Request(
+        typing.cast("HTTPScope", HTTP_SCOPE),
+    )
+    for _ in range(1_000):  # warm up
+        fill_log_function("info", request, 200, time.perf_counter_ns())
+    start_time: typing.Final = time.perf_counter_ns()
+    for _ in range(LINES_COUNT):
+        fill_log_function("info", request, 200, time.perf_counter_ns())
+    line_time: typing.Final = (time.perf_counter_ns() - start_time) / LINES_COUNT
+    logging_instrument.teardown()
+    return line_time
+
+
+def main() -> None:
+    original_stdout: typing.Final = sys.stdout
+    print(f"{'mode':<24}{'ns/line':>10}")  # noqa: T201
+    for render_name, logging_render_bytes in (("string", False), ("bytes", True)):
+        for mode_name, fill_log_function in (
+            # proxy caches logger on first use, so each configuration gets its own proxy
+            ("previous", functools.partial(fill_log_message_previous, structlog.get_logger(ACCESS_LOGGER_NAME))),
+            ("fast path", fill_log_message),
+        ):
+            with open(os.devnull, "w") as devnull_stream:  # noqa: PTH123
+                sys.stdout = devnull_stream
+                try:
+                    line_time = measure_line_time(fill_log_function, logging_render_bytes)
+                finally:
+                    sys.stdout = original_stdout
+            print(f"{f'{mode_name}, {render_name}':<24}{line_time:>10.0f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
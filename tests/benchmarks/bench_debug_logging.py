@@ -0,0 +1,102 @@
+"""Cost of one debug mode log line, forwarded to stdlib logging for Sentry and printed by console renderer.
+
+"previous" reproduces previous behaviour: event is rendered to JSON only to be forwarded to stdlib logger.
+"single render" is the current implementation, that forwards event dict and renders it once for console.
+Stdout is replaced with devnull, so only logging overhead is measured.
+
+Run with ``python -m tests.benchmarks.bench_debug_logging``.
+"""
+
+from __future__ import annotations
+import logging
+import os
+import sys
+import time
+import typing
+
+import structlog
+
+from microbootstrap import LoggingConfig
+from microbootstrap.instruments.logging_instrument import (
+    STRUCTLOG_FORMATTER_PROCESSOR,
+    LoggingInstrument,
+    forward_event_to_stdlib,
+)
+
+
+if typing.TYPE_CHECKING:
+    from structlog.typing import EventDict, WrappedLogger
+
+
+LINES_COUNT: typing.Final = 20_000
+CALLS_COUNT: typing.Final = 100_000
+EVENT_DICT: typing.Final = {
+    "event": "request handled",
+    "user_id": 1,
+    "path": "/users/1",
+    "level": "info",
+    "timestamp": "2026-01-01T00:00:00Z",
+}
+FAKER_STDLIB_LOGGER: typing.Final = logging.getLogger("microbootstrap.structlog")
+
+
+def redirect_json_log_to_stdlib(_: WrappedLogger, __: str, event_dict: EventDict) -> EventDict:
+    getattr(FAKER_STDLIB_LOGGER, event_dict["level"])(
+        STRUCTLOG_FORMATTER_PROCESSOR(_, __, event_dict),
+        exc_info=event_dict.get("exc_info", bool(event_dict.get("exception", False))),
+    )
+    return event_dict
+
+
+def measure_processor_time(forward_processor: typing.Callable[..., EventDict]) -> float:
+    start_time: typing.Final = time.perf_counter_ns()
+    for _ in range(CALLS_COUNT):
+        forward_processor(None, "info", EVENT_DICT.copy())
+    return (time.perf_counter_ns() - start_time) / CALLS_COUNT
+
+
+def measure_line_time(forward_processor: typing.Callable[..., EventDict]) -> float:
+    logging_instrument: typing.Final = LoggingInstrument(LoggingConfig(service_debug=True))
+    logging_instrument.bootstrap()
+    structlog.configure(
+        processors=[
+            forward_processor if one_processor is forward_event_to_stdlib else one_processor
+            for one_processor in structlog.get_config()["processors"]
+        ],
+    )
+    logger: typing.Final = structlog.get_logger("bench")
+    for _ in range(1_000):  # warm up
+        logger.info("request handled", user_id=1, path="/users/1")
+    start_time: typing.Final = time.perf_counter_ns()
+    for line_index in range(LINES_COUNT):
+        logger.info("request handled", user_id=line_index, path="/users/1")
+    line_time: typing.Final = (time.perf_counter_ns() - start_time) / LINES_COUNT
+    logging_instrument.teardown()
+    return line_time
+
+
+def main() -> None:
+    forward_processors: typing.Final = (
+        ("previous", redirect_json_log_to_stdlib),
+        ("single render", forward_event_to_stdlib),
+    )
+    FAKER_STDLIB_LOGGER.setLevel(logging.INFO)
+    print(f"{'forwarding':<16}{'ns/call':>10}")  # noqa: T201
+    for mode_name, forward_processor in forward_processors:
+        print(f"{mode_name:<16}{measure_processor_time(forward_processor):>10.0f}")  # noqa: T201
+    FAKER_STDLIB_LOGGER.setLevel(logging.NOTSET)
+
+    original_stdout: typing.Final = sys.stdout
+    print(f"\n{'log line':<16}{'ns/line':>10}")  # noqa: T201
+    for mode_name, forward_processor in forward_processors:
+        with open(os.devnull, "w") as devnull_stream:  # noqa: PTH123
+            sys.stdout = devnull_stream
+            try:
+                line_time = measure_line_time(forward_processor)
+            finally:
+                sys.stdout = original_stdout
+        print(f"{mode_name:<16}{line_time:>10.0f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
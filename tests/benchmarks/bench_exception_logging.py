@@ -0,0 +1,62 @@
+"""Cost of exception rendering per logged error, for shallow and deep tracebacks.
+
+"format_exc_info" is previous and default behaviour, that formats full traceback text for every error.
+"structured" is `BoundedExceptionDictTransformer` with default 20 frames, "deduplicated" renders
+identical tracebacks once per window, like during error storm, when one downstream failure repeats.
+
+Run with ``python -m tests.benchmarks.bench_exception_logging``.
+"""
+
+from __future__ import annotations
+import time
+import typing
+
+import structlog
+
+from microbootstrap.log_exceptions import BoundedExceptionDictTransformer, DeduplicatingExceptionRenderer
+
+
+CALLS_COUNT: typing.Final = 2_000
+
+
+def raise_nested(depth: int) -> None:
+    if depth == 0:
+        msg: typing.Final = "downstream is unavailable"
+        raise ConnectionError(msg)
+    raise_nested(depth - 1)
+
+
+def catch_exception(depth: int) -> BaseException:
+    try:
+        raise_nested(depth)
+    except ConnectionError as exc:
+        return exc
+    raise AssertionError
+
+
+def measure_render_time(processor: typing.Callable[..., typing.Any], exception: BaseException) -> float:
+    start_time: typing.Final = time.perf_counter_ns()
+    for _ in range(CALLS_COUNT):
+        processor(None, "error", {"event": "request failed", "exc_info": exception})
+    return (time.perf_counter_ns() - start_time) / CALLS_COUNT / 1_000
+
+
+def main() -> None:
+    structured_renderer: typing.Final = structlog.processors.ExceptionRenderer(
+        BoundedExceptionDictTransformer(show_locals=False, max_frames=20),
+    )
+    processors: typing.Final = (
+        ("format_exc_info", structlog.processors.format_exc_info),
+        ("structured", structured_renderer),
+        ("deduplicated text", DeduplicatingExceptionRenderer(structlog.processors.ExceptionRenderer(), 60)),
+        ("deduplicated structured", DeduplicatingExceptionRenderer(structured_renderer, 60)),
+    )
+    print(f"{'renderer':<26}{'depth':>8}{'us/error':>12}")  # noqa: T201
+    for depth in (10, 200):
+        exception = catch_exception(depth)
+        for processor_name, processor in processors:
+            print(f"{processor_name:<26}{depth:>8}{measure_render_time(processor, exception):>12.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Cost of foreign stdlib record, e.g. of httpx or SQLAlchemy, from logger call to written stdout.
+
+"ProcessorFormatter" is previous behaviour: record is copied, and all pre-chain processors run for it.
+"ForeignLogFormatter" builds event dict from record and runs precomputed processor subset.
+"dropped" is record of logger from `logging_drop_loggers`, that is filtered out before formatting.
+
+Run with ``python -m tests.benchmarks.bench_foreign_logging``.
+"""
+
+from __future__ import annotations
+import logging
+import os
+import time
+import typing
+
+import structlog
+
+from microbootstrap.foreign_logs import ForeignLogFilter, ForeignLogFormatter
+from microbootstrap.instruments.logging_instrument import STRUCTLOG_FORMATTER_PROCESSOR, STRUCTLOG_PRE_CHAIN_PROCESSORS
+
+
+RECORDS_COUNT: typing.Final = 50_000
+BENCH_LOGGER: typing.Final = logging.getLogger("bench_foreign")
+BENCH_LOGGER.propagate = False
+BENCH_LOGGER.setLevel(logging.INFO)
+
+
+def measure_record_time(formatter: logging.Formatter, logger_name: str) -> float:
+    logger: typing.Final = logging.getLogger(f"bench_foreign.{logger_name}")
+    with open(os.devnull, "w") as devnull_stream:  # noqa: PTH123
+        stream_handler: typing.Final = logging.StreamHandler(devnull_stream)
+        stream_handler.setFormatter(formatter)
+        stream_handler.addFilter(ForeignLogFilter(dropped_loggers=["bench_foreign.dropped"]))
+        BENCH_LOGGER.handlers = [stream_handler]
+        start_time: typing.Final = time.perf_counter_ns()
+        for record_index in range(RECORDS_COUNT):
+            logger.info("HTTP Request: %s %s %d", "GET", "http://localhost/users", record_index)
+        BENCH_LOGGER.handlers = []
+    return (time.perf_counter_ns() - start_time) / RECORDS_COUNT
+
+
+def main() -> None:
+    formatters: typing.Final = (
+        (
+            "ProcessorFormatter",
+            structlog.stdlib.ProcessorFormatter(
+                foreign_pre_chain=STRUCTLOG_PRE_CHAIN_PROCESSORS,
+                processors=[structlog.stdlib.ProcessorFormatter.remove_processors_meta, STRUCTLOG_FORMATTER_PROCESSOR],
+                logger=logging.getLogger(),
+            ),
+        ),
+        (
+            "ForeignLogFormatter",
+            ForeignLogFormatter(
+                STRUCTLOG_PRE_CHAIN_PROCESSORS, STRUCTLOG_FORMATTER_PROCESSOR, logger=logging.getLogger()
+            ),
+        ),
+    )
+    print(f"{'formatter':<22}{'record':<10}{'ns/record':>12}")  # noqa: T201
+    for formatter_name, formatter in formatters:
+        for logger_name in ("httpx", "dropped"):
+            record_time = measure_record_time(formatter, logger_name)
+            print(f"{formatter_name:<22}{logger_name:<10}{record_time:>12.0f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Cold-start import time of microbootstrap per framework.
+
+Every measurement runs in a fresh interpreter with ``python -X importtime``. The "eager" column imports
+the same entry point plus every dependency that microbootstrap now loads lazily, which is what the
+package used to import unconditionally, so the difference between the columns is the cold-start saving.
+
+Only framework integrations and exporters are deferred. Bootstrappers still import every instrument module, because
+settings validate instrument configs, whose field types and processors come from sentry_sdk, structlog, opentelemetry
+and pyroscope. The last column lists those instrument dependencies, that the entry point still loads.
+
+Run with ``python -m tests.benchmarks.bench_import_time``.
+"""
+
+from __future__ import annotations
+import statistics
+import subprocess
+import sys
+import typing
+
+
+ROUNDS: typing.Final = 5
+INSTRUMENT_DEPENDENCIES: typing.Final = (
+    "sentry_sdk",
+    "structlog",
+    "opentelemetry",
+    "pyroscope",
+    "orjson",
+    "pydantic_settings",
+    "prometheus_client",
+)
+COMMON_DEFERRED_MODULES: typing.Final = ("opentelemetry.exporter.otlp.proto.grpc.trace_exporter",)
+ENTRY_POINTS: typing.Final[dict[str, tuple[str, ...]]] = {
+    "microbootstrap": (
+        "microbootstrap.settings",
+        "microbootstrap.instruments.sentry_instrument",
+        "microbootstrap.instruments.logging_instrument",
+        "microbootstrap.instruments.opentelemetry_instrument",
+        *COMMON_DEFERRED_MODULES,
+    ),
+    "microbootstrap.bootstrappers.litestar": (
+        "sentry_sdk.integrations.litestar",
+        "opentelemetry.instrumentation.asgi",
+        "litestar.contrib.opentelemetry.config",
+        "litestar.contrib.prometheus",
+        "litestar_offline_docs",
+        *COMMON_DEFERRED_MODULES,
+    ),
+    "microbootstrap.bootstrappers.fastapi": (
+        "fastapi_offline_docs",
+        "opentelemetry.instrumentation.fastapi",
+        "prometheus_fastapi_instrumentator",
+        *COMMON_DEFERRED_MODULES,
+    ),
+    "microbootstrap.bootstrappers.faststream": (
+        "prometheus_client",
+        "faststream._internal.logger.logger_proxy",
+        *COMMON_DEFERRED_MODULES,
+    ),
+}
+
+
+def run_with_import_time(modules_to_import: typing.Sequence[str]) -> list[str]:
+    """Import the given modules in a fresh interpreter and return its ``-X importtime`` lines."""
+    import_statement: typing.Final = "; ".join(f"import {one_module}" for one_module in modules_to_import)
+    completed_process: typing.Final = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", import_statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return [one_line for one_line in completed_process.stderr.splitlines() if one_line.startswith("import time:")]
+
+
+def measure_import_time_us(modules_to_import: typing.Sequence[str]) -> int:
+    """Return cumulative import time (in microseconds) of the given modules in a fresh interpreter."""
+    total_time_us = 0
+    for one_line in run_with_import_time(modules_to_import):
+        if "|" not in one_line:
+            continue
+        _, cumulative_time, imported_name = one_line.split(":", 1)[1].split("|")
+        # nested imports are indented in the tree, only top-level ones are summed up
+        if cumulative_time.strip().isdigit() and not imported_name.removeprefix(" ").startswith(" "):
+            total_time_us += int(cumulative_time)
+    return total_time_us
+
+
+def collect_loaded_dependencies(entry_point: str) -> list[str]:
+    imported_packages: typing.Final = {
+        one_line.rsplit("|", 1)[-1].strip().split(".")[0] for one_line in run_with_import_time([entry_point])
+    }
+    return [one_dependency for one_dependency in INSTRUMENT_DEPENDENCIES if one_dependency in imported_packages]
+
+
+def median_import_time_ms(modules_to_import: typing.Sequence[str]) -> float:
+    return statistics.median(measure_import_time_us(modules_to_import) for _ in range(ROUNDS)) / 1000
+
+
+def main() -> None:
+    print(f"{'entry point':<45}{'lazy, ms':>12}{'eager, ms':>12}{'saved, ms':>12}  still loaded")  # noqa: T201
+    for entry_point, deferred_modules in ENTRY_POINTS.items():
+        lazy_time: float = median_import_time_ms([entry_point])
+        eager_time: float = median_import_time_ms([entry_point, *deferred_modules])
+        saved_time: float = eager_time - lazy_time
+        loaded_dependencies = ", ".join(collect_loaded_dependencies(entry_point)) or "-"
+        print(f"{entry_point:<45}{lazy_time:>12.1f}{eager_time:>12.1f}{saved_time:>12.1f}  {loaded_dependencies}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
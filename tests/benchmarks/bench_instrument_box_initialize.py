@@ -0,0 +1,66 @@
+"""Time and allocations of ``InstrumentBox.initialize`` per framework.
+
+"validated" reproduces previous behaviour: every instrument config is validated from a full ``settings.model_dump()``.
+"projected" is the current implementation.
+
+Run with ``python -m tests.benchmarks.bench_instrument_box_initialize``.
+"""
+
+from __future__ import annotations
+import functools
+import timeit
+import tracemalloc
+import typing
+
+from microbootstrap.bootstrappers.fastapi import FastApiBootstrapper
+from microbootstrap.bootstrappers.faststream import FastStreamBootstrapper
+from microbootstrap.bootstrappers.litestar import LitestarBootstrapper
+from microbootstrap.settings import FastApiSettings, FastStreamSettings, LitestarSettings
+
+
+if typing.TYPE_CHECKING:
+    from microbootstrap.instruments.instrument_box import InstrumentBox
+    from microbootstrap.settings import BaseServiceSettings
+
+
+ROUNDS: typing.Final = 2000
+FRAMEWORKS: typing.Final[dict[str, tuple[InstrumentBox, BaseServiceSettings]]] = {
+    "litestar": (LitestarBootstrapper.instrument_box, LitestarSettings()),
+    "fastapi": (FastApiBootstrapper.instrument_box, FastApiSettings()),
+    "faststream": (FastStreamBootstrapper.instrument_box, FastStreamSettings()),
+}
+
+
+def initialize_validated(instrument_box: InstrumentBox, settings: BaseServiceSettings) -> None:
+    settings_dump: typing.Final = settings.model_dump()
+    instrument_box.__initialized_instruments__ = [
+        instrument_type(instrument_type.get_config_type()(**settings_dump))
+        for instrument_type in instrument_box.__instruments__
+    ]
+
+
+def initialize_projected(instrument_box: InstrumentBox, settings: BaseServiceSettings) -> None:
+    instrument_box.initialize(settings)
+
+
+def measure_allocated_kib(initializer: typing.Callable[[], None]) -> float:
+    tracemalloc.start()
+    initializer()
+    _, peak_size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_size / 1024
+
+
+def main() -> None:
+    print(f"{'framework':<12}{'mode':<12}{'us/call':>10}{'peak KiB':>10}")  # noqa: T201
+    for framework_name, (instrument_box, settings) in FRAMEWORKS.items():
+        for mode_name, initializer in (("validated", initialize_validated), ("projected", initialize_projected)):
+            run_initializer = functools.partial(initializer, instrument_box, settings)
+            run_initializer()  # warm up caches
+            call_time = timeit.timeit(run_initializer, number=ROUNDS) / ROUNDS
+            allocated_kib = measure_allocated_kib(run_initializer)
+            print(f"{framework_name:<12}{mode_name:<12}{call_time * 1e6:>10.1f}{allocated_kib:>10.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Per-request overhead of Litestar OpenTelemetry middleware.
+
+"per request" reproduces previous behaviour: ASGI middleware and excluded urls are built for every request.
+"cached" is the current implementation.
+Spans are recorded by SDK tracer provider without processors, so only middleware overhead is measured.
+
+Run with ``python -m tests.benchmarks.bench_litestar_opentelemetry_middleware``.
+"""
+
+from __future__ import annotations
+import asyncio
+import time
+import typing
+
+from litestar.contrib.opentelemetry.config import OpenTelemetryConfig as LitestarOpentelemetryConfig
+from opentelemetry.sdk.trace import TracerProvider
+
+from microbootstrap.bootstrappers.litestar import LitestarOpenTelemetryInstrumentationMiddleware
+
+
+if typing.TYPE_CHECKING:
+    from litestar.types import HTTPRequestEvent, Message, Receive, Scope, Send
+
+
+REQUESTS_COUNT: typing.Final = 20_000
+HTTP_SCOPE: typing.Final[dict[str, typing.Any]] = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/users/1",
+    "path_template": "/users/{user_id}",
+    "raw_path": b"/users/1",
+    "query_string": b"",
+    "root_path": "",
+    "headers": [(b"host", b"localhost")],
+    "client": ("127.0.0.1", 1234),
+    "server": ("127.0.0.1", 8000),
+}
+
+
+async def next_app(_: Scope, __: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+async def receive() -> HTTPRequestEvent:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(_: Message) -> None:
+    return None
+
+
+class PerRequestMiddleware(LitestarOpenTelemetryInstrumentationMiddleware):
+    async def handle(self, scope: Scope, receive: Receive, send: Send, next_app: typing.Any) -> None:  # noqa: ANN401
+        from opentelemetry.util.http import get_excluded_urls  # noqa: PLC0415
+
+        self.excluded_urls = get_excluded_urls(self.config.exclude_urls_env_key)
+        await self.create_open_telemetry_middleware(next_app)(scope, receive, send)  # type: ignore[arg-type]
+
+
+async def measure_request_time(middleware: LitestarOpenTelemetryInstrumentationMiddleware) -> float:
+    for _ in range(100):  # warm up
+        await middleware.handle(dict(HTTP_SCOPE), receive, send, next_app)  # type: ignore[arg-type]
+    start_time: typing.Final = time.perf_counter()
+    for _ in range(REQUESTS_COUNT):
+        await middleware.handle(dict(HTTP_SCOPE), receive, send, next_app)  # type: ignore[arg-type]
+    return (time.perf_counter() - start_time) / REQUESTS_COUNT
+
+
+def main() -> None:
+    opentelemetry_config: typing.Final = LitestarOpentelemetryConfig(tracer_provider=TracerProvider())
+    print(f"{'mode':<14}{'us/request':>12}{'max RPS':>12}")  # noqa: T201
+    for mode_name, middleware_type in (
+        ("per request", PerRequestMiddleware),
+        ("cached", LitestarOpenTelemetryInstrumentationMiddleware),
+    ):
+        request_time = asyncio.run(measure_request_time(middleware_type(opentelemetry_config)))
+        print(f"{mode_name:<14}{request_time * 1e6:>12.1f}{1 / request_time:>12.0f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
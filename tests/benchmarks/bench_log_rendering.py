@@ -0,0 +1,55 @@
+"""Throughput of production structlog rendering, from logger call to written stdout buffer.
+
+"string" renders orjson bytes to str and writes them through stdlib logger and text stdout.
+"bytes" keeps orjson bytes end-to-end and writes newline-joined batches to binary stdout buffer.
+Stdout is replaced with devnull, so only rendering and buffering are measured.
+
+Run with ``python -m tests.benchmarks.bench_log_rendering``.
+"""
+
+from __future__ import annotations
+import os
+import sys
+import time
+import typing
+
+import structlog
+
+from microbootstrap import LoggingConfig
+from microbootstrap.instruments.logging_instrument import LoggingInstrument
+
+
+LINES_COUNT: typing.Final = 100_000
+
+
+def measure_lines_per_second(logging_render_bytes: bool) -> float:
+    logging_instrument: typing.Final = LoggingInstrument(
+        LoggingConfig(service_debug=False, logging_render_bytes=logging_render_bytes, logging_buffer_capacity=100),
+    )
+    logging_instrument.bootstrap()
+    logger: typing.Final = structlog.get_logger("bench")
+    for _ in range(1_000):  # warm up
+        logger.info("request handled", user_id=1, path="/users/1")
+    start_time: typing.Final = time.perf_counter()
+    for line_index in range(LINES_COUNT):
+        logger.info("request handled", user_id=line_index, path="/users/1")
+    lines_per_second: typing.Final = LINES_COUNT / (time.perf_counter() - start_time)
+    logging_instrument.teardown()
+    return lines_per_second
+
+
+def main() -> None:
+    original_stdout: typing.Final = sys.stdout
+    print(f"{'mode':<10}{'lines/sec':>12}")  # noqa: T201
+    for mode_name, logging_render_bytes in (("string", False), ("bytes", True)):
+        with open(os.devnull, "w") as devnull_stream:  # noqa: PTH123
+            sys.stdout = devnull_stream
+            try:
+                lines_per_second = measure_lines_per_second(logging_render_bytes)
+            finally:
+                sys.stdout = original_stdout
+        print(f"{mode_name:<10}{lines_per_second:>12.0f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
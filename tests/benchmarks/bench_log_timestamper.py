@@ -0,0 +1,83 @@
+"""Cost of timestamp processor per event, and of whole log line with each of them.
+
+"TimeStamper" is stock structlog processor, that was used before and calls `strftime` for every event.
+"cached ..." is `CachedTimeStamper` with each precision, it formats second once and reuses it until clock ticks.
+Whole log lines are rendered by production processors and written to devnull.
+
+Run with ``python -m tests.benchmarks.bench_log_timestamper``.
+"""
+
+from __future__ import annotations
+import os
+import sys
+import time
+import typing
+
+import structlog
+
+from microbootstrap import LoggingConfig
+from microbootstrap.instruments.logging_instrument import STRUCTLOG_PRE_CHAIN_PROCESSORS, LoggingInstrument
+from microbootstrap.log_timestamper import CachedTimeStamper
+
+
+CALLS_COUNT: typing.Final = 200_000
+LINES_COUNT: typing.Final = 50_000
+STOCK_TIME_STAMPER: typing.Final = structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S")
+
+
+def measure_processor_time(processor: typing.Callable[..., typing.Any]) -> float:
+    start_time: typing.Final = time.perf_counter_ns()
+    for _ in range(CALLS_COUNT):
+        processor(None, "info", {})
+    return (time.perf_counter_ns() - start_time) / CALLS_COUNT
+
+
+def measure_line_time(time_stamper: typing.Any) -> float:  # noqa: ANN401
+    time_stamper_index: typing.Final = next(
+        processor_index
+        for processor_index, one_processor in enumerate(STRUCTLOG_PRE_CHAIN_PROCESSORS)
+        if isinstance(one_processor, CachedTimeStamper)
+    )
+    original_time_stamper: typing.Final = STRUCTLOG_PRE_CHAIN_PROCESSORS[time_stamper_index]
+    STRUCTLOG_PRE_CHAIN_PROCESSORS[time_stamper_index] = time_stamper
+    logging_instrument: typing.Final = LoggingInstrument(
+        LoggingConfig(service_debug=False, logging_render_bytes=True, logging_buffer_capacity=100),
+    )
+    logging_instrument.bootstrap()
+    try:
+        logger = structlog.get_logger("bench")
+        start_time = time.perf_counter_ns()
+        for line_index in range(LINES_COUNT):
+            logger.info("request handled", user_id=line_index)
+        return (time.perf_counter_ns() - start_time) / LINES_COUNT
+    finally:
+        logging_instrument.teardown()
+        STRUCTLOG_PRE_CHAIN_PROCESSORS[time_stamper_index] = original_time_stamper
+
+
+def main() -> None:
+    time_stampers: typing.Final = (
+        ("TimeStamper", STOCK_TIME_STAMPER),
+        ("cached seconds", CachedTimeStamper("seconds")),
+        ("cached milliseconds", CachedTimeStamper("milliseconds")),
+        ("cached microseconds", CachedTimeStamper("microseconds")),
+        ("cached epoch_ns", CachedTimeStamper("epoch_ns")),
+    )
+    print(f"{'processor':<22}{'ns/call':>10}")  # noqa: T201
+    for processor_name, time_stamper in time_stampers:
+        print(f"{processor_name:<22}{measure_processor_time(time_stamper):>10.0f}")  # noqa: T201
+
+    original_stdout: typing.Final = sys.stdout
+    print(f"\n{'log line':<22}{'ns/line':>10}")  # noqa: T201
+    for processor_name, time_stamper in time_stampers[:2]:
+        with open(os.devnull, "w") as devnull_stream:  # noqa: PTH123
+            sys.stdout = devnull_stream
+            try:
+                line_time = measure_line_time(time_stamper)
+            finally:
+                sys.stdout = original_stdout
+        print(f"{processor_name:<22}{line_time:>10.0f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
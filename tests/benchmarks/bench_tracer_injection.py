@@ -0,0 +1,92 @@
+"""Cost of tracer injection and of whole log line, with and without active span.
+
+"previous" reproduces previous behaviour of `tracer_injection`: span ids are formatted for every log line.
+"cached" is the current implementation, that formats ids once per span.
+Whole log lines are rendered by production processors and written to devnull.
+
+Run with ``python -m tests.benchmarks.bench_tracer_injection``.
+"""
+
+from __future__ import annotations
+import contextlib
+import os
+import sys
+import time
+import typing
+
+import structlog
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+
+from microbootstrap import LoggingConfig
+from microbootstrap.instruments.logging_instrument import LoggingInstrument, tracer_injection
+
+
+if typing.TYPE_CHECKING:
+    from structlog.typing import EventDict, WrappedLogger
+
+
+CALLS_COUNT: typing.Final = 200_000
+LINES_COUNT: typing.Final = 20_000
+TRACER: typing.Final = TracerProvider().get_tracer(__name__)
+
+
+def tracer_injection_previous(_: WrappedLogger, __: str, event_dict: EventDict) -> EventDict:
+    current_span = trace.get_current_span()
+    if not current_span.is_recording():
+        event_dict["tracing"] = {}
+        return event_dict
+
+    current_span_context = current_span.get_span_context()
+    event_dict["tracing"] = {
+        "span_id": trace.format_span_id(current_span_context.span_id),
+        "trace_id": trace.format_trace_id(current_span_context.trace_id),
+    }
+    return event_dict
+
+
+def open_span(in_span: bool) -> typing.ContextManager[typing.Any]:
+    return TRACER.start_as_current_span("bench") if in_span else contextlib.nullcontext()
+
+
+def measure_processor_time(processor: typing.Callable[..., EventDict], in_span: bool) -> float:
+    with open_span(in_span):
+        start_time: typing.Final = time.perf_counter_ns()
+        for _ in range(CALLS_COUNT):
+            processor(None, "info", {})
+        return (time.perf_counter_ns() - start_time) / CALLS_COUNT
+
+
+def measure_line_time(in_span: bool) -> float:
+    logger: typing.Final = structlog.get_logger("bench")
+    with open_span(in_span):
+        start_time: typing.Final = time.perf_counter_ns()
+        for line_index in range(LINES_COUNT):
+            logger.info("request handled", user_id=line_index)
+        return (time.perf_counter_ns() - start_time) / LINES_COUNT
+
+
+def main() -> None:
+    print(f"{'processor':<22}{'ns/call':>10}")  # noqa: T201
+    for mode_name, processor in (("previous", tracer_injection_previous), ("cached", tracer_injection)):
+        for span_name, in_span in (("no span", False), ("in span", True)):
+            processor_time = measure_processor_time(processor, in_span)
+            print(f"{f'{mode_name}, {span_name}':<22}{processor_time:>10.0f}")  # noqa: T201
+
+    original_stdout: typing.Final = sys.stdout
+    print(f"\n{'log line':<22}{'ns/line':>10}")  # noqa: T201
+    for span_name, in_span in (("no span", False), ("in span", True)):
+        with open(os.devnull, "w") as devnull_stream:  # noqa: PTH123
+            sys.stdout = devnull_stream
+            logging_instrument = LoggingInstrument(LoggingConfig(service_debug=False, logging_buffer_capacity=100))
+            logging_instrument.bootstrap()
+            try:
+                line_time = measure_line_time(in_span)
+            finally:
+                logging_instrument.teardown()
+                sys.stdout = original_stdout
+        print(f"{span_name:<22}{line_time:>10.0f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 from __future__ import annotations
+import dataclasses
 import importlib
+import io
+import logging
+import sys
 import typing
 from unittest.mock import AsyncMock, MagicMock
 
 import litestar
+import orjson
 import pytest
 from prometheus_client import REGISTRY
 from sentry_sdk.transport import Transport as SentryTransport
@@ -17,10 +22,12 @@ from microbootstrap import (
     OpentelemetryConfig,
     SentryConfig,
 )
+from microbootstrap.bootstrap_timings import get_bootstrap_duration_gauge
 from microbootstrap.console_writer import ConsoleWriter
 from microbootstrap.instruments import opentelemetry_instrument
 from microbootstrap.instruments.cors_instrument import CorsConfig
 from microbootstrap.instruments.health_checks_instrument import HealthChecksConfig
+from microbootstrap.instruments.logging_instrument import LoggingInstrument
 from microbootstrap.instruments.prometheus_instrument import BasePrometheusConfig
 from microbootstrap.instruments.swagger_instrument import SwaggerConfig
 from microbootstrap.settings import BaseServiceSettings, ServerConfig
@@ -61,6 +68,43 @@ def minimal_logging_config() -> LoggingConfig:
     return LoggingConfig(service_debug=False)
 
 
+@dataclasses.dataclass
+class LoggingCapture:
+    logging_instrument: LoggingInstrument
+    target_stream: io.TextIOWrapper
+    is_torn_down: bool = False
+
+    def teardown(self) -> None:
+        # tests tear logging down themselves to flush buffered records, so it is done only once
+        if not self.is_torn_down:
+            self.is_torn_down = True
+            self.logging_instrument.teardown()
+
+    def read_log_lines(self) -> list[dict[str, typing.Any]]:
+        return [orjson.loads(one_line) for one_line in self.target_stream.buffer.getvalue().splitlines()]  # type: ignore[attr-defined]
+
+
+@pytest.fixture
+def bootstrap_logging(monkeypatch: pytest.MonkeyPatch) -> typing.Iterator[typing.Callable[..., LoggingCapture]]:
+    target_stream: typing.Final = io.TextIOWrapper(io.BytesIO(), write_through=True)
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    logging_captures: typing.Final[list[LoggingCapture]] = []
+
+    def bootstrap(**logging_settings: typing.Any) -> LoggingCapture:  # noqa: ANN401
+        # pytest replaces stdout after fixtures are set up, so it is patched when test bootstraps logging
+        monkeypatch.setattr(sys, "stdout", target_stream)
+        logging_instrument: typing.Final = LoggingInstrument(
+            LoggingConfig(**{"service_debug": False, "logging_buffer_capacity": 0, **logging_settings}),
+        )
+        logging_instrument.bootstrap()
+        logging_captures.append(LoggingCapture(logging_instrument, target_stream))
+        return logging_captures[-1]
+
+    yield bootstrap
+    for one_capture in logging_captures:
+        one_capture.teardown()
+
+
 @pytest.fixture
 def minimal_base_prometheus_config() -> BasePrometheusConfig:
     return BasePrometheusConfig()
@@ -146,3 +190,5 @@ def patch_out_entry_points(monkeypatch: pytest.MonkeyPatch) -> None:
 def clean_prometheus_registry() -> None:
     REGISTRY._names_to_collectors.clear()  # noqa: SLF001
     REGISTRY._collector_to_names.clear()  # noqa: SLF001
+    # gauge is registered once per process, so it is created again for clean registry
+    get_bootstrap_duration_gauge.cache_clear()
@@ -1,15 +1,19 @@
+import threading
+import time
 import typing
+from unittest import mock
 
+import pydantic
 import pytest
 
-from microbootstrap.exceptions import MissingInstrumentError
-from microbootstrap.instruments.base import Instrument
+from microbootstrap.exceptions import InstrumentDependencyError, MissingInstrumentError
+from microbootstrap.instruments.base import BaseInstrumentConfig, Instrument
 from microbootstrap.instruments.instrument_box import InstrumentBox
 from microbootstrap.instruments.logging_instrument import LoggingInstrument
 from microbootstrap.instruments.opentelemetry_instrument import OpentelemetryInstrument
 from microbootstrap.instruments.prometheus_instrument import BasePrometheusConfig, PrometheusInstrument
 from microbootstrap.instruments.sentry_instrument import SentryConfig, SentryInstrument
-from microbootstrap.settings import BaseServiceSettings
+from microbootstrap.settings import BaseServiceSettings, LitestarSettings
 
 
 @pytest.mark.parametrize(
@@ -68,3 +72,120 @@ def test_instrument_box_extend_instruments() -> None:
     instrument_box.extend_instruments(TestSentryInstrument)
     assert len(instrument_box.__instruments__) == 1
     assert issubclass(instrument_box.__instruments__[0], TestSentryInstrument)
+
+
+class RecordingConfig(BaseInstrumentConfig):
+    bootstrap_events: list[str] = pydantic.Field(default_factory=list)
+
+
+class RecordingInstrument(Instrument[RecordingConfig]):
+    instrument_name = "Recording"
+    ready_condition = "Always ready"
+
+    def is_ready(self) -> bool:
+        return True
+
+    def bootstrap(self) -> None:
+        time.sleep(0.05)
+        self.instrument_config.bootstrap_events.append(self.instrument_name)
+
+    @classmethod
+    def get_config_type(cls) -> type[RecordingConfig]:
+        return RecordingConfig
+
+
+class FirstRecordingInstrument(RecordingInstrument):
+    instrument_name = "First"
+
+
+class SecondRecordingInstrument(RecordingInstrument):
+    instrument_name = "Second"
+    bootstrap_dependencies = (FirstRecordingInstrument,)
+
+
+class ThirdRecordingInstrument(RecordingInstrument):
+    instrument_name = "Third"
+
+
+def make_recording_box(instrument_types: list[type[RecordingInstrument]]) -> tuple[InstrumentBox, list[str]]:
+    bootstrap_events: typing.Final[list[str]] = []
+    instrument_box: typing.Final = InstrumentBox()
+    instrument_box.__initialized_instruments__ = [
+        instrument_type(RecordingConfig.model_construct(bootstrap_events=bootstrap_events))
+        for instrument_type in instrument_types
+    ]
+    return instrument_box, bootstrap_events
+
+
+def test_instrument_box_bootstrap_respects_dependencies() -> None:
+    instrument_box, bootstrap_events = make_recording_box(
+        [SecondRecordingInstrument, ThirdRecordingInstrument, FirstRecordingInstrument],
+    )
+
+    ready_instruments: typing.Final = instrument_box.bootstrap_instruments(max_workers=3)
+
+    assert ready_instruments == instrument_box.instruments
+    assert bootstrap_events.index("First") < bootstrap_events.index("Second")
+    assert sorted(bootstrap_events) == ["First", "Second", "Third"]
+
+
+def test_instrument_box_bootstrap_runs_independent_instruments_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    # barrier is passed only if both instruments bootstrap at the same time, and is broken by timeout otherwise
+    bootstrap_barrier: typing.Final = threading.Barrier(2, timeout=5)
+
+    def bootstrap_together(self: RecordingInstrument) -> None:
+        bootstrap_barrier.wait()
+        self.instrument_config.bootstrap_events.append(self.instrument_name)
+
+    monkeypatch.setattr(RecordingInstrument, "bootstrap", bootstrap_together)
+    instrument_box, bootstrap_events = make_recording_box([FirstRecordingInstrument, ThirdRecordingInstrument])
+
+    instrument_box.bootstrap_instruments(max_workers=2)
+
+    assert sorted(bootstrap_events) == ["First", "Third"]
+
+
+def test_instrument_box_bootstrap_detects_dependency_cycle(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(FirstRecordingInstrument, "bootstrap_dependencies", (SecondRecordingInstrument,))
+    instrument_box, bootstrap_events = make_recording_box([FirstRecordingInstrument, SecondRecordingInstrument])
+
+    with pytest.raises(InstrumentDependencyError):
+        instrument_box.bootstrap_instruments(max_workers=2)
+    assert not bootstrap_events
+
+
+def test_instrument_box_initialize_matches_validated_configs() -> None:
+    settings: typing.Final = LitestarSettings(
+        service_debug=False,
+        sentry_dsn="https://examplePublicKey@o0.ingest.sentry.io/0",
+        logging_exclude_endpoints=["/health/"],
+    )
+    instrument_box: typing.Final = InstrumentBox()
+    instrument_box.__instruments__ = [SentryInstrument, LoggingInstrument, OpentelemetryInstrument]
+    instrument_box.initialize(settings)
+
+    for one_instrument in instrument_box.instruments:
+        config_type = one_instrument.get_config_type()
+        assert one_instrument.instrument_config == config_type(**settings.model_dump())
+    assert instrument_box.instruments[1].instrument_config.logging_exclude_endpoints == ["/health"]
+
+
+def test_instrument_box_initialize_does_not_share_containers_with_settings() -> None:
+    settings: typing.Final = LitestarSettings()
+    instrument_box: typing.Final = InstrumentBox()
+    instrument_box.__instruments__ = [SentryInstrument]
+    instrument_box.initialize(settings)
+
+    instrument_box.instruments[0].instrument_config.sentry_integrations.append(mock.Mock())
+
+    assert settings.sentry_integrations == []
+
+
+def test_instrument_box_initialize_validates_configs_missing_from_settings(
+    base_settings: BaseServiceSettings,
+) -> None:
+    instrument_box: typing.Final = InstrumentBox()
+    instrument_box.__instruments__ = [LoggingInstrument]
+    instrument_box.initialize(base_settings)
+
+    assert instrument_box.instruments[0].instrument_config.logging_exclude_endpoints == ["/health", "/metrics"]
@@ -1,11 +1,17 @@
+import collections
 import logging
+import math
+import sys
+import time
 import typing
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from unittest import mock
 
 import fastapi
 import litestar
+import orjson
 import pytest
+import structlog
 from fastapi.testclient import TestClient as FastAPITestClient
 from faststream.redis import RedisBroker, TestRedisBroker
 from litestar.testing import TestClient as LitestarTestClient
@@ -19,10 +25,24 @@ from microbootstrap.bootstrappers.faststream import FastStreamBootstrapper
 from microbootstrap.bootstrappers.litestar import LitestarBootstrapper, LitestarLoggingInstrument
 from microbootstrap.config.faststream import FastStreamConfig
 from microbootstrap.config.litestar import LitestarConfig
-from microbootstrap.instruments.logging_instrument import LoggingInstrument, MemoryLoggerFactory
+from microbootstrap.instruments.logging_instrument import (
+    ACCESS_LOG_METHODS,
+    DURATION_BUCKETS_PER_SHIFT,
+    LoggingInstrument,
+    MemoryLoggerFactory,
+    fill_log_message,
+    get_duration_bucket,
+    get_duration_percentile,
+    log_nothing,
+    tracer_injection,
+)
 from microbootstrap.settings import FastApiSettings, FastStreamSettings, LitestarSettings
 
 
+if typing.TYPE_CHECKING:
+    from litestar.types import HTTPScope
+
+
 def test_logging_is_ready(minimal_logging_config: LoggingConfig) -> None:
     logging_instrument: typing.Final = LoggingInstrument(minimal_logging_config)
     assert logging_instrument.is_ready()
@@ -119,6 +139,75 @@ def test_litestar_logging_bootstrap_tracer_injection(minimal_logging_config: Log
             test_client.get("/test-handler")
 
 
+def test_tracer_injection_caches_ids_per_span() -> None:
+    tracer: typing.Final = TracerProvider().get_tracer(__name__)
+    with tracer.start_as_current_span("first_span") as first_span:
+        first_tracing: typing.Final = tracer_injection(None, "info", {})["tracing"]
+        assert tracer_injection(None, "info", {})["tracing"] is first_tracing
+        assert first_tracing == {
+            "span_id": trace.format_span_id(first_span.get_span_context().span_id),
+            "trace_id": trace.format_trace_id(first_span.get_span_context().trace_id),
+        }
+        with tracer.start_as_current_span("second_span"):
+            second_tracing: typing.Final = tracer_injection(None, "info", {})["tracing"]
+        assert second_tracing["span_id"] != first_tracing["span_id"]
+        assert second_tracing["trace_id"] == first_tracing["trace_id"]
+        assert tracer_injection(None, "info", {})["tracing"] == first_tracing
+
+    assert tracer_injection(None, "info", {})["tracing"] == {}
+
+
+def test_debug_logs_are_forwarded_to_stdlib_unrendered(monkeypatch: pytest.MonkeyPatch) -> None:
+    forwarded_records: typing.Final[list[logging.LogRecord]] = []
+    monkeypatch.setattr(
+        logging.getLogger("microbootstrap.structlog"),
+        "handlers",
+        [mock.Mock(level=logging.NOTSET, handle=forwarded_records.append)],
+    )
+    logging_instrument: typing.Final = LoggingInstrument(LoggingConfig(service_debug=True))
+    logging_instrument.bootstrap()
+    structlog.get_logger("debug").error("debug message", answer=42)
+    logging_instrument.teardown()
+
+    assert len(forwarded_records) == 1
+    assert forwarded_records[0].getMessage() == "debug message"
+    assert forwarded_records[0].levelno == logging.ERROR
+    assert forwarded_records[0].structlog_event["answer"] == 42  # type: ignore[attr-defined]  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("logging_render_bytes", [True, False])
+def test_logger_levels(monkeypatch: pytest.MonkeyPatch, logging_render_bytes: bool) -> None:
+    target_stream: typing.Final = TextIOWrapper(BytesIO(), write_through=True)
+    monkeypatch.setattr(sys, "stdout", target_stream)
+    logging_instrument: typing.Final = LoggingInstrument(
+        LoggingConfig(
+            service_debug=False,
+            logging_buffer_capacity=0,
+            logging_render_bytes=logging_render_bytes,
+            logging_logger_levels={"noisy": logging.WARNING, "verbose": logging.DEBUG},
+        ),
+    )
+    logging_instrument.bootstrap()
+    default_logger: typing.Final = structlog.get_logger("default").bind()
+    assert type(default_logger).debug in {log_nothing, structlog.make_filtering_bound_logger(logging.INFO).debug}
+
+    default_logger.debug("default debug")
+    default_logger.info("default info")
+    structlog.get_logger("noisy.child").info("noisy info")
+    structlog.get_logger("noisy.child").warning("noisy warning")
+    structlog.get_logger("verbose").debug("verbose debug")
+    structlog.get_logger("verbose").log(logging.DEBUG, "verbose log")
+    default_logger.log(logging.DEBUG, "default log")
+    logging_instrument.teardown()
+
+    assert [orjson.loads(one_line)["event"] for one_line in target_stream.buffer.getvalue().splitlines()] == [
+        "default info",
+        "noisy warning",
+        "verbose debug",
+        "verbose log",
+    ]
+
+
 def test_memory_logger_factory_info() -> None:
     test_capacity: typing.Final = 10
     test_flush_level: typing.Final = logging.ERROR
@@ -195,6 +284,143 @@ def test_fastapi_logging_bootstrap_ignores_health(
     assert fill_log_mock.call_count == 0
 
 
+def test_fill_log_message(capsys: pytest.CaptureFixture[str]) -> None:
+    logging_instrument: typing.Final = LoggingInstrument(LoggingConfig(service_debug=False, logging_buffer_capacity=0))
+    logging_instrument.bootstrap()
+    request: typing.Final[litestar.Request[typing.Any, typing.Any, typing.Any]] = litestar.Request(
+        typing.cast(
+            "HTTPScope",
+            {
+                "type": "http",
+                "method": "GET",
+                "path": "/users/john doe",
+                "query_string": b"page=1",
+                "http_version": "1.1",
+                "client": ("127.0.0.1", 1234),
+                "headers": [],
+            },
+        ),
+    )
+    fill_log_message("info", request, 200, time.perf_counter_ns())
+    fill_log_message("info", request, 200, time.perf_counter_ns())
+
+    access_log_line: typing.Final = orjson.loads(capsys.readouterr().out.splitlines()[-1])
+    assert access_log_line["event"] == "GET /users/john%20doe?page=1"
+    assert access_log_line["logger"] == "api.access"
+    assert access_log_line["http"] == {
+        "url": "/users/john%20doe?page=1",
+        "status_code": 200,
+        "method": "GET",
+        "version": "1.1",
+    }
+    assert access_log_line["network"] == {"client": {"ip": "127.0.0.1", "port": 1234}}
+    assert list(ACCESS_LOG_METHODS) == ["info"]
+
+    logging_instrument.bootstrap()
+    assert not ACCESS_LOG_METHODS
+    logging_instrument.teardown()
+
+
+def test_litestar_access_log_aggregation(capsys: pytest.CaptureFixture[str]) -> None:
+    @litestar.get("/users/{user_id:int}")
+    async def get_user(user_id: int) -> str:
+        return f"user {user_id}"
+
+    @litestar.get("/fail")
+    async def fail() -> None:
+        raise RuntimeError
+
+    @litestar.get("/stream")
+    async def stream() -> litestar.response.Stream:
+        return litestar.response.Stream(iter([b"first", b"second"]))
+
+    application: typing.Final = (
+        LitestarBootstrapper(
+            LitestarSettings(service_debug=False, logging_buffer_capacity=0, logging_access_log_interval=60),
+        )
+        .configure_application(LitestarConfig(route_handlers=[get_user, fail, stream]))
+        .bootstrap()
+    )
+    with LitestarTestClient(application) as test_client:
+        for user_id in range(3):
+            test_client.get(f"/users/{user_id}")
+        test_client.get("/fail")
+        test_client.get("/stream")
+
+    access_log_lines: typing.Final = [
+        orjson.loads(one_line)
+        for one_line in capsys.readouterr().out.splitlines()
+        if one_line.startswith("{") and '"logger":"api.access"' in one_line
+    ]
+    assert [one_line["event"] for one_line in access_log_lines] == [
+        "GET /fail",
+        "GET /users/{user_id} 2xx",
+        "GET /fail 5xx",
+        "GET /stream 2xx",
+    ]
+    users_summary: typing.Final = access_log_lines[1]
+    assert users_summary["http"] == {"route": "/users/{user_id}", "method": "GET", "status_class": "2xx"}
+    assert users_summary["count"] == 3  # noqa: PLR2004
+    assert users_summary["error_count"] == 0
+    assert users_summary["bytes"] == len("user 0") * 3
+    assert users_summary["duration"]["p50"] <= users_summary["duration"]["p99"]
+    assert access_log_lines[2]["error_count"] == 1
+    assert access_log_lines[3]["bytes"] == len("firstsecond")
+
+
+@pytest.mark.parametrize("percentile", [0.5, 0.95, 0.99])
+def test_access_log_duration_percentile(percentile: float) -> None:
+    durations: typing.Final = [one_duration * 1_000 + 7 for one_duration in range(1, 1_001)]
+    duration_buckets: typing.Final = collections.Counter(map(get_duration_bucket, durations))
+    exact_percentile: typing.Final = durations[math.ceil(len(durations) * percentile) - 1]
+
+    assert (
+        exact_percentile
+        <= get_duration_percentile(duration_buckets, len(durations), percentile)
+        <= exact_percentile * (1 + 1 / DURATION_BUCKETS_PER_SHIFT)
+    )
+
+
+def test_fastapi_access_log_aggregation(capsys: pytest.CaptureFixture[str]) -> None:
+    application: typing.Final = FastApiBootstrapper(
+        FastApiSettings(
+            service_debug=False,
+            logging_buffer_capacity=0,
+            logging_access_log_interval=60,
+            logging_access_log_slow_threshold=0,
+        ),
+    ).bootstrap()
+
+    @application.get("/users/{user_id}")
+    async def get_user(user_id: int) -> str:
+        return f"user {user_id}"
+
+    @application.get("/stream")
+    async def stream() -> fastapi.responses.StreamingResponse:
+        return fastapi.responses.StreamingResponse(iter([b"first", b"second"]))
+
+    with FastAPITestClient(application) as test_client:
+        test_client.get("/users/1")
+        test_client.get("/missing")
+        test_client.get("/stream")
+
+    access_log_lines: typing.Final = [
+        orjson.loads(one_line)
+        for one_line in capsys.readouterr().out.splitlines()
+        if one_line.startswith("{") and '"logger":"api.access"' in one_line
+    ]
+    assert [one_line["event"] for one_line in access_log_lines] == [
+        "GET /users/1",
+        "GET /missing",
+        "GET /stream",
+        "GET /users/{user_id} 2xx",
+        "GET <unmatched> 4xx",
+        "GET /stream 2xx",
+    ]
+    assert access_log_lines[3]["bytes"] == len('"user 1"')
+    assert access_log_lines[5]["bytes"] == len("firstsecond")
+
+
 class TestForeignLogs:
     def test_litestar(self, capsys: pytest.CaptureFixture[str]) -> None:
         logger = logging.getLogger()
@@ -1,4 +1,6 @@
 import contextlib
+import pathlib
+import sys
 import typing
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
@@ -104,6 +106,37 @@ def test_litestar_opentelemetry_bootstrap_working(
         assert async_mock.called
 
 
+def test_litestar_opentelemetry_middleware_is_built_once_per_route(
+    minimal_opentelemetry_config: OpentelemetryConfig,
+) -> None:
+    test_opentelemetry_instrument: typing.Final = LitestarOpentelemetryInstrument(minimal_opentelemetry_config)
+    test_opentelemetry_instrument.bootstrap()
+    opentelemetry_bootstrap_result: typing.Final = test_opentelemetry_instrument.bootstrap_before()
+    opentelemetry_middleware: typing.Final = opentelemetry_bootstrap_result["middleware"][0]
+
+    @litestar.get("/test-handler")
+    async def test_handler() -> None:
+        return None
+
+    litestar_application: typing.Final = litestar.Litestar(
+        route_handlers=[test_handler],
+        **opentelemetry_bootstrap_result,
+    )
+    with (
+        patch.object(
+            opentelemetry_middleware,
+            "create_open_telemetry_middleware",
+            wraps=opentelemetry_middleware.create_open_telemetry_middleware,
+        ) as create_middleware_mock,
+        LitestarTestClient(app=litestar_application) as test_client,
+    ):
+        for _ in range(3):
+            assert test_client.get("/test-handler").is_success
+
+    assert create_middleware_mock.call_count == 1
+    assert len(opentelemetry_middleware.open_telemetry_middlewares) == 1
+
+
 def test_fastapi_opentelemetry_bootstrap_working(
     minimal_opentelemetry_config: OpentelemetryConfig, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -169,3 +202,97 @@ def test_instrumentors_loader(
 
     with pytest.raises(ValueError):  # noqa: PT011
         opentelemetry_instrument.OpentelemetryInstrument(instrument_config=minimal_opentelemetry_config).bootstrap()
+
+
+def make_entry_point(name: str, load_error: type[Exception] | None = None) -> MagicMock:
+    entry_point: typing.Final = MagicMock(load=MagicMock(side_effect=load_error))
+    entry_point.name = name
+    return entry_point
+
+
+def test_instrumentors_cache_skips_not_viable_instrumentors(
+    minimal_opentelemetry_config: OpentelemetryConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    minimal_opentelemetry_config.opentelemetry_instrumentors_cache_path = str(tmp_path / "instrumentors.json")
+    entry_points: typing.Final = [
+        make_entry_point("loaded"),
+        make_entry_point("failed", ModuleNotFoundError),
+        make_entry_point("conflicted", DependencyConflictError(mock.Mock())),  # type: ignore[arg-type]
+    ]
+    monkeypatch.setattr(opentelemetry_instrument, "entry_points", MagicMock(return_value=entry_points))
+
+    first_instrument: typing.Final = OpentelemetryInstrument(instrument_config=minimal_opentelemetry_config)
+    first_instrument.bootstrap()
+    assert set(first_instrument.instrumentors_load_durations) == {"loaded", "failed", "conflicted"}
+    assert opentelemetry_instrument.read_instrumentors_cache(
+        minimal_opentelemetry_config.opentelemetry_instrumentors_cache_path,
+        opentelemetry_instrument.build_distributions_fingerprint(),
+    ) == {"loaded": "loaded", "failed": "failed", "conflicted": "conflicted"}
+
+    for one_entry_point in entry_points:
+        one_entry_point.load.reset_mock()
+    second_instrument: typing.Final = OpentelemetryInstrument(instrument_config=minimal_opentelemetry_config)
+    second_instrument.bootstrap()
+    assert set(second_instrument.instrumentors_load_durations) == {"loaded"}
+    assert [one_entry_point.load.called for one_entry_point in entry_points] == [True, False, False]
+
+
+def test_instrumentors_cache_is_invalidated_by_fingerprint(
+    minimal_opentelemetry_config: OpentelemetryConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    cache_path: typing.Final = str(tmp_path / "instrumentors.json")
+    opentelemetry_instrument.write_instrumentors_cache(cache_path, "outdated", {"failed": "failed"})
+    minimal_opentelemetry_config.opentelemetry_instrumentors_cache_path = cache_path
+    entry_point: typing.Final = make_entry_point("failed")
+    monkeypatch.setattr(opentelemetry_instrument, "entry_points", MagicMock(return_value=[entry_point]))
+
+    OpentelemetryInstrument(instrument_config=minimal_opentelemetry_config).bootstrap()
+
+    assert entry_point.load.called
+    assert opentelemetry_instrument.read_instrumentors_cache(
+        cache_path, opentelemetry_instrument.build_distributions_fingerprint()
+    ) == {"failed": "loaded"}
+
+
+def test_instrumentors_cache_on_import_path_is_hit(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(sys, "path", [str(tmp_path), "", *sys.path, str(tmp_path)])
+    cache_path: typing.Final = str(tmp_path / "instrumentors.json")
+    fingerprint: typing.Final = opentelemetry_instrument.build_distributions_fingerprint()
+    opentelemetry_instrument.write_instrumentors_cache(cache_path, fingerprint, {"failed": "failed"})
+    (tmp_path / "application.log").touch()
+
+    assert opentelemetry_instrument.build_distributions_fingerprint() == fingerprint
+    assert opentelemetry_instrument.read_instrumentors_cache(cache_path, fingerprint) == {"failed": "failed"}
+
+    (tmp_path / "installed-1.0.dist-info").mkdir()
+    assert opentelemetry_instrument.build_distributions_fingerprint() != fingerprint
+
+
+def test_instrumentors_allow_list(
+    minimal_opentelemetry_config: OpentelemetryConfig,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    minimal_opentelemetry_config.opentelemetry_allowed_instrumentations = ["allowed"]
+    entry_points: typing.Final = [make_entry_point("allowed"), make_entry_point("not_allowed")]
+    monkeypatch.setattr(opentelemetry_instrument, "entry_points", MagicMock(return_value=entry_points))
+
+    OpentelemetryInstrument(instrument_config=minimal_opentelemetry_config).bootstrap()
+
+    assert [one_entry_point.load.called for one_entry_point in entry_points] == [True, False]
+
+
+def test_opentelemetry_after_fork_replaces_export_processor(
+    minimal_opentelemetry_config: OpentelemetryConfig,
+) -> None:
+    opentelemetry_instrument: typing.Final = OpentelemetryInstrument(minimal_opentelemetry_config)
+    opentelemetry_instrument.bootstrap()
+    assert opentelemetry_instrument.export_span_processor
+    inherited_span_processor: typing.Final = opentelemetry_instrument.export_span_processor.span_processor
+
+    opentelemetry_instrument.after_fork()
+
+    assert opentelemetry_instrument.export_span_processor.span_processor is not inherited_span_processor
@@ -6,6 +6,7 @@ from unittest import mock
 
 import litestar
 import pytest
+import sentry_sdk
 import structlog
 from litestar.testing import TestClient as LitestarTestClient
 
@@ -53,6 +54,16 @@ def test_sentry_teardown(
     assert sentry_instrument.teardown() is None  # type: ignore[func-returns-value]
 
 
+def test_sentry_after_fork_creates_new_client(minimal_sentry_config: SentryConfig) -> None:
+    sentry_instrument: typing.Final = SentryInstrument(minimal_sentry_config)
+    sentry_instrument.bootstrap()
+    inherited_client: typing.Final = sentry_sdk.get_client()
+
+    sentry_instrument.after_fork()
+
+    assert sentry_sdk.get_client() is not inherited_client
+
+
 def test_litestar_sentry_bootstrap(minimal_sentry_config: SentryConfig) -> None:
     sentry_instrument: typing.Final = LitestarSentryInstrument(minimal_sentry_config)
     sentry_instrument.bootstrap()
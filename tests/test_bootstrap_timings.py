@@ -0,0 +1,164 @@
+import typing
+from unittest import mock
+
+import orjson
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from prometheus_client import REGISTRY
+
+from microbootstrap import LitestarSettings
+from microbootstrap.bootstrap_timings import (
+    APPLICATION_CONSTRUCTION_PHASE,
+    APPLICATION_ITEM_NAME,
+    BOOTSTRAP_AFTER_PHASE,
+    BOOTSTRAP_BEFORE_PHASE,
+    BOOTSTRAP_DURATION_METRIC_NAME,
+    BOOTSTRAP_PHASE,
+    BOOTSTRAP_ROOT_SPAN_NAME,
+    TEARDOWN_PHASE,
+    BootstrapSpan,
+    BootstrapTimings,
+    trace_bootstrap_step,
+)
+from microbootstrap.bootstrappers.litestar import LitestarBootstrapper
+from microbootstrap.console_writer import ConsoleWriter
+from microbootstrap.instruments_setupper import InstrumentsSetupper
+from microbootstrap.settings import InstrumentsSetupperSettings
+
+
+@pytest.fixture
+def span_exporter(monkeypatch: pytest.MonkeyPatch) -> InMemorySpanExporter:
+    span_exporter: typing.Final = InMemorySpanExporter()
+    tracer_provider: typing.Final = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    monkeypatch.setattr(trace, "get_tracer_provider", lambda: tracer_provider)
+    return span_exporter
+
+
+def test_bootstrap_timings_measure_accumulates() -> None:
+    bootstrap_timings: typing.Final = BootstrapTimings()
+    for _ in range(2):
+        with bootstrap_timings.measure("Logging", BOOTSTRAP_PHASE):
+            pass
+    with bootstrap_timings.measure("Logging", BOOTSTRAP_AFTER_PHASE):
+        pass
+
+    assert set(bootstrap_timings.durations["Logging"]) == {BOOTSTRAP_PHASE, BOOTSTRAP_AFTER_PHASE}
+    assert bootstrap_timings.get_total_duration("Logging") == sum(bootstrap_timings.durations["Logging"].values())
+    assert bootstrap_timings.get_total_duration("Missing") == 0
+
+
+def test_bootstrap_timings_json_report() -> None:
+    bootstrap_timings: typing.Final = BootstrapTimings(durations={"Logging": {BOOTSTRAP_PHASE: 1_500_000}})
+    assert orjson.loads(bootstrap_timings.to_json()) == {"unit": "ms", "items": {"Logging": {BOOTSTRAP_PHASE: 1.5}}}
+
+
+def test_bootstrap_timings_publish_metrics() -> None:
+    bootstrap_timings: typing.Final = BootstrapTimings(durations={"Logging": {BOOTSTRAP_PHASE: 2_000_000_000}})
+    bootstrap_timings.publish_metrics()
+    bootstrap_timings.publish_metrics()
+
+    assert REGISTRY.get_sample_value(BOOTSTRAP_DURATION_METRIC_NAME, {"item": "Logging", "phase": "bootstrap"}) == 2.0  # noqa: PLR2004
+
+
+def test_bootstrapper_records_every_phase() -> None:
+    bootstrapper: typing.Final = LitestarBootstrapper(LitestarSettings(service_debug=False))
+    bootstrapper.bootstrap()
+    bootstrapper.teardown()
+
+    assert set(bootstrapper.bootstrap_timings.durations["Logging"]) == {
+        BOOTSTRAP_PHASE,
+        BOOTSTRAP_BEFORE_PHASE,
+        BOOTSTRAP_AFTER_PHASE,
+        TEARDOWN_PHASE,
+    }
+    assert set(bootstrapper.bootstrap_timings.durations[APPLICATION_ITEM_NAME]) == {APPLICATION_CONSTRUCTION_PHASE}
+    assert TEARDOWN_PHASE in orjson.loads(bootstrapper.bootstrap_timings.to_json())["items"]["Logging"]
+
+
+def test_instruments_setupper_records_teardown() -> None:
+    instruments_setupper: typing.Final = InstrumentsSetupper(InstrumentsSetupperSettings(service_debug=False))
+    with instruments_setupper:
+        pass
+
+    assert set(instruments_setupper.bootstrap_timings.durations["Logging"]) == {BOOTSTRAP_PHASE, TEARDOWN_PHASE}
+    assert TEARDOWN_PHASE in orjson.loads(instruments_setupper.bootstrap_timings.to_json())["items"]["Logging"]
+
+
+@pytest.mark.parametrize(("prometheus_metrics_path", "is_published"), [("/metrics", True), ("", False)])
+def test_bootstrapper_publishes_metrics_only_with_prometheus(
+    monkeypatch: pytest.MonkeyPatch,
+    prometheus_metrics_path: str,
+    is_published: bool,
+) -> None:
+    monkeypatch.setattr(BootstrapTimings, "publish_metrics", publish_metrics_mock := mock.Mock())
+    LitestarBootstrapper(
+        LitestarSettings(service_debug=False, prometheus_metrics_path=prometheus_metrics_path),
+    ).bootstrap()
+
+    assert publish_metrics_mock.called is is_published
+
+
+def test_console_writer_shows_durations() -> None:
+    console_writer: typing.Final = ConsoleWriter(
+        bootstrap_timings=BootstrapTimings(durations={"Logging": {BOOTSTRAP_PHASE: 1_500_000}}),
+    )
+    console_writer.write_instrument_status("Logging", is_enabled=True)
+    console_writer.write_instrument_status("Sentry", is_enabled=False, disable_reason="Provide sentry_dsn")
+
+    bootstrap_table: typing.Final = console_writer.build_bootstrap_table()
+
+    assert list(bootstrap_table.columns[-1].cells) == ["1.5 ms", ""]
+
+
+def test_bootstrap_timings_export_span_tree(span_exporter: InMemorySpanExporter) -> None:
+    bootstrap_timings: typing.Final = BootstrapTimings()
+    with trace_bootstrap_step("outside of bootstrap"), bootstrap_timings.trace_step(BOOTSTRAP_ROOT_SPAN_NAME):
+        with bootstrap_timings.measure("Opentelemetry", BOOTSTRAP_PHASE), trace_bootstrap_step("load instrumentor"):
+            pass
+        with bootstrap_timings.measure(APPLICATION_ITEM_NAME, APPLICATION_CONSTRUCTION_PHASE):
+            pass
+
+    assert not span_exporter.get_finished_spans()
+    bootstrap_timings.export_trace()
+
+    spans: typing.Final = {one_span.name: one_span for one_span in span_exporter.get_finished_spans()}
+    assert set(spans) == {
+        BOOTSTRAP_ROOT_SPAN_NAME,
+        "Opentelemetry bootstrap",
+        "load instrumentor",
+        "Application construction",
+    }
+    assert spans[BOOTSTRAP_ROOT_SPAN_NAME].parent is None
+    assert spans["Opentelemetry bootstrap"].parent.span_id == spans[BOOTSTRAP_ROOT_SPAN_NAME].context.span_id  # type: ignore[union-attr]
+    assert spans["load instrumentor"].parent.span_id == spans["Opentelemetry bootstrap"].context.span_id  # type: ignore[union-attr]
+    assert spans["Application construction"].attributes == {
+        "microbootstrap.item": APPLICATION_ITEM_NAME,
+        "microbootstrap.phase": APPLICATION_CONSTRUCTION_PHASE,
+    }
+    assert not bootstrap_timings.spans
+
+
+def test_bootstrap_timings_export_parent_with_same_start_time(span_exporter: InMemorySpanExporter) -> None:
+    parent_span: typing.Final = BootstrapSpan(name=BOOTSTRAP_ROOT_SPAN_NAME, start_time=1, end_time=3)
+    child_span: typing.Final = BootstrapSpan(name="Logging bootstrap", start_time=1, parent=parent_span, end_time=2)
+    BootstrapTimings(spans=[child_span, parent_span]).export_trace()
+
+    spans: typing.Final = {one_span.name: one_span for one_span in span_exporter.get_finished_spans()}
+    assert spans["Logging bootstrap"].parent.span_id == spans[BOOTSTRAP_ROOT_SPAN_NAME].context.span_id  # type: ignore[union-attr]
+
+
+def test_bootstrapper_exports_trace(span_exporter: InMemorySpanExporter) -> None:
+    LitestarBootstrapper(LitestarSettings(service_debug=False, service_bootstrap_workers=2)).bootstrap()
+
+    spans: typing.Final = span_exporter.get_finished_spans()
+    root_span: typing.Final = next(one_span for one_span in spans if one_span.name == BOOTSTRAP_ROOT_SPAN_NAME)
+    assert "Logging bootstrap" in {one_span.name for one_span in spans}
+    assert all(
+        one_span.parent and one_span.parent.span_id == root_span.context.span_id
+        for one_span in spans
+        if one_span is not root_span
+    )
@@ -0,0 +1,65 @@
+import typing
+
+import pytest
+import structlog
+
+from microbootstrap import LitestarSettings
+from microbootstrap.bootstrap_timings import BOOTSTRAP_PHASE, BootstrapTimings
+from microbootstrap.bootstrappers.litestar import LitestarBootstrapper
+from microbootstrap.console_writer import (
+    ConsoleWriter,
+    LogSummaryConsoleWriter,
+    NoopConsoleWriter,
+    build_console_writer,
+)
+
+
+@pytest.mark.parametrize(
+    ("service_debug", "service_bootstrap_summary", "writer_type"),
+    [
+        (True, False, ConsoleWriter),
+        (True, True, ConsoleWriter),
+        (False, True, LogSummaryConsoleWriter),
+        (False, False, NoopConsoleWriter),
+    ],
+)
+def test_build_console_writer(
+    service_debug: bool,
+    service_bootstrap_summary: bool,
+    writer_type: type[typing.Any],
+) -> None:
+    settings: typing.Final = LitestarSettings(
+        service_debug=service_debug,
+        service_bootstrap_summary=service_bootstrap_summary,
+    )
+    assert isinstance(build_console_writer(settings), writer_type)
+
+
+def test_noop_console_writer_keeps_nothing() -> None:
+    bootstrapper: typing.Final = LitestarBootstrapper(LitestarSettings(service_debug=False))
+    bootstrapper.bootstrap()
+
+    assert isinstance(bootstrapper.console_writer, NoopConsoleWriter)
+    assert not vars(bootstrapper.console_writer)
+
+
+def test_log_summary_console_writer_logs_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(LogSummaryConsoleWriter, "summary_written", False)
+    console_writer: typing.Final = LogSummaryConsoleWriter(
+        bootstrap_timings=BootstrapTimings(durations={"Logging": {BOOTSTRAP_PHASE: 1_500_000}}),
+    )
+    console_writer.write_instrument_status("Logging", is_enabled=True)
+    console_writer.write_instrument_status("Sentry", is_enabled=False, disable_reason="Provide sentry_dsn")
+
+    with structlog.testing.capture_logs() as captured_logs:
+        console_writer.write_bootstrap_summary()
+        LogSummaryConsoleWriter().write_bootstrap_summary()
+
+    assert captured_logs == [
+        {
+            "event": "Application bootstrapped",
+            "log_level": "info",
+            "enabled_instruments": {"Logging": 1.5},
+            "disabled_instruments": {"Sentry": "Provide sentry_dsn"},
+        },
+    ]
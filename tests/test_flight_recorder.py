@@ -0,0 +1,98 @@
+from __future__ import annotations
+import typing
+
+import pytest
+import structlog
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+
+from microbootstrap.flight_recorder import FlightRecorder, format_recorded_time
+
+
+if typing.TYPE_CHECKING:
+    from tests.conftest import LoggingCapture
+
+
+@pytest.mark.parametrize("logging_render_bytes", [True, False])
+def test_flight_recorder_writes_debug_events_before_error(
+    bootstrap_logging: typing.Callable[..., LoggingCapture],
+    logging_render_bytes: bool,
+) -> None:
+    logging_capture: typing.Final = bootstrap_logging(
+        logging_flight_recorder_size=2,
+        logging_render_bytes=logging_render_bytes,
+        logging_buffer_capacity=100,
+    )
+    logger: typing.Final = structlog.get_logger("recorded")
+    tracer: typing.Final = TracerProvider().get_tracer(__name__)
+    for event_index in range(3):
+        with tracer.start_as_current_span("recorded_span") as recorded_span:
+            logger.debug("recorded event", event_index=event_index)
+    logger.info("info event")
+    logging_capture.logging_instrument.log_sink.flush()  # type: ignore[union-attr]
+    assert [one_line["event"] for one_line in logging_capture.read_log_lines()] == ["info event"]
+
+    logger.error("error event")
+    logging_capture.teardown()
+
+    log_lines: typing.Final = logging_capture.read_log_lines()
+    assert [(one_line["event"], one_line["level"]) for one_line in log_lines] == [
+        ("info event", "info"),
+        ("recorded event", "debug"),
+        ("recorded event", "debug"),
+        ("error event", "error"),
+    ]
+    assert [one_line["event_index"] for one_line in log_lines[1:3]] == [1, 2]
+    assert log_lines[2]["tracing"]["span_id"] == trace.format_span_id(recorded_span.get_span_context().span_id)
+    assert not log_lines[3]["tracing"]
+
+
+def test_flight_recorder_dumps_on_demand(bootstrap_logging: typing.Callable[..., LoggingCapture]) -> None:
+    logging_capture: typing.Final = bootstrap_logging(logging_flight_recorder_size=10, logging_buffer_capacity=100)
+    structlog.get_logger("recorded").debug("recorded event")
+    flight_recorder: typing.Final = logging_capture.logging_instrument.flight_recorder
+    assert flight_recorder
+
+    flight_recorder.dump()
+    flight_recorder.dump()
+
+    assert [one_line["event"] for one_line in logging_capture.read_log_lines()] == ["recorded event"]
+
+
+def test_flight_recorder_keeps_exception_of_recorded_event(
+    bootstrap_logging: typing.Callable[..., LoggingCapture],
+) -> None:
+    logging_capture: typing.Final = bootstrap_logging(logging_flight_recorder_size=10, logging_buffer_capacity=100)
+    logger: typing.Final = structlog.get_logger("recorded")
+    try:
+        raise KeyError("missing")  # noqa: TRY301
+    except KeyError:
+        logger.debug("recorded event", exc_info=True)
+    try:
+        raise ValueError("later failure")  # noqa: TRY301
+    except ValueError:
+        # recorded events are replayed, while another exception is handled
+        logger.error("error event")  # noqa: TRY400
+    logging_capture.teardown()
+
+    recorded_line, error_line = logging_capture.read_log_lines()
+    assert "KeyError" in recorded_line["exception"]
+    assert "ValueError" not in recorded_line["exception"]
+    assert error_line["event"] == "error event"
+
+
+def test_flight_recorder_is_disabled_by_default(bootstrap_logging: typing.Callable[..., LoggingCapture]) -> None:
+    assert bootstrap_logging().logging_instrument.flight_recorder is None
+    assert not any(isinstance(one_processor, FlightRecorder) for one_processor in structlog.get_config()["processors"])
+
+
+@pytest.mark.parametrize(
+    ("time_stamper", "expected_time"),
+    [
+        (structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"), "1970-01-01 00:00:01"),
+        (structlog.processors.TimeStamper(fmt="iso"), "1970-01-01T00:00:01.500000Z"),
+        (structlog.processors.TimeStamper(), 1.5),
+    ],
+)
+def test_format_recorded_time(time_stamper: structlog.processors.TimeStamper, expected_time: str | float) -> None:
+    assert format_recorded_time(time_stamper, 1.5) == expected_time
@@ -0,0 +1,120 @@
+import io
+import logging
+import sys
+import typing
+
+import orjson
+import pytest
+import structlog
+
+from microbootstrap import LoggingConfig
+from microbootstrap.foreign_logs import ForeignLogFilter, ForeignLogFormatter
+from microbootstrap.instruments.logging_instrument import (
+    STRUCTLOG_FORMATTER_PROCESSOR,
+    STRUCTLOG_PRE_CHAIN_PROCESSORS,
+    LoggingInstrument,
+    tracer_injection,
+)
+from microbootstrap.log_timestamper import CachedTimeStamper
+
+
+def make_record(
+    logger_name: str = "foreign",
+    level: int = logging.INFO,
+    exc_info: typing.Any = None,  # noqa: ANN401
+) -> logging.LogRecord:
+    return logging.getLogger(logger_name).makeRecord(
+        logger_name,
+        level,
+        __file__,
+        1,
+        "request to %s failed with %d",
+        ("http://localhost", 503),
+        exc_info,
+    )
+
+
+@pytest.mark.parametrize("with_exception", [False, True])
+def test_foreign_log_formatter_matches_processor_formatter(
+    monkeypatch: pytest.MonkeyPatch,
+    with_exception: bool,
+) -> None:
+    monkeypatch.setattr("time.time_ns", lambda: 1_700_000_000_000_000_000)
+    monkeypatch.setattr("time.time", lambda: 1_700_000_000.0)
+    try:
+        raise ValueError("boom")  # noqa: TRY301
+    except ValueError:
+        exc_info = sys.exc_info() if with_exception else None
+    processor_formatter: typing.Final = structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=STRUCTLOG_PRE_CHAIN_PROCESSORS,
+        processors=[structlog.stdlib.ProcessorFormatter.remove_processors_meta, STRUCTLOG_FORMATTER_PROCESSOR],
+        logger=logging.getLogger(),
+    )
+    foreign_log_formatter: typing.Final = ForeignLogFormatter(
+        STRUCTLOG_PRE_CHAIN_PROCESSORS,
+        STRUCTLOG_FORMATTER_PROCESSOR,
+        logger=logging.getLogger(),
+    )
+
+    formatted_line: typing.Final = foreign_log_formatter.format(make_record(exc_info=exc_info))
+    assert formatted_line == processor_formatter.format(make_record(exc_info=exc_info))
+    assert orjson.loads(formatted_line)["event"] == "request to http://localhost failed with 503"
+    assert ("exception" in orjson.loads(formatted_line)) is with_exception
+
+
+def test_foreign_log_formatter_processors() -> None:
+    foreign_log_formatter: typing.Final = ForeignLogFormatter(
+        STRUCTLOG_PRE_CHAIN_PROCESSORS,
+        STRUCTLOG_FORMATTER_PROCESSOR,
+    )
+
+    assert len(foreign_log_formatter.processors) == 2  # noqa: PLR2004
+    assert foreign_log_formatter.processors[0] is tracer_injection
+    assert isinstance(foreign_log_formatter.processors[1], CachedTimeStamper)
+    assert foreign_log_formatter.exception_processors[:2] == foreign_log_formatter.processors
+    assert isinstance(foreign_log_formatter.exception_processors[2], structlog.processors.StackInfoRenderer)
+    assert foreign_log_formatter.exception_processors[3:] == [structlog.processors.format_exc_info]
+
+
+def test_foreign_log_filter() -> None:
+    foreign_log_filter: typing.Final = ForeignLogFilter(
+        logger_levels={"sqlalchemy": logging.WARNING, "sqlalchemy.pool": logging.DEBUG},
+        dropped_loggers=["aiokafka"],
+    )
+
+    assert not foreign_log_filter.filter(make_record("sqlalchemy.engine.Engine", logging.INFO))
+    assert foreign_log_filter.filter(make_record("sqlalchemy.engine.Engine", logging.WARNING))
+    assert foreign_log_filter.filter(make_record("sqlalchemy.pool", logging.DEBUG))
+    assert not foreign_log_filter.filter(make_record("aiokafka.consumer", logging.CRITICAL))
+    assert foreign_log_filter.filter(make_record("httpx", logging.DEBUG))
+    assert foreign_log_filter.logger_min_levels["sqlalchemy.engine.Engine"] == logging.WARNING
+
+
+@pytest.mark.parametrize("logging_render_bytes", [True, False])
+def test_logging_drop_loggers(monkeypatch: pytest.MonkeyPatch, logging_render_bytes: bool) -> None:
+    target_stream: typing.Final = io.TextIOWrapper(io.BytesIO(), write_through=True)
+    monkeypatch.setattr(sys, "stdout", target_stream)
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    logging_instrument: typing.Final = LoggingInstrument(
+        LoggingConfig(
+            service_debug=False,
+            logging_buffer_capacity=0,
+            logging_render_bytes=logging_render_bytes,
+            logging_drop_loggers=["noisy"],
+            logging_logger_levels={"chatty": logging.ERROR},
+        ),
+    )
+    logging_instrument.bootstrap()
+    # libraries may set levels of their loggers by themselves
+    logging.getLogger("chatty.engine").setLevel(logging.INFO)
+    logging.getLogger("noisy.child").error("dropped error")
+    logging.getLogger("chatty.engine").warning("gated warning")
+    logging.getLogger("chatty.engine").error("chatty error")
+    logging.getLogger("other").warning("other warning")
+    logging_instrument.teardown()
+    logging.getLogger("chatty.engine").setLevel(logging.NOTSET)
+
+    assert [orjson.loads(one_line)["event"] for one_line in target_stream.buffer.getvalue().splitlines()] == [
+        "chatty error",
+        "other warning",
+    ]
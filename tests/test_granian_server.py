@@ -1,8 +1,62 @@
+import multiprocessing
+import os
+import typing
+from unittest import mock
+
 import granian
+import pytest
+
+from microbootstrap import exceptions, helpers
+from microbootstrap import granian_server as granian_server_module
+from microbootstrap.bootstrappers.litestar import LitestarBootstrapper
+from microbootstrap.granian_server import PreforkGranianServer, create_granian_server
+from microbootstrap.settings import LitestarSettings, ServerConfig
 
-from microbootstrap.granian_server import create_granian_server
-from microbootstrap.settings import ServerConfig
+
+PRELOADED_APPLICATION: typing.Final = object()
 
 
 def test_granian_server(minimal_server_config: ServerConfig) -> None:
     assert isinstance(create_granian_server("some:app", minimal_server_config), granian.Granian)
+
+
+def test_granian_server_prefork(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(multiprocessing, "get_start_method", lambda: "fork")
+    granian_server: typing.Final = create_granian_server(
+        "tests.test_granian_server:PRELOADED_APPLICATION",
+        ServerConfig(server_prefork=True),
+    )
+
+    assert isinstance(granian_server, PreforkGranianServer)
+    assert granian_server.load_preloaded_application() is PRELOADED_APPLICATION
+    assert not granian_server.reload_on_changes
+
+
+def test_granian_server_prefork_requires_fork(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(multiprocessing, "get_start_method", lambda: "spawn")
+    with pytest.raises(exceptions.PreforkNotSupportedError):
+        create_granian_server("tests.test_granian_server:PRELOADED_APPLICATION", ServerConfig(server_prefork=True))
+
+
+def test_granian_server_prefork_enables_after_fork_methods(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(granian.Granian, "serve", granian_serve_mock := mock.Mock())
+    monkeypatch.setattr(
+        granian_server_module,
+        "enable_after_fork_methods",
+        enable_after_fork_methods_mock := mock.Mock(),
+    )
+    granian_server: typing.Final = PreforkGranianServer(PRELOADED_APPLICATION, target="unused:app")
+
+    granian_server.serve()
+
+    assert enable_after_fork_methods_mock.called
+    granian_serve_mock.assert_called_once_with(None, granian_server.load_preloaded_application, False)
+
+
+def test_bootstrap_keeps_forks_untouched(monkeypatch: pytest.MonkeyPatch) -> None:
+    helpers.enable_after_fork_methods.cache_clear()
+    monkeypatch.setattr(os, "register_at_fork", register_at_fork_mock := mock.Mock())
+
+    LitestarBootstrapper(LitestarSettings(service_debug=False)).bootstrap()
+
+    assert mock.call(after_in_child=helpers.call_after_fork_methods) not in register_at_fork_mock.call_args_list
@@ -1,4 +1,5 @@
 import dataclasses
+import os
 import typing
 
 import pydantic
@@ -158,3 +159,36 @@ def test_merge_dataclasses_configs(
 )
 def test_optimize_exclude_paths(exclude_paths: list[str]) -> None:
     optimize_exclude_paths(exclude_paths)
+
+
+class ForkRecorder:
+    def __init__(self, write_descriptor: int) -> None:
+        self.write_descriptor = write_descriptor
+
+    def record_fork(self) -> None:
+        os.write(self.write_descriptor, b"forked")
+
+
+def test_register_after_fork() -> None:
+    read_descriptor, write_descriptor = os.pipe()
+    fork_recorder: typing.Final = ForkRecorder(write_descriptor)
+    helpers.register_after_fork(fork_recorder.record_fork)
+    helpers.register_after_fork(fork_recorder.record_fork)
+    helpers.enable_after_fork_methods()
+
+    if (child_pid := os.fork()) == 0:  # pragma: no cover
+        os._exit(0)
+    os.waitpid(child_pid, 0)
+    os.close(write_descriptor)
+
+    assert os.read(read_descriptor, 64) == b"forked"
+    os.close(read_descriptor)
+
+
+def test_register_after_fork_drops_collected_objects() -> None:
+    helpers.register_after_fork(ForkRecorder(0).record_fork)
+    registered_count: typing.Final = len(helpers.AFTER_FORK_METHODS)
+    for _ in range(10):
+        helpers.register_after_fork(ForkRecorder(0).record_fork)
+
+    assert len(helpers.AFTER_FORK_METHODS) <= registered_count
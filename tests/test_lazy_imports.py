@@ -0,0 +1,47 @@
+import subprocess
+import sys
+import typing
+
+import pytest
+
+import microbootstrap
+from microbootstrap.instruments.logging_instrument import LoggingConfig
+
+
+def test_package_import_is_lazy() -> None:
+    check_script: typing.Final = (
+        "import sys, microbootstrap; "
+        "heavy = {'pydantic_settings', 'sentry_sdk', 'structlog', 'orjson', 'opentelemetry'}; "
+        "print(sorted(heavy & sys.modules.keys()))"
+    )
+    completed_process: typing.Final = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", check_script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert completed_process.stdout.strip() == "[]"
+
+
+def test_bootstrapper_import_skips_grpc_exporter() -> None:
+    check_script: typing.Final = (
+        "import sys, microbootstrap.bootstrappers.litestar; "
+        "print('opentelemetry.exporter.otlp.proto.grpc.trace_exporter' in sys.modules)"
+    )
+    completed_process: typing.Final = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", check_script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert completed_process.stdout.strip() == "False"
+
+
+def test_lazy_attribute_resolves_to_original_object() -> None:
+    assert microbootstrap.LoggingConfig is LoggingConfig
+    assert "LoggingConfig" in dir(microbootstrap)
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError):
+        microbootstrap.NotExistingConfig  # noqa: B018
@@ -0,0 +1,136 @@
+from __future__ import annotations
+import logging
+import typing
+
+import pytest
+import structlog
+
+from microbootstrap.log_exceptions import DeduplicatingExceptionRenderer, get_exception_fingerprint
+
+
+if typing.TYPE_CHECKING:
+    from tests.conftest import LoggingCapture
+
+
+def raise_nested(depth: int, message: str = "boom") -> None:
+    if depth == 0:
+        raise ValueError(message)
+    raise_nested(depth - 1, message)
+
+
+def catch_exception(depth: int, message: str = "boom") -> BaseException:
+    try:
+        raise_nested(depth, message)
+    except ValueError as exc:
+        return exc
+    raise AssertionError
+
+
+def raise_chained(cause: BaseException) -> None:
+    raise RuntimeError from cause
+
+
+def test_structured_exceptions_limit_frames(bootstrap_logging: typing.Callable[..., LoggingCapture]) -> None:
+    logging_capture: typing.Final = bootstrap_logging(
+        logging_structured_exceptions=True,
+        logging_exception_max_frames=4,
+    )
+    structlog.get_logger("structured").error("failed", exc_info=catch_exception(depth=10))
+    logging.getLogger("foreign").error("foreign failed", exc_info=catch_exception(depth=1))
+    logging_capture.teardown()
+
+    structlog_line, foreign_line = logging_capture.read_log_lines()
+    exception_frames: typing.Final = structlog_line["exception"][0]["frames"]
+    assert [one_frame["name"] for one_frame in exception_frames] == [
+        "catch_exception",
+        "raise_nested",
+        "Skipped frames: 8",
+        "raise_nested",
+        "raise_nested",
+    ]
+    assert "locals" not in exception_frames[0]
+    assert structlog_line["exception"][0]["exc_type"] == "ValueError"
+    assert len(foreign_line["exception"][0]["frames"]) == 3  # noqa: PLR2004
+
+
+def test_structured_exceptions_show_locals(bootstrap_logging: typing.Callable[..., LoggingCapture]) -> None:
+    logging_capture: typing.Final = bootstrap_logging(
+        logging_structured_exceptions=True,
+        logging_exception_show_locals=True,
+        logging_exception_locals_max_string=5,
+    )
+    structlog.get_logger("structured").error("failed", exc_info=catch_exception(depth=0, message="long message"))
+    logging_capture.teardown()
+
+    exception_frames: typing.Final = logging_capture.read_log_lines()[0]["exception"][0]["frames"]
+    assert exception_frames[-1]["locals"]["message"] == "'long '+7"
+
+
+@pytest.mark.parametrize("logging_structured_exceptions", [True, False])
+def test_exception_dedup_window(
+    bootstrap_logging: typing.Callable[..., LoggingCapture],
+    logging_structured_exceptions: bool,
+) -> None:
+    logging_capture: typing.Final = bootstrap_logging(
+        logging_structured_exceptions=logging_structured_exceptions,
+        logging_exception_dedup_window=60,
+    )
+    logger: typing.Final = structlog.get_logger("deduplicated")
+    for one_message in ("first", "second", "third"):
+        logger.error("failed", exc_info=catch_exception(depth=1, message=one_message))
+    logger.error("other failure", exc_info=catch_exception(depth=2))
+    logger.error("no failure")
+    logging_capture.teardown()
+
+    log_lines: typing.Final = logging_capture.read_log_lines()
+    assert [
+        ("exception" in one_line, one_line.get("exception_repeats"), one_line.get("exception_fingerprint"))
+        for one_line in log_lines
+    ] == [
+        (True, None, log_lines[0]["exception_fingerprint"]),
+        (False, 1, log_lines[0]["exception_fingerprint"]),
+        (False, 2, log_lines[0]["exception_fingerprint"]),
+        (True, None, log_lines[3]["exception_fingerprint"]),
+        (False, None, None),
+    ]
+    assert log_lines[0]["exception_fingerprint"] != log_lines[3]["exception_fingerprint"]
+
+
+def test_exception_dedup_window_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    exception_renderer: typing.Final = DeduplicatingExceptionRenderer(
+        structlog.processors.ExceptionRenderer(),
+        dedup_window=60,
+    )
+    exception: typing.Final = catch_exception(depth=1)
+    assert "exception" in exception_renderer(None, "error", {"exc_info": exception})
+    assert "exception" not in exception_renderer(None, "error", {"exc_info": exception})
+
+    monkeypatch.setattr("time.monotonic", lambda: float("inf"))
+    assert "exception" in exception_renderer(None, "error", {"exc_info": exception})
+
+
+def test_get_exception_fingerprint() -> None:
+    first_exception: typing.Final = catch_exception(depth=1, message="first")
+    second_exception: typing.Final = catch_exception(depth=1, message="second")
+    deeper_exception: typing.Final = catch_exception(depth=2)
+    try:
+        raise_chained(first_exception)
+    except RuntimeError as exc:
+        chained_exception = exc
+
+    fingerprints: typing.Final = [
+        get_exception_fingerprint((type(one_exception), one_exception, one_exception.__traceback__))
+        for one_exception in (first_exception, second_exception, deeper_exception, chained_exception)
+    ]
+    assert fingerprints[0] == fingerprints[1]
+    assert len(set(fingerprints[1:])) == 3  # noqa: PLR2004
+
+
+def test_exceptions_are_formatted_by_default(bootstrap_logging: typing.Callable[..., LoggingCapture]) -> None:
+    bootstrap_logging()
+
+    assert structlog.processors.format_exc_info in structlog.get_config()["processors"]
+    assert not any(
+        isinstance(one_processor, DeduplicatingExceptionRenderer)
+        for one_processor in structlog.get_config()["processors"]
+    )
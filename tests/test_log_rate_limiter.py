@@ -0,0 +1,79 @@
+from __future__ import annotations
+import time
+import typing
+
+import structlog
+
+from microbootstrap.log_rate_limiter import SUPPRESSED_EVENTS_SUMMARY, LogRateLimiter
+
+
+if typing.TYPE_CHECKING:
+    from tests.conftest import LoggingCapture
+
+
+def test_rate_limit_suppresses_similar_events(bootstrap_logging: typing.Callable[..., LoggingCapture]) -> None:
+    logging_capture: typing.Final = bootstrap_logging(
+        logging_rate_limit_events=2,
+        logging_rate_limit_window=60,
+    )
+    logger: typing.Final = structlog.get_logger("hot.loop")
+    for _ in range(5):
+        logger.warning("hot event")
+    logger.info("other event")
+    logger.error("hot event")
+    logging_capture.teardown()
+
+    log_lines: typing.Final = logging_capture.read_log_lines()
+    assert [(one_line["event"], one_line["level"]) for one_line in log_lines] == [
+        ("hot event", "warning"),
+        ("hot event", "warning"),
+        ("other event", "info"),
+        ("hot event", "error"),
+        (SUPPRESSED_EVENTS_SUMMARY, "warning"),
+    ]
+    assert log_lines[-1]["suppressed_event"] == "hot event"
+    assert log_lines[-1]["suppressed_events"] == 3  # noqa: PLR2004
+    assert log_lines[-1]["logger"] == "hot.loop"
+
+
+def test_rate_limit_writes_summary_when_window_closes(
+    bootstrap_logging: typing.Callable[..., LoggingCapture],
+) -> None:
+    logging_capture: typing.Final = bootstrap_logging(
+        logging_rate_limit_events=1,
+        logging_rate_limit_window=0.01,
+    )
+    logger: typing.Final = structlog.get_logger("hot.loop")
+    logger.info("hot event")
+    logger.info("hot event")
+    time.sleep(0.02)
+    logger.info("hot event")
+
+    assert [one_line["event"] for one_line in logging_capture.read_log_lines()] == [
+        "hot event",
+        SUPPRESSED_EVENTS_SUMMARY,
+        "hot event",
+    ]
+    assert logging_capture.logging_instrument.log_rate_limiter
+    assert len(logging_capture.logging_instrument.log_rate_limiter.windows) == 1
+
+
+def test_sample_rates(bootstrap_logging: typing.Callable[..., LoggingCapture]) -> None:
+    logging_capture: typing.Final = bootstrap_logging(
+        logging_sample_rates={"sampled": 0.0, "sampled.kept": 1.0},
+    )
+    for logger_name in ("sampled", "sampled.child", "sampled.kept", "other"):
+        structlog.get_logger(logger_name).info("sampled event")
+    structlog.get_logger("sampled").error("sampled error")
+    logging_capture.teardown()
+
+    assert [(one_line["logger"], one_line["event"]) for one_line in logging_capture.read_log_lines()] == [
+        ("sampled.kept", "sampled event"),
+        ("other", "sampled event"),
+        ("sampled", "sampled error"),
+    ]
+
+
+def test_log_rate_limiter_is_disabled_by_default(bootstrap_logging: typing.Callable[..., LoggingCapture]) -> None:
+    assert bootstrap_logging().logging_instrument.log_rate_limiter is None
+    assert not any(isinstance(one_processor, LogRateLimiter) for one_processor in structlog.get_config()["processors"])
@@ -0,0 +1,172 @@
+from __future__ import annotations
+import logging
+import socket
+import typing
+
+import orjson
+import pydantic
+import pytest
+import structlog
+
+from microbootstrap import LoggingConfig
+from microbootstrap.log_shipping import LENGTH_PREFIX, MAX_PENDING_STREAM_SIZE, SocketLogWriter, parse_socket_address
+
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+    from tests.conftest import LoggingCapture
+
+
+def write_logs(logging_capture: LoggingCapture) -> None:
+    structlog.get_logger("shipped").info("structlog event")
+    logging.getLogger("foreign").warning("foreign event")
+    logging_capture.teardown()
+
+
+def read_length_prefixed_frames(content: bytes) -> list[bytes]:
+    frames: typing.Final = []
+    while content:
+        (frame_size,) = LENGTH_PREFIX.unpack_from(content)
+        frames.append(content[LENGTH_PREFIX.size : LENGTH_PREFIX.size + frame_size])
+        content = content[LENGTH_PREFIX.size + frame_size :]
+    return frames
+
+
+def receive_all(agent_socket: socket.socket) -> bytes:
+    received_chunks: typing.Final = []
+    while received_chunk := agent_socket.recv(65536):
+        received_chunks.append(received_chunk)
+    return b"".join(received_chunks)
+
+
+@pytest.mark.parametrize("logging_render_bytes", [True, False])
+def test_ship_logs_over_unix_datagram_socket(
+    bootstrap_logging: typing.Callable[..., LoggingCapture],
+    tmp_path: pathlib.Path,
+    logging_render_bytes: bool,
+) -> None:
+    socket_path: typing.Final = tmp_path / "agent.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as agent_socket:
+        agent_socket.bind(str(socket_path))
+        agent_socket.settimeout(1)
+        logging_capture: typing.Final = bootstrap_logging(
+            logging_socket_address=f"unixgram://{socket_path}",
+            logging_render_bytes=logging_render_bytes,
+            logging_buffer_capacity=100,
+        )
+        logging_instrument: typing.Final = logging_capture.logging_instrument
+        assert logging_instrument.log_stream is logging_instrument.socket_writer
+        write_logs(logging_capture)
+
+        received_events: typing.Final = [
+            orjson.loads(one_line)["event"]
+            for _ in range(1 if logging_render_bytes else 2)
+            for one_line in agent_socket.recv(65536).splitlines()
+        ]
+    assert sorted(received_events) == ["foreign event", "structlog event"]
+    assert logging_instrument.socket_writer
+    assert logging_instrument.socket_writer.dropped_records == 0
+
+
+def test_ship_logs_over_unix_stream_socket_with_length_prefix(
+    bootstrap_logging: typing.Callable[..., LoggingCapture],
+    tmp_path: pathlib.Path,
+) -> None:
+    socket_path: typing.Final = tmp_path / "agent.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as agent_socket:
+        agent_socket.bind(str(socket_path))
+        agent_socket.listen()
+        write_logs(
+            bootstrap_logging(
+                logging_socket_address=f"unix://{socket_path}",
+                logging_socket_framing="length_prefix",
+                logging_render_bytes=True,
+                logging_buffer_capacity=100,
+            ),
+        )
+        connection, _ = agent_socket.accept()
+        with connection:
+            received_frames: typing.Final = read_length_prefixed_frames(receive_all(connection))
+
+    assert [orjson.loads(one_frame)["event"] for one_frame in received_frames] == ["structlog event", "foreign event"]
+
+
+def test_ship_logs_over_udp(bootstrap_logging: typing.Callable[..., LoggingCapture]) -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as agent_socket:
+        agent_socket.bind(("127.0.0.1", 0))
+        agent_socket.settimeout(1)
+        write_logs(
+            bootstrap_logging(
+                logging_socket_address=f"udp://127.0.0.1:{agent_socket.getsockname()[1]}",
+                logging_render_bytes=True,
+                logging_buffer_capacity=100,
+            ),
+        )
+
+        assert [orjson.loads(one_line)["event"] for one_line in agent_socket.recv(65536).splitlines()] == [
+            "structlog event",
+            "foreign event",
+        ]
+
+
+def test_socket_log_writer_drops_records_without_agent(tmp_path: pathlib.Path) -> None:
+    socket_log_writer: typing.Final = SocketLogWriter(f"unixgram://{tmp_path / 'missing.sock'}")
+    socket_log_writer.write(b"first\nsecond\n")
+    socket_log_writer.write("third\n")
+
+    assert socket_log_writer.dropped_records == 3  # noqa: PLR2004
+    socket_log_writer.close()
+
+
+def test_socket_log_writer_drops_only_oversize_datagram_records() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as agent_socket:
+        agent_socket.bind(("127.0.0.1", 0))
+        agent_socket.settimeout(1)
+        socket_log_writer: typing.Final = SocketLogWriter(f"udp://127.0.0.1:{agent_socket.getsockname()[1]}")
+        socket_log_writer.write(b"x" * 70_000 + b"\nfirst\n")
+        socket_log_writer.write(b"second\n")
+
+        assert [agent_socket.recv(65536), agent_socket.recv(65536)] == [b"first\n", b"second\n"]
+    assert socket_log_writer.dropped_records == 1
+    socket_log_writer.close()
+
+
+def test_socket_log_writer_does_not_block_on_full_stream_socket(tmp_path: pathlib.Path) -> None:
+    socket_path: typing.Final = tmp_path / "agent.sock"
+    log_line: typing.Final = b"x" * 1000 + b"\n"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as agent_socket:
+        agent_socket.bind(str(socket_path))
+        agent_socket.listen()
+        socket_log_writer: typing.Final = SocketLogWriter(f"unix://{socket_path}")
+        for _ in range(MAX_PENDING_STREAM_SIZE // len(log_line) * 4):
+            socket_log_writer.write(log_line)
+        assert socket_log_writer.dropped_records
+
+        connection, _ = agent_socket.accept()
+        with connection:
+            connection.settimeout(5)
+            socket_log_writer.close()
+            received_lines: typing.Final = receive_all(connection).splitlines()
+
+    assert set(received_lines) == {log_line.strip()}
+    assert len(received_lines) + socket_log_writer.dropped_records == MAX_PENDING_STREAM_SIZE // len(log_line) * 4
+
+
+@pytest.mark.parametrize(
+    ("socket_address", "expected_address"),
+    [
+        ("unix:///run/agent.sock", (socket.AF_UNIX, socket.SOCK_STREAM, "/run/agent.sock")),
+        ("unixgram:///run/agent.sock", (socket.AF_UNIX, socket.SOCK_DGRAM, "/run/agent.sock")),
+        ("udp://127.0.0.1:5170", (socket.AF_INET, socket.SOCK_DGRAM, ("127.0.0.1", 5170))),
+        ("udp://[::1]:5170", (socket.AF_INET6, socket.SOCK_DGRAM, ("::1", 5170))),
+    ],
+)
+def test_parse_socket_address(socket_address: str, expected_address: tuple[typing.Any, ...]) -> None:
+    assert parse_socket_address(socket_address) == expected_address
+
+
+@pytest.mark.parametrize("socket_address", ["tcp://127.0.0.1:5170", "udp://127.0.0.1", "/run/agent.sock"])
+def test_invalid_logging_socket_address(socket_address: str) -> None:
+    with pytest.raises(pydantic.ValidationError):
+        LoggingConfig(logging_socket_address=socket_address)
@@ -0,0 +1,65 @@
+import io
+import logging
+import re
+import sys
+import time
+import typing
+from unittest import mock
+
+import orjson
+import pytest
+import structlog
+
+from microbootstrap import LoggingConfig
+from microbootstrap.flight_recorder import format_recorded_time
+from microbootstrap.instruments.logging_instrument import LoggingInstrument
+from microbootstrap.log_timestamper import CachedTimeStamper, TimestampPrecision
+
+
+TIME_NS: typing.Final = 1_700_000_000_123_456_789
+
+
+@pytest.mark.parametrize(
+    ("precision", "expected_time"),
+    [
+        ("seconds", "2023-11-14 22:13:20"),
+        ("milliseconds", "2023-11-14 22:13:20.123"),
+        ("microseconds", "2023-11-14 22:13:20.123456"),
+        ("epoch_ns", TIME_NS),
+    ],
+)
+def test_cached_time_stamper_format_time(precision: TimestampPrecision, expected_time: str | int) -> None:
+    assert CachedTimeStamper(precision).format_time(TIME_NS) == expected_time
+
+
+def test_cached_time_stamper_formats_second_once() -> None:
+    time_stamper: typing.Final = CachedTimeStamper()
+    with mock.patch("time.strftime", wraps=time.strftime) as strftime_mock:
+        assert time_stamper.format_time(TIME_NS) == time_stamper.format_time(TIME_NS + 1_000)
+        assert time_stamper.format_time(TIME_NS + 1_000_000_000) == "2023-11-14 22:13:21"
+
+    assert strftime_mock.call_count == 2  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("time_ns", [0, TIME_NS, 2_000_000_000_999_999_999])
+def test_cached_time_stamper_matches_time_stamper(time_ns: int) -> None:
+    time_stamper: typing.Final = structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S")
+    assert CachedTimeStamper().format_time(time_ns) == format_recorded_time(time_stamper, time_ns // 1_000_000_000)
+
+
+def test_logging_timestamp_precision(monkeypatch: pytest.MonkeyPatch) -> None:
+    target_stream: typing.Final = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", target_stream)
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    logging_instrument: typing.Final = LoggingInstrument(
+        LoggingConfig(service_debug=False, logging_buffer_capacity=0, logging_timestamp_precision="milliseconds"),
+    )
+    logging_instrument.bootstrap()
+    structlog.get_logger("structlog.logger").info("structlog event")
+    logging.getLogger("foreign.logger").warning("foreign event")
+    logging_instrument.teardown()
+
+    log_lines: typing.Final = [orjson.loads(one_line) for one_line in target_stream.getvalue().splitlines()]
+    assert [one_line["event"] for one_line in log_lines] == ["structlog event", "foreign event"]
+    for one_line in log_lines:
+        assert re.fullmatch(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d\.\d{3}", one_line["timestamp"])
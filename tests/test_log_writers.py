@@ -0,0 +1,250 @@
+import io
+import logging
+import sys
+import threading
+import time
+import typing
+from unittest import mock
+
+import orjson
+import pytest
+import structlog
+from prometheus_client import REGISTRY
+
+from microbootstrap import LitestarSettings, LoggingConfig
+from microbootstrap.bootstrappers.litestar import LitestarBootstrapper
+from microbootstrap.instruments.logging_instrument import LoggingInstrument, MemoryLoggerFactory
+from microbootstrap.log_writers import (
+    LOG_BUFFER_FLUSHES_METRIC_NAME,
+    LOG_BUFFER_RECORDS_METRIC_NAME,
+    LOG_OVERFLOW_DROP_NEWEST,
+    LOG_OVERFLOW_DROP_OLDEST,
+    BackgroundLogWriter,
+    BufferedLogSink,
+    LogOverflowPolicy,
+    publish_log_sink_metrics,
+    resolve_logger_setting,
+)
+
+
+class BlockedStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.write_started = threading.Event()
+        self.write_allowed = threading.Event()
+
+    def write(self, chunk: str) -> int:
+        self.write_started.set()
+        self.write_allowed.wait()
+        return super().write(chunk)
+
+
+def test_background_log_writer_drains_on_close() -> None:
+    target_stream: typing.Final = io.StringIO()
+    background_writer: typing.Final = BackgroundLogWriter(target_stream)
+    for line_index in range(100):
+        background_writer.write(f"{line_index}\n")
+    background_writer.close()
+    background_writer.write("after close\n")
+
+    assert target_stream.getvalue() == "".join(f"{line_index}\n" for line_index in range(100)) + "after close\n"
+
+
+@pytest.mark.parametrize(
+    ("overflow_policy", "expected_output"),
+    [
+        (LOG_OVERFLOW_DROP_NEWEST, "first\nsecond\nthird\n"),
+        (LOG_OVERFLOW_DROP_OLDEST, "first\nthird\nfourth\n"),
+    ],
+)
+def test_background_log_writer_drops_on_overflow(
+    overflow_policy: LogOverflowPolicy,
+    expected_output: str,
+) -> None:
+    target_stream: typing.Final = BlockedStream()
+    background_writer: typing.Final = BackgroundLogWriter(target_stream, queue_size=2, overflow_policy=overflow_policy)
+    background_writer.write("first\n")
+    target_stream.write_started.wait()
+    for one_chunk in ("second\n", "third\n", "fourth\n"):
+        background_writer.write(one_chunk)
+
+    target_stream.write_allowed.set()
+    background_writer.close()
+
+    assert background_writer.dropped_records == 1
+    assert target_stream.getvalue() == expected_output
+
+
+def test_background_log_writer_blocks_on_overflow() -> None:
+    target_stream: typing.Final = BlockedStream()
+    background_writer: typing.Final = BackgroundLogWriter(target_stream, queue_size=1)
+    background_writer.write("first\n")
+    target_stream.write_started.wait()
+    background_writer.write("second\n")
+    blocked_thread: typing.Final = threading.Thread(target=background_writer.write, args=("third\n",))
+    blocked_thread.start()
+    blocked_thread.join(timeout=0.05)
+    assert blocked_thread.is_alive()
+
+    target_stream.write_allowed.set()
+    blocked_thread.join()
+    background_writer.close()
+
+    assert background_writer.dropped_records == 0
+    assert target_stream.getvalue() == "first\nsecond\nthird\n"
+
+
+def test_logging_instrument_drains_background_writer_on_teardown(monkeypatch: pytest.MonkeyPatch) -> None:
+    target_stream: typing.Final = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", target_stream)
+    logging_instrument: typing.Final = LoggingInstrument(
+        LoggingConfig(service_debug=False, logging_background_writer=True),
+    )
+    logging_instrument.bootstrap()
+    structlog.get_logger("background").error("background message")
+
+    logging_instrument.teardown()
+
+    assert "background message" in target_stream.getvalue()
+
+
+def test_memory_logger_factory_shares_one_sink() -> None:
+    target_stream: typing.Final = io.StringIO()
+    logger_factory: typing.Final = MemoryLoggerFactory(
+        logging_buffer_capacity=3,
+        logging_flush_level=logging.ERROR,
+        logging_log_level=logging.INFO,
+        log_stream=target_stream,
+    )
+    first_logger: typing.Final = logger_factory("shared.first")
+    second_logger: typing.Final = logger_factory("shared.second")
+    logger_factory("shared.first")
+
+    first_logger.info("first")
+    second_logger.info("second")
+    assert not target_stream.getvalue()
+    assert first_logger.handlers == second_logger.handlers == [logger_factory.log_sink]
+
+    first_logger.info("third")
+    second_logger.error("fourth")
+
+    assert target_stream.getvalue() == "first\nsecond\nthird\nfourth\n"
+    assert logger_factory.log_sink.flush_count == 2  # noqa: PLR2004
+
+
+def test_log_sink_metrics() -> None:
+    log_sink: typing.Final = BufferedLogSink(io.StringIO(), capacity=10, flush_level=logging.ERROR)
+    publish_log_sink_metrics(log_sink)
+    publish_log_sink_metrics(log_sink)
+    log_sink.handle(logging.makeLogRecord({"msg": "buffered", "levelno": logging.INFO}))
+
+    assert REGISTRY.get_sample_value(LOG_BUFFER_RECORDS_METRIC_NAME) == 1
+    assert REGISTRY.get_sample_value(f"{LOG_BUFFER_FLUSHES_METRIC_NAME}_total") == 0
+
+    log_sink.flush()
+
+    assert REGISTRY.get_sample_value(LOG_BUFFER_RECORDS_METRIC_NAME) == 0
+    assert REGISTRY.get_sample_value(f"{LOG_BUFFER_FLUSHES_METRIC_NAME}_total") == 1
+
+
+@pytest.mark.parametrize(("prometheus_metrics_path", "is_published"), [("/metrics", True), ("", False)])
+def test_log_sink_metrics_published_only_with_prometheus(prometheus_metrics_path: str, *, is_published: bool) -> None:
+    bootstrapper: typing.Final = LitestarBootstrapper(
+        LitestarSettings(service_debug=False, prometheus_metrics_path=prometheus_metrics_path),
+    )
+    bootstrapper.bootstrap()
+    bootstrapper.teardown()
+
+    assert (REGISTRY.get_sample_value(LOG_BUFFER_RECORDS_METRIC_NAME) is not None) is is_published
+
+
+def test_log_sink_flushes_by_size() -> None:
+    target_stream: typing.Final = io.StringIO()
+    log_sink: typing.Final = BufferedLogSink(target_stream, capacity=100, flush_level=logging.ERROR, max_size=10)
+    log_sink.handle(logging.makeLogRecord({"msg": "short", "levelno": logging.INFO}))
+    assert not target_stream.getvalue()
+
+    log_sink.handle(logging.makeLogRecord({"msg": "longer", "levelno": logging.INFO}))
+    assert target_stream.getvalue() == "short\nlonger\n"
+
+
+def test_log_sink_flushes_by_age() -> None:
+    target_stream: typing.Final = io.StringIO()
+    log_sink: typing.Final = BufferedLogSink(target_stream, capacity=100, flush_level=logging.ERROR, max_age=0.01)
+    log_sink.handle(logging.makeLogRecord({"msg": "aged", "levelno": logging.INFO}))
+    assert not target_stream.getvalue()
+
+    for _ in range(100):
+        if target_stream.getvalue():
+            break
+        time.sleep(0.01)
+    log_sink.close()
+
+    assert target_stream.getvalue() == "aged\n"
+    assert log_sink.flush_count == 1
+
+
+def test_log_sink_starts_age_flusher_on_buffered_record(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(threading, "Thread", thread_mock := mock.Mock())
+    log_sink: typing.Final = BufferedLogSink(io.StringIO(), capacity=100, flush_level=logging.ERROR, max_age=60)
+    log_sink.handle(logging.makeLogRecord({"msg": "flushed", "levelno": logging.ERROR}))
+    assert not thread_mock.called
+
+    log_sink.handle(logging.makeLogRecord({"msg": "buffered", "levelno": logging.INFO}))
+    log_sink.handle(logging.makeLogRecord({"msg": "buffered", "levelno": logging.INFO}))
+
+    thread_mock.return_value.start.assert_called_once_with()
+
+
+def test_logging_instrument_renders_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    target_stream: typing.Final = io.TextIOWrapper(io.BytesIO(), write_through=True)
+    monkeypatch.setattr(sys, "stdout", target_stream)
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    forwarded_records: typing.Final[list[logging.LogRecord]] = []
+    monkeypatch.setattr(
+        logging.getLogger("microbootstrap.structlog"),
+        "handlers",
+        [mock.Mock(level=logging.NOTSET, handle=forwarded_records.append)],
+    )
+    logging_instrument: typing.Final = LoggingInstrument(
+        LoggingConfig(service_debug=False, logging_render_bytes=True, logging_buffer_capacity=100),
+    )
+    logging_instrument.bootstrap()
+    structlog.get_logger("bytes").debug("filtered message")
+    structlog.get_logger("bytes").info("bytes message", answer=42)
+    logging.getLogger("foreign").warning("foreign message")
+    assert not target_stream.buffer.getvalue()
+
+    structlog.get_logger("bytes").error("error message")
+    logging_instrument.teardown()
+
+    log_lines: typing.Final = [orjson.loads(one_line) for one_line in target_stream.buffer.getvalue().splitlines()]
+    assert [(one_line["event"], one_line["level"]) for one_line in log_lines] == [
+        ("bytes message", "info"),
+        ("foreign message", "warning"),
+        ("error message", "error"),
+    ]
+    assert log_lines[0]["answer"] == 42  # noqa: PLR2004
+    assert log_lines[0]["logger"] == "bytes"
+    assert [one_record.getMessage() for one_record in forwarded_records] == ["error message"]
+
+
+@pytest.mark.parametrize(
+    ("logger_name", "expected_level"),
+    [
+        ("sqlalchemy", logging.WARNING),
+        ("sqlalchemy.engine", logging.WARNING),
+        ("sqlalchemy.engine.base", logging.DEBUG),
+        ("sqlalchemy_utils", logging.INFO),
+        (None, logging.INFO),
+    ],
+)
+def test_resolve_logger_setting(logger_name: str | None, expected_level: int) -> None:
+    assert (
+        resolve_logger_setting(
+            logger_name,
+            logging.INFO,
+            {"sqlalchemy": logging.WARNING, "sqlalchemy.engine.base": logging.DEBUG},
+        )
+        == expected_level
+    )
@@ -1,6 +1,13 @@
 import importlib
+import pathlib
+import typing
+from unittest import mock
 
+import orjson
+import pydantic
+import pydantic_settings
 import pytest
+from sentry_sdk.integrations.logging import LoggingIntegration
 
 import microbootstrap.settings
 
@@ -36,3 +43,67 @@ def test_settings_service_version_aliases(monkeypatch: pytest.MonkeyPatch, alias
 def test_settings_service_version_default() -> None:
     settings = microbootstrap.settings.BaseServiceSettings()
     assert settings.service_version == "1.0.0"
+
+
+def test_settings_snapshot_skips_resolution(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    snapshot_path: typing.Final = tmp_path / "settings.json"
+    monkeypatch.setenv("SERVICE_NAME", "snapshot service")
+    microbootstrap.settings.LitestarSettings(
+        pyroscope_endpoint=pydantic.HttpUrl("http://localhost:4040")
+    ).save_snapshot(snapshot_path)
+    monkeypatch.setattr(
+        pydantic_settings.BaseSettings,
+        "_settings_build_values",
+        build_values_mock := mock.Mock(side_effect=AssertionError),
+    )
+
+    settings: typing.Final = microbootstrap.settings.LitestarSettings.from_snapshot(snapshot_path)
+
+    assert not build_values_mock.called
+    assert settings.service_name == "snapshot service"
+    assert settings.pyroscope_endpoint == pydantic.HttpUrl("http://localhost:4040")
+
+
+def test_settings_snapshot_outdated(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    snapshot_path: typing.Final = tmp_path / "settings.json"
+    monkeypatch.setenv("SERVICE_NAME", "snapshot service")
+    microbootstrap.settings.BaseServiceSettings().save_snapshot(snapshot_path)
+    monkeypatch.setenv("SERVICE_NAME", "changed service")
+
+    assert microbootstrap.settings.BaseServiceSettings.from_snapshot(snapshot_path).service_name == "changed service"
+
+
+DB_PASSWORD: typing.Final = "hunter2"  # noqa: S105
+
+
+class SecretSettings(microbootstrap.settings.BaseServiceSettings):
+    db_password: pydantic.SecretStr = pydantic.SecretStr("")
+
+
+def test_settings_snapshot_keeps_secret_values(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    snapshot_path: typing.Final = tmp_path / "settings.json"
+    monkeypatch.setenv("DB_PASSWORD", DB_PASSWORD)
+    SecretSettings().save_snapshot(snapshot_path)
+
+    settings: typing.Final = SecretSettings.from_snapshot(snapshot_path)
+
+    assert orjson.loads(snapshot_path.read_bytes())["values"]["db_password"] == DB_PASSWORD
+    assert settings.db_password.get_secret_value() == DB_PASSWORD
+
+
+def test_settings_snapshot_not_saved_for_unserializable_values(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    snapshot_path: typing.Final = tmp_path / "settings.json"
+    microbootstrap.settings.LitestarSettings().save_snapshot(snapshot_path)
+    monkeypatch.setenv("SERVICE_NAME", "resolved service")
+    microbootstrap.settings.LitestarSettings(sentry_integrations=[LoggingIntegration()]).save_snapshot(snapshot_path)
+
+    assert not snapshot_path.exists()
+    assert microbootstrap.settings.LitestarSettings.from_snapshot(snapshot_path).service_name == "resolved service"
+
+
+def test_settings_snapshot_missing(tmp_path: pathlib.Path) -> None:
+    settings: typing.Final = microbootstrap.settings.BaseServiceSettings.from_snapshot(tmp_path / "missing.json")
+    assert settings.service_name == "micro-service"